@@ -0,0 +1,191 @@
+# /shecodes-backend/benchmarks/api.py
+"""
+Load-tests the hot API endpoints in-process and records throughput and latency percentiles.
+
+The app (main:app) is driven through httpx's ASGI transport, so no server is needed,
+but it talks to the real database configured in .env. Use a local database.
+
+Usage (from the shecodes-backend directory):
+
+    python -m benchmarks.api --seed                  # generate the default dataset, then run
+    python -m benchmarks.api --seed --scale 0.1      # a smaller dataset (see benchmarks.generator)
+    python -m benchmarks.api                         # run against an already seeded dataset
+    python -m benchmarks.api --compare benchmarks/results/<earlier>.json
+    python -m benchmarks.api --cleanup               # remove the seeded rows
+
+Results are written to benchmarks/results/<timestamp>-<commit>.json.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import subprocess
+import time
+from dataclasses import asdict
+from datetime import datetime, timezone
+from pathlib import Path
+
+import httpx
+
+from benchmarks import generator
+from core.security import create_access_token
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+def percentile(ordered: list, fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted list."""
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, max(0, int(round(fraction * len(ordered))) - 1))]
+
+def build_scenarios(rng: random.Random, users: list, discussions: list) -> dict:
+    """Each scenario maps to a function returning the kwargs of the next request."""
+    tokens = [create_access_token(data={"sub": str(user_id)}) for user_id, _ in users]
+
+    def token_form():
+        _, email = rng.choice(users)
+        return {"method": "POST", "url": "/auth/token",
+                "data": {"username": email, "password": generator.PASSWORD}}
+
+    scenarios = {
+        "GET /blogs/": lambda: {"method": "GET", "url": "/blogs/"},
+        "GET /events/": lambda: {"method": "GET", "url": "/events/"},
+    }
+    if discussions:
+        scenarios["GET /comments/{discussion_id}"] = lambda: {
+            "method": "GET", "url": f"/comments/{rng.choice(discussions)}"
+        }
+    if users:
+        scenarios["POST /auth/token"] = token_form
+        scenarios["GET /users/me"] = lambda: {
+            "method": "GET", "url": "/users/me", "headers": {"Authorization": f"Bearer {rng.choice(tokens)}"}
+        }
+    return scenarios
+
+async def run_scenario(client: httpx.AsyncClient, next_request, total: int, concurrency: int, warmup: int) -> dict:
+    for _ in range(warmup):
+        await client.request(**next_request())
+
+    latencies = []
+    errors = 0
+    remaining = total
+
+    async def worker():
+        nonlocal remaining, errors
+        while remaining > 0:
+            remaining -= 1
+            started = time.perf_counter()
+            response = await client.request(**next_request())
+            latencies.append((time.perf_counter() - started) * 1000)
+            if response.status_code >= 400:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+
+    ordered = sorted(latencies)
+    return {
+        "requests": len(ordered),
+        "errors": errors,
+        "seconds": round(elapsed, 3),
+        "throughput_rps": round(len(ordered) / elapsed, 2) if elapsed else 0.0,
+        "p50_ms": round(percentile(ordered, 0.50), 2),
+        "p95_ms": round(percentile(ordered, 0.95), 2),
+        "p99_ms": round(percentile(ordered, 0.99), 2),
+        "max_ms": round(ordered[-1], 2) if ordered else 0.0,
+    }
+
+async def run(args) -> dict:
+    from main import app # Imported late so --cleanup does not need the full app
+    from core.config import settings
+
+    # Every simulated client shares one address, so login throttling would turn the auth scenario into 429s
+    settings.RATE_LIMIT_ENABLED = False
+
+    rng = random.Random(args.random_seed)
+    scenarios = build_scenarios(rng, generator.sample_users(args.sample_users), generator.sample_discussions(args.sample_discussions))
+    selected = {name: fn for name, fn in scenarios.items() if not args.only or any(part in name for part in args.only)}
+
+    results = {}
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark") as client:
+        for name, next_request in selected.items():
+            total = args.token_requests if name == "POST /auth/token" else args.requests
+            results[name] = await run_scenario(client, next_request, total, args.concurrency, args.warmup)
+            print(f"{name:<32}{results[name]['throughput_rps']:>10.1f}{results[name]['p50_ms']:>10.2f}"
+                  f"{results[name]['p95_ms']:>10.2f}{results[name]['p99_ms']:>10.2f}{results[name]['errors']:>8}")
+    return results
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unknown"
+
+def print_comparison(current: dict, baseline_path: Path) -> None:
+    baseline = json.loads(baseline_path.read_text())
+    print(f"\nCompared with {baseline_path.name} (commit {baseline.get('commit')}):")
+    print(f"{'scenario':<32}{'rps %':>10}{'p50 %':>10}{'p95 %':>10}{'p99 %':>10}")
+    for name, result in current["scenarios"].items():
+        before = baseline["scenarios"].get(name)
+        if not before:
+            continue
+        def change(key):
+            return (result[key] - before[key]) / before[key] * 100 if before[key] else 0.0
+        print(f"{name:<32}{change('throughput_rps'):>+10.1f}{change('p50_ms'):>+10.1f}"
+              f"{change('p95_ms'):>+10.1f}{change('p99_ms'):>+10.1f}")
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", action="store_true", help="Generate the benchmark dataset before running")
+    generator.add_volume_arguments(parser)
+    parser.add_argument("--requests", type=int, default=1000, help="Requests per scenario")
+    parser.add_argument("--token-requests", type=int, default=200, help="Requests for /auth/token (bcrypt-bound)")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--warmup", type=int, default=20, help="Unmeasured requests per scenario")
+    parser.add_argument("--sample-users", type=int, default=1000, help="Seeded users to log in as")
+    parser.add_argument("--sample-discussions", type=int, default=200, help="Seeded discussions to read")
+    parser.add_argument("--only", nargs="*", help="Run only scenarios whose name contains one of these")
+    parser.add_argument("--output", type=Path, help="Result file (default benchmarks/results/<timestamp>-<commit>.json)")
+    parser.add_argument("--compare", type=Path, help="Earlier result file to compare against")
+    parser.add_argument("--cleanup", action="store_true", help="Delete the seeded rows and exit")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        generator.cleanup()
+        print("Removed seeded benchmark data.")
+        return
+
+    if args.seed:
+        volumes = generator.volumes_from_args(args)
+        started = time.perf_counter()
+        generator.generate(volumes, seed=args.random_seed)
+        print(f"Seeded {asdict(volumes)} in {time.perf_counter() - started:.1f}s")
+
+    rows = generator.describe()
+    print(f"Dataset: {rows}")
+    print(f"{'scenario':<32}{'rps':>10}{'p50 ms':>10}{'p95 ms':>10}{'p99 ms':>10}{'errors':>8}")
+    scenarios = asyncio.run(run(args))
+
+    commit = git_commit()
+    result = {
+        "commit": commit,
+        "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "dataset": rows,
+        "concurrency": args.concurrency,
+        "scenarios": scenarios,
+    }
+    output = args.output or RESULTS_DIR / f"{datetime.now(timezone.utc):%Y%m%dT%H%M%S}-{commit}.json"
+    output.parent.mkdir(parents=True, exist_ok=True)
+    output.write_text(json.dumps(result, indent=2))
+    print(f"Results written to {output}")
+
+    if args.compare:
+        print_comparison(result, args.compare)
+
+if __name__ == "__main__":
+    main()
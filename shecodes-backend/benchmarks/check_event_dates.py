@@ -0,0 +1,90 @@
+# /shecodes-backend/benchmarks/check_event_dates.py
+"""
+Checks that events can be created and edited with the timezone-aware dates the admin UI
+sends (Date.toISOString(), e.g. "2030-05-01T09:00:00.000Z"), and that the stored status
+follows them. Naive dates are checked as well, as sent by older clients.
+
+The app is driven in-process and talks to the database configured in .env; the events
+it creates are deleted again. It needs one verified user to authenticate as.
+
+Usage (from the shecodes-backend directory):
+
+    python -m benchmarks.check_event_dates
+"""
+
+import sys
+from datetime import datetime, timedelta, timezone
+
+from fastapi.testclient import TestClient
+
+from main import app
+from core.security import create_access_token
+from database import SessionLocal
+from models import event as event_model, user as user_model
+
+def iso(value: datetime, aware: bool) -> str:
+    if aware:
+        return value.astimezone(timezone.utc).isoformat(timespec="milliseconds").replace("+00:00", "Z")
+    return value.replace(tzinfo=None).isoformat()
+
+def event_payload(start: datetime, end: datetime, aware: bool) -> dict:
+    return {
+        "title": "Timezone check", "description": "Created by benchmarks.check_event_dates",
+        "event_type": "Workshop", "location": "Online", "status": "upcoming", "created_at": None,
+        "start_date": iso(start, aware), "end_date": iso(end, aware),
+    }
+
+def main() -> None:
+    db = SessionLocal()
+    try:
+        user = db.query(user_model.User).filter(user_model.User.is_verified == True).first()
+        if user is None:
+            sys.exit("No verified user found to authenticate as; seed the database first.")
+        headers = {"Authorization": f"Bearer {create_access_token(data={'sub': str(user.id)})}"}
+    finally:
+        db.close()
+
+    now = datetime.now(timezone.utc)
+    cases = [
+        # (name, start, end, expected status)
+        ("upcoming", now + timedelta(days=30), now + timedelta(days=31), "upcoming"),
+        ("ongoing", now - timedelta(hours=1), now + timedelta(hours=1), "ongoing"),
+        ("past", now - timedelta(days=31), now - timedelta(days=30), "past"),
+    ]
+    failures = 0
+    # Server errors are reported as failed checks instead of being raised here
+    with TestClient(app, raise_server_exceptions=False) as client:
+        for aware in (True, False):
+            for name, start, end, expected in cases:
+                created = client.post("/events/", json=event_payload(start, end, aware), headers=headers)
+                problems = []
+                if created.status_code != 201:
+                    problems.append(f"create returned {created.status_code}: {created.text[:200]}")
+                else:
+                    event = created.json()
+                    if event["status"] != expected:
+                        problems.append(f"created as {event['status']}")
+                    # Move it one day past its end, as edit-event sends it back
+                    edit = {**event_payload(end + timedelta(days=1), end + timedelta(days=2), aware),
+                            "created_at": event["created_at"]}
+                    edited = client.put(f"/events/{event['id']}", json=edit, headers=headers)
+                    if edited.status_code != 200:
+                        problems.append(f"edit returned {edited.status_code}: {edited.text[:200]}")
+                    else:
+                        db = SessionLocal()
+                        try:
+                            stored = db.get(event_model.Event, event["id"]).status
+                        finally:
+                            db.close()
+                        edited_expected = "upcoming" if name != "past" else "past"
+                        if stored != edited_expected:
+                            problems.append(f"stored as {stored} after the edit, expected {edited_expected}")
+                    client.delete(f"/events/{event['id']}", headers=headers)
+                failures += bool(problems)
+                print(f"{'FAIL' if problems else 'ok  '} {'aware' if aware else 'naive'} {name}")
+                for problem in problems:
+                    print(f"      {problem}")
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
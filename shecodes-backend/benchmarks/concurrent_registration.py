@@ -0,0 +1,97 @@
+# /shecodes-backend/benchmarks/concurrent_registration.py
+"""
+Checks that concurrent registrations of the same member for the same event create exactly
+one participant row: one request gets 201, all others 409.
+
+The requests go through httpx's ASGI transport (main:app in-process, sync route handlers in
+the threadpool) and race on the real database configured in .env. At most --concurrency are
+in flight at once: a request holds a pooled connection from its first dependency until its
+response is sent, so more than the pool allows (5 + 10 overflow) only wait for a connection.
+The (event, member) pair is one that has no registration yet; its row is deleted afterwards.
+
+Usage (from the shecodes-backend directory):
+
+    python -m benchmarks.generator --scale 0.05      # if nothing is seeded yet
+    python -m benchmarks.concurrent_registration
+    python -m benchmarks.concurrent_registration --requests 1000 --concurrency 10
+"""
+
+import argparse
+import asyncio
+import sys
+from collections import Counter
+
+import httpx
+from sqlalchemy import exists, select
+
+from main import app
+from core.config import settings
+from core.security import create_access_token
+from database import SessionLocal
+from models import event as event_model, participant as participant_model, user as user_model
+
+def unregistered_pair(db):
+    """An event and a verified member who is not registered for it, or None."""
+    Participant = participant_model.Participant
+    event_id = db.scalar(select(event_model.Event.id).order_by(event_model.Event.id.desc()).limit(1))
+    if event_id is None:
+        return None
+    member_id = db.scalar(
+        select(user_model.User.id)
+        .where(
+            user_model.User.is_verified == True,
+            ~exists().where(Participant.event_id == event_id, Participant.member_id == user_model.User.id),
+        )
+        .limit(1)
+    )
+    return (event_id, member_id) if member_id else None
+
+async def register_concurrently(event_id: int, member_id: str, requests: int, concurrency: int) -> Counter:
+    # Every simulated client shares one address
+    settings.RATE_LIMIT_ENABLED = False
+    headers = {"Authorization": f"Bearer {create_access_token(data={'sub': member_id})}"}
+    body = {"event_id": event_id, "member_id": member_id}
+
+    in_flight = asyncio.Semaphore(concurrency)
+
+    async def register(client):
+        async with in_flight:
+            return await client.post("/participants/", json=body, headers=headers)
+
+    # Server errors are counted as status codes instead of being raised here
+    transport = httpx.ASGITransport(app=app, raise_app_exceptions=False)
+    async with httpx.AsyncClient(transport=transport, base_url="http://benchmark", timeout=120) as client:
+        responses = await asyncio.gather(*(register(client) for _ in range(requests)))
+    return Counter(response.status_code for response in responses)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500, help="Registrations to send (default 500)")
+    parser.add_argument("--concurrency", type=int, default=15, help="Requests in flight at once (default 15)")
+    args = parser.parse_args()
+
+    db = SessionLocal()
+    try:
+        pair = unregistered_pair(db)
+        if pair is None:
+            sys.exit("No event with an unregistered verified member found; run `python -m benchmarks.generator` first.")
+        event_id, member_id = pair
+
+        statuses = asyncio.run(register_concurrently(event_id, member_id, args.requests, args.concurrency))
+        Participant = participant_model.Participant
+        rows = db.query(Participant).filter(Participant.event_id == event_id, Participant.member_id == member_id)
+        num_rows = rows.count()
+        rows.delete(synchronize_session=False)
+        db.commit()
+    finally:
+        db.close()
+
+    print(f"event {event_id}, member {member_id}: {args.requests} requests")
+    print("status codes: " + ", ".join(f"{code} x{count}" for code, count in sorted(statuses.items())))
+    print(f"participant rows: {num_rows}")
+    ok = num_rows == 1 and statuses[201] == 1 and statuses[409] == args.requests - 1
+    print("ok" if ok else "FAIL: expected exactly one row, one 201 and only 409s otherwise")
+    sys.exit(0 if ok else 1)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,136 @@
+# /shecodes-backend/benchmarks/event_search.py
+"""
+Benchmarks crud.search_events against a seeded dataset of events.
+
+Usage (from the shecodes-backend directory, with .env pointing at a local database):
+
+    python -m benchmarks.event_search --seed 100000
+    python -m benchmarks.event_search            # reuse the already seeded rows
+    python -m benchmarks.event_search --cleanup  # remove the seeded rows (and other generated data)
+
+Seeded events are titled "bench-event-<n>" so they can be removed again.
+"""
+
+import argparse
+import random
+import statistics
+import time
+from datetime import datetime, timedelta
+
+from sqlalchemy import insert, text
+
+import crud # Importing crud registers every model on Base.metadata
+import migrations
+from database import SessionLocal, engine
+from models import event as event_model
+from schemas.event import EventTypeEnum, EventStatusEnum
+from benchmarks import generator
+from benchmarks.explain_comments import capture_selects, explain as explain_statement
+
+TITLE_PREFIX = generator.MARKER + "event-"
+TAGS = ["python", "ai", "web", "career", "design", "data", "cloud", "security", "mobile", "community"]
+LOCATIONS = ["Jakarta", "Bandung", "Surabaya", "Online", "Yogyakarta", "Bali"]
+BATCH_SIZE = 5000
+
+def seed_events(count: int, rng: random.Random) -> None:
+    Event = event_model.Event
+    base = datetime(2022, 1, 1)
+    with engine.begin() as conn:
+        for offset in range(0, count, BATCH_SIZE):
+            rows = []
+            for n in range(offset, min(offset + BATCH_SIZE, count)):
+                start = base + timedelta(hours=rng.randint(0, 5 * 365 * 24))
+                rows.append({
+                    "title": f"{TITLE_PREFIX}{n}",
+                    "description": "Seeded benchmark event",
+                    "event_type": rng.choice(list(EventTypeEnum)).value,
+                    "start_date": start,
+                    "end_date": start + timedelta(hours=rng.randint(1, 72)),
+                    "location": rng.choice(LOCATIONS),
+                    "created_at": base,
+                    "status": "upcoming",
+                    "tags": rng.sample(TAGS, rng.randint(0, 3)),
+                })
+            conn.execute(insert(Event).values(rows))
+        conn.execute(text("ANALYZE events"))
+
+def cleanup() -> None:
+    # Seeded titles carry the generator's marker, so its cleanup also removes any child rows
+    generator.cleanup()
+
+def scenarios():
+    return {
+        "no filters": {},
+        "event_type": {"event_type": EventTypeEnum.Workshop},
+        "date range (30 days)": {"start_from": datetime(2024, 3, 1), "start_to": datetime(2024, 3, 31)},
+        "tag": {"tags": ["ai"]},
+        "type + tag + range": {
+            "event_type": EventTypeEnum.Seminar, "tags": ["data"],
+            "start_from": datetime(2023, 1, 1), "start_to": datetime(2024, 1, 1),
+        },
+        "upcoming": {"status": EventStatusEnum.upcoming},
+        "location": {"location": "bandung"},
+    }
+
+def time_scenario(filters: dict, pages: int, limit: int) -> list:
+    timings = []
+    db = SessionLocal()
+    try:
+        cursor = None
+        for _ in range(pages):
+            started = time.perf_counter()
+            events = crud.search_events(db, limit=limit, cursor=cursor, **filters)
+            timings.append((time.perf_counter() - started) * 1000)
+            if not events:
+                break
+            cursor = (events[-1].start_date, events[-1].id)
+            db.expunge_all()
+    finally:
+        db.close()
+    return timings
+
+def explain(filters: dict, limit: int) -> str:
+    # Explains the SQL and parameters as sent; literal_binds cannot render the JSONB tag filter
+    db = SessionLocal()
+    try:
+        query = crud.event_search_query(db, **filters).limit(limit)
+        (statement, parameters), *_ = capture_selects(query.all)
+    finally:
+        db.close()
+    return explain_statement(statement, parameters)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--seed", type=int, default=0, help="Number of events to insert before benchmarking")
+    parser.add_argument("--random-seed", type=int, default=42)
+    parser.add_argument("--pages", type=int, default=20, help="Pages to walk per scenario")
+    parser.add_argument("--limit", type=int, default=20, help="Page size")
+    parser.add_argument("--explain", action="store_true", help="Print the query plan for each indexed scenario")
+    parser.add_argument("--cleanup", action="store_true", help="Delete seeded events and exit")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        cleanup()
+        print("Removed seeded benchmark events.")
+        return
+
+    migrations.upgrade(engine)
+    if args.seed:
+        started = time.perf_counter()
+        seed_events(args.seed, random.Random(args.random_seed))
+        print(f"Seeded {args.seed} events in {time.perf_counter() - started:.1f}s")
+
+    print(f"{'scenario':<24}{'pages':>6}{'p50 ms':>10}{'p95 ms':>10}{'max ms':>10}")
+    for name, filters in scenarios().items():
+        timings = time_scenario(filters, pages=args.pages, limit=args.limit)
+        if not timings:
+            continue
+        ordered = sorted(timings)
+        p95 = ordered[max(0, int(len(ordered) * 0.95) - 1)]
+        print(f"{name:<24}{len(timings):>6}{statistics.median(timings):>10.2f}{p95:>10.2f}{ordered[-1]:>10.2f}")
+        if args.explain:
+            print(explain(filters, args.limit))
+            print()
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,105 @@
+# /shecodes-backend/benchmarks/explain_comments.py
+"""
+Checks that the hot comment queries use their indexes, by running EXPLAIN on the exact
+SQL that the crud functions send.
+
+Each check calls a crud function, captures its SELECT statements with their parameters,
+and explains them. The check fails if the plan does not mention the expected index.
+Run it against a seeded dataset; on nearly empty tables a sequential scan is the right plan.
+
+Usage (from the shecodes-backend directory):
+
+    python -m benchmarks.generator --scale 0.1     # if nothing is seeded yet
+    python -m benchmarks.explain_comments
+    python -m benchmarks.explain_comments --verbose   # print every plan
+"""
+
+import argparse
+import sys
+from typing import Callable, List, Tuple
+
+from sqlalchemy import event, select, text
+
+import crud
+from benchmarks import generator
+from database import SessionLocal, engine
+from models import comment as comment_model
+
+def capture_selects(fn: Callable[[], object]) -> List[Tuple[str, object]]:
+    """Runs `fn` and returns the (statement, parameters) of every SELECT it executed."""
+    statements = []
+
+    def before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", before_cursor_execute)
+    try:
+        fn()
+    finally:
+        event.remove(engine, "before_cursor_execute", before_cursor_execute)
+    return statements
+
+def explain(statement: str, parameters) -> str:
+    connection = engine.raw_connection()
+    try:
+        with connection.cursor() as cursor:
+            cursor.execute("EXPLAIN " + statement, parameters)
+            return "\n".join(row[0] for row in cursor.fetchall())
+    finally:
+        connection.close()
+
+def build_checks(db) -> list:
+    """(name, crud call, index that its SELECT must use)."""
+    discussion_ids = generator.sample_discussions(1000) # Busiest first
+    discussion_id = discussion_ids[0]
+    # A listing page's worth of typical discussions; counting the busiest ones of a small dataset is a table scan
+    card_discussion_ids = discussion_ids[-10:]
+    Comment = comment_model.Comment
+    thread_id = db.scalar(
+        select(Comment.parent_id).where(Comment.discussion_id == discussion_id, Comment.parent_id.isnot(None)).limit(1)
+    )
+    comment = db.get(Comment, thread_id)
+
+    def load_likes():
+        db.expire(comment, ["comment_likes"])
+        return comment.comment_likes
+
+    return [
+        ("comments of a discussion", lambda: crud.get_comments_by_discussion(db, discussion_id),
+         "ix_comments_discussion_id_date"),
+        ("comments of a thread", lambda: crud.get_comments_by_discussion(db, str(thread_id)),
+         "ix_comments_parent_id_date"),
+        ("comment counts", lambda: crud.get_comment_counts(db, card_discussion_ids),
+         "ix_comments_discussion_id_date"),
+        ("likes of a comment", load_likes, "ix_comment_likes_comment_id"),
+    ]
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--verbose", action="store_true", help="Print every plan, not only failures")
+    args = parser.parse_args()
+
+    with engine.begin() as conn:
+        conn.execute(text("ANALYZE comments"))
+        conn.execute(text("ANALYZE comment_likes"))
+
+    db = SessionLocal()
+    failures = 0
+    try:
+        if not generator.sample_discussions(1):
+            sys.exit("No seeded comments found; run `python -m benchmarks.generator` first.")
+        for name, call, expected_index in build_checks(db):
+            statements = capture_selects(call)
+            plan = explain(*statements[0])
+            ok = expected_index in plan
+            failures += not ok
+            print(f"{'ok  ' if ok else 'FAIL'} {name}: expected {expected_index}")
+            if args.verbose or not ok:
+                print("      " + plan.replace("\n", "\n      "))
+    finally:
+        db.close()
+    sys.exit(1 if failures else 0)
+
+if __name__ == "__main__":
+    main()
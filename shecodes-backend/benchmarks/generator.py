@@ -0,0 +1,466 @@
+# /shecodes-backend/benchmarks/generator.py
+"""
+Fills every table under models/ with synthetic, referentially consistent data for load testing.
+
+Rows are streamed into Postgres with COPY, so millions of rows load in minutes.
+Output is deterministic: each table draws from its own RNG seeded by (seed, table),
+so the same seed and volumes always produce the same rows, and changing one
+volume does not reshuffle the other tables.
+
+Every generated row carries the "bench-" marker (in an email, title, slug, name or
+discussion id) so cleanup() can remove it from a database that also holds real data.
+
+Usage (from the shecodes-backend directory, with .env pointing at a local database):
+
+    python -m benchmarks.generator                     # default volumes (50k users, 100k comments, ...)
+    python -m benchmarks.generator --scale 20          # ~1M users, 2M comments, ...
+    python -m benchmarks.generator --comments 500000 --likes 2000000
+    python -m benchmarks.generator --cleanup           # remove all generated rows
+"""
+
+import argparse
+import csv
+import io
+import json
+import random
+import time
+import uuid
+from dataclasses import dataclass, asdict, fields
+from datetime import datetime, timedelta
+from typing import Callable, Iterable, Iterator, List, Sequence
+
+from sqlalchemy import delete, func, select, text
+
+import crud # Imported before core.security, which imports crud itself
+import migrations
+from database import engine
+from core.security import pwd_context
+from models import (
+    alumni as alumni_model, blog as blog_model, champion as champion_model, comment as comment_model,
+    contact as contact_model, documentation as documentation_model, event as event_model, faq as faq_model,
+    mentor as mentor_model, participant as participant_model, partner as partner_model,
+    portfolio as portfolio_model, user as user_model,
+)
+
+MARKER = "bench-"
+PASSWORD = "bench-password"
+USER_EMAIL_TEMPLATE = MARKER + "user-{}@example.com"
+DISCUSSION_TEMPLATE = MARKER + "discussion-{}"
+COPY_CHUNK_ROWS = 50000
+BCRYPT_SALT_CHARS = "./ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789"
+BASE_DATE = datetime(2022, 1, 1)
+LOREM = (
+    "Lorem ipsum dolor sit amet, consectetur adipiscing elit, sed do eiusmod tempor incididunt "
+    "ut labore et dolore magna aliqua. Ut enim ad minim veniam, quis nostrud exercitation."
+)
+TAGS = ["python", "ai", "web", "career", "design", "data", "cloud", "security", "mobile", "community"]
+LOCATIONS = ["Jakarta", "Bandung", "Surabaya", "Online", "Yogyakarta", "Bali"]
+
+@dataclass
+class Volumes:
+    """Row counts per table (association/child tables are per parent)."""
+    users: int = 50000
+    portfolio_projects: int = 25000
+    mentors: int = 200
+    events: int = 5000
+    mentors_per_event: int = 2
+    skills_per_event: int = 3
+    benefits_per_event: int = 3
+    sessions_per_event: int = 3
+    participants: int = 200000
+    discussions: int = 1000
+    comments: int = 100000
+    reply_ratio: float = 0.3
+    max_reply_depth: int = 3
+    likes: int = 100000
+    blogs: int = 500
+    alumni: int = 1000
+    champions: int = 50
+    faqs: int = 50
+    contacts: int = 10
+    partners: int = 100
+    documentations: int = 500
+
+    def scaled(self, factor: float) -> "Volumes":
+        per_parent = {"mentors_per_event", "skills_per_event", "benefits_per_event", "sessions_per_event",
+                      "reply_ratio", "max_reply_depth"}
+        return Volumes(**{
+            field.name: getattr(self, field.name) if field.name in per_parent else int(getattr(self, field.name) * factor)
+            for field in fields(self)
+        })
+
+def _enum_values(column) -> List[str]:
+    return list(column.type.enums)
+
+def _skewed_counts(rng: random.Random, total: int, buckets: int) -> List[int]:
+    """Spreads `total` over `buckets` with a Zipf-like long tail: a few hot items, many cold ones."""
+    counts = [0] * buckets
+    if buckets == 0:
+        return counts
+    cumulative, running = [], 0.0
+    for rank in range(buckets):
+        running += 1 / (rank + 1) ** 0.8
+        cumulative.append(running)
+    for bucket in rng.choices(range(buckets), cum_weights=cumulative, k=total):
+        counts[bucket] += 1
+    rng.shuffle(counts)
+    return counts
+
+def _copy(conn, table, columns: Sequence[str], rows: Iterable[tuple]) -> int:
+    """Streams rows into `table` with COPY ... FORMAT csv, in chunks to bound memory."""
+    column_list = ", ".join(f'"{column}"' for column in columns)
+    sql = f'COPY "{table.name}" ({column_list}) FROM STDIN WITH (FORMAT csv)'
+    cursor = conn.connection.cursor()
+    total = 0
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+
+    def flush():
+        buffer.seek(0)
+        cursor.copy_expert(sql, buffer)
+        buffer.seek(0)
+        buffer.truncate()
+
+    pending = 0
+    for row in rows:
+        writer.writerow(row)
+        pending += 1
+        if pending == COPY_CHUNK_ROWS:
+            flush()
+            total += pending
+            pending = 0
+    if pending:
+        flush()
+        total += pending
+    cursor.close()
+    return total
+
+def _next_id(conn, model) -> int:
+    return conn.execute(select(func.coalesce(func.max(model.id), 0))).scalar_one() + 1
+
+def _reset_sequence(conn, model) -> None:
+    table = model.__table__.name
+    conn.execute(text(
+        f"SELECT setval(pg_get_serial_sequence('{table}', 'id'), (SELECT coalesce(max(id), 1) FROM \"{table}\"))"
+    ))
+
+class Generator:
+    """Generates one table at a time; later tables reference ids produced by earlier ones."""
+
+    def __init__(self, conn, volumes: Volumes, seed: int):
+        self.conn = conn
+        self.volumes = volumes
+        self.seed = seed
+        self.user_ids: List[str] = []
+        self.user_names: List[str] = []
+        self.mentor_ids: List[int] = []
+        self.event_rows: List[tuple] = [] # (id, start_date)
+        self.comment_ids = range(0)
+
+    def rng(self, table: str) -> random.Random:
+        return random.Random(f"{self.seed}:{table}")
+
+    def load(self, model, columns: Sequence[str], rows: Iterable[tuple], log: Callable[[str], None]) -> None:
+        """Loads rows into the model's table (or a plain Table, for association tables)."""
+        table = getattr(model, "__table__", model)
+        started = time.perf_counter()
+        count = _copy(self.conn, table, columns, rows)
+        log(f"  {table.name:<26}{count:>10} rows  {time.perf_counter() - started:6.1f}s")
+
+    # --- Users and their own data ---
+
+    def users(self) -> Iterator[tuple]:
+        rng = self.rng("users")
+        # bcrypt is deliberately slow, so every generated user shares one hash (with a seeded salt)
+        salt = "".join(rng.choice(BCRYPT_SALT_CHARS) for _ in range(21)) + rng.choice(".Oeu")
+        password_hash = pwd_context.handler("bcrypt").using(salt=salt).hash(PASSWORD)
+        roles = _enum_values(user_model.User.__table__.c.role)
+        weights = [{"member": 85, "alumni": 10, "mentor": 4, "admin": 1}.get(role, 1) for role in roles]
+        for n in range(self.volumes.users):
+            user_id = str(uuid.UUID(int=rng.getrandbits(128), version=4))
+            name = f"Bench User {n}"
+            created = BASE_DATE + timedelta(minutes=n)
+            self.user_ids.append(user_id)
+            self.user_names.append(name)
+            yield (user_id, USER_EMAIL_TEMPLATE.format(n), password_hash, True, created, created, name,
+                   rng.choices(roles, weights)[0], LOREM[:rng.randint(40, len(LOREM))], rng.choice(["Student", "Engineer", "Designer", "Analyst"]))
+
+    def portfolio_projects(self) -> Iterator[tuple]:
+        rng = self.rng("portfolio_projects")
+        next_id = _next_id(self.conn, portfolio_model.PortfolioProject)
+        for n in range(self.volumes.portfolio_projects if self.user_ids else 0):
+            yield (next_id + n, rng.choice(self.user_ids), f"{MARKER}project-{n}", LOREM,
+                   f"https://example.com/{MARKER}project-{n}.png", f"https://example.com/projects/{n}")
+
+    # --- Events and their children ---
+
+    def mentors(self) -> Iterator[tuple]:
+        rng = self.rng("mentors")
+        next_id = _next_id(self.conn, mentor_model.Mentor)
+        statuses = _enum_values(mentor_model.Mentor.__table__.c.status)
+        for n in range(self.volumes.mentors):
+            self.mentor_ids.append(next_id + n)
+            yield (next_id + n, f"{MARKER}mentor-{n}", rng.choice(["Engineer", "Data Scientist", "Product Manager"]),
+                   LOREM, f"https://example.com/{MARKER}mentor-{n}.png", LOREM, rng.choice(statuses))
+
+    def events(self) -> Iterator[tuple]:
+        rng = self.rng("events")
+        next_id = _next_id(self.conn, event_model.Event)
+        event_types = _enum_values(event_model.Event.__table__.c.event_type)
+        for n in range(self.volumes.events):
+            start = BASE_DATE + timedelta(hours=rng.randint(0, 5 * 365 * 24))
+            end = start + timedelta(hours=rng.randint(1, 72))
+            self.event_rows.append((next_id + n, start))
+            yield (next_id + n, f"{MARKER}event-{n}", LOREM, rng.choice(event_types), start, end,
+                   rng.choice(LOCATIONS), BASE_DATE, event_model.status_for(start, end),
+                   json.dumps(rng.sample(TAGS, rng.randint(0, 3))), LOREM * 3)
+
+    def event_mentors(self) -> Iterator[tuple]:
+        rng = self.rng("event_mentor_association")
+        per_event = min(self.volumes.mentors_per_event, len(self.mentor_ids))
+        for event_id, _ in self.event_rows:
+            for mentor_id in rng.sample(self.mentor_ids, rng.randint(0, per_event)):
+                yield (event_id, mentor_id)
+
+    def event_children(self, model, per_event: int, make: Callable) -> Iterator[tuple]:
+        rng = self.rng(model.__tablename__)
+        next_id = _next_id(self.conn, model)
+        for event_id, start in self.event_rows:
+            for index in range(rng.randint(0, per_event)):
+                yield (next_id, event_id) + make(rng, index, start)
+                next_id += 1
+
+    def participants(self) -> Iterator[tuple]:
+        rng = self.rng("participants")
+        next_id = _next_id(self.conn, participant_model.Participant)
+        statuses = _enum_values(participant_model.Participant.__table__.c.status)
+        counts = _skewed_counts(rng, self.volumes.participants, len(self.event_rows))
+        for (event_id, start), count in zip(self.event_rows, counts):
+            # Sampling distinct users keeps (event_id, member_id) unique
+            for member_id in rng.sample(self.user_ids, min(count, len(self.user_ids))):
+                yield (next_id, event_id, member_id, start - timedelta(days=rng.randint(1, 60)), rng.choice(statuses))
+                next_id += 1
+
+    # --- Discussions ---
+
+    def comments(self) -> Iterator[tuple]:
+        rng = self.rng("comments")
+        first_id = next_id = _next_id(self.conn, comment_model.Comment)
+        counts = _skewed_counts(rng, self.volumes.comments, self.volumes.discussions)
+        for discussion, count in enumerate(counts):
+            discussion_id = DISCUSSION_TEMPLATE.format(discussion)
+            date = BASE_DATE + timedelta(minutes=rng.randint(0, 365 * 24 * 60))
+            thread = [] # (id, depth) of comments so far, so replies nest under earlier comments
+            for _ in range(count):
+                parent_id, depth = None, 0
+                if thread and rng.random() < self.volumes.reply_ratio:
+                    parent_id, parent_depth = rng.choice(thread)
+                    if parent_depth >= self.volumes.max_reply_depth:
+                        parent_id, depth = None, 0
+                    else:
+                        depth = parent_depth + 1
+                date += timedelta(minutes=rng.randint(1, 600))
+                author = rng.choice(self.user_names) if self.user_names else "Bench User"
+                thread.append((next_id, depth))
+                yield (next_id, discussion_id, parent_id, author, LOREM[:rng.randint(20, len(LOREM))], date)
+                next_id += 1
+        self.comment_ids = range(first_id, next_id)
+
+    def comment_likes(self) -> Iterator[tuple]:
+        rng = self.rng("comment_likes")
+        counts = _skewed_counts(rng, self.volumes.likes, len(self.comment_ids))
+        for comment_id, count in zip(self.comment_ids, counts):
+            for user_id in rng.sample(self.user_ids, min(count, len(self.user_ids))):
+                yield (user_id, comment_id)
+
+    # --- Standalone content ---
+
+    def standalone(self, model, count: int, make: Callable) -> Iterator[tuple]:
+        rng = self.rng(model.__tablename__)
+        next_id = _next_id(self.conn, model)
+        for n in range(count):
+            yield (next_id + n,) + make(rng, n)
+
+def generate(volumes: Volumes, seed: int = 42, log: Callable[[str], None] = print) -> None:
+    """Generates and loads all tables in one transaction."""
+    with engine.begin() as conn:
+        gen = Generator(conn, volumes, seed)
+        gen.load(user_model.User, ["id", "email", "password", "is_verified", "created_at", "updated_at", "name",
+                                   "role", "about_me", "occupation"], gen.users(), log)
+        gen.load(portfolio_model.PortfolioProject, ["id", "user_id", "name", "description", "image_url", "project_url"],
+                 gen.portfolio_projects(), log)
+        gen.load(mentor_model.Mentor, ["id", "name", "occupation", "description", "image_src", "story", "status"],
+                 gen.mentors(), log)
+        gen.load(event_model.Event, ["id", "title", "description", "event_type", "start_date", "end_date", "location",
+                               "created_at", "status", "tags", "long_description"], gen.events(), log)
+        gen.load(event_model.event_mentor_association, ["event_id", "mentor_id"], gen.event_mentors(), log)
+        gen.load(event_model.Skill, ["id", "event_id", "title", "description"], gen.event_children(
+            event_model.Skill, volumes.skills_per_event, lambda rng, i, start: (rng.choice(TAGS).title(), LOREM)), log)
+        gen.load(event_model.Benefit, ["id", "event_id", "title", "text"], gen.event_children(
+            event_model.Benefit, volumes.benefits_per_event, lambda rng, i, start: (f"Benefit {i + 1}", LOREM)), log)
+        gen.load(event_model.Session, ["id", "event_id", "topic", "description", "start", "end"], gen.event_children(
+            event_model.Session, volumes.sessions_per_event,
+            lambda rng, i, start: (f"Session {i + 1}", LOREM, start + timedelta(hours=i), start + timedelta(hours=i + 1))), log)
+        gen.load(participant_model.Participant, ["id", "event_id", "member_id", "registration_date", "status"],
+                 gen.participants(), log)
+        gen.load(comment_model.Comment, ["id", "discussion_id", "parent_id", "author", "text", "date"], gen.comments(), log)
+        gen.load(comment_model.CommentLike, ["user_id", "comment_id"], gen.comment_likes(), log)
+
+        categories = _enum_values(blog_model.BlogArticle.__table__.c.category)
+        gen.load(blog_model.BlogArticle, ["id", "slug", "title", "excerpt", "category", "published_at", "author_name",
+                                          "author_avatar_url", "image_src", "featured_image_url", "sections",
+                                          "view_count", "like_count"], gen.standalone(
+            blog_model.BlogArticle, volumes.blogs, lambda rng, n: (
+                f"{MARKER}blog-{n}", f"Benchmark article {n}", LOREM[:120], rng.choice(categories),
+                BASE_DATE + timedelta(hours=rng.randint(0, 3 * 365 * 24)), "Bench Author",
+                "https://example.com/avatar.png", "https://example.com/image.png", "https://example.com/image.png",
+                json.dumps([LOREM * 4 for _ in range(rng.randint(2, 6))]), rng.randint(0, 5000), rng.randint(0, 500),
+            )), log)
+        gen.load(alumni_model.Alumni, ["id", "name", "batch", "image_src", "story", "university"], gen.standalone(
+            alumni_model.Alumni, volumes.alumni, lambda rng, n: (
+                f"{MARKER}alumni-{n}", rng.randint(1, 10), "https://example.com/alumni.png", LOREM, "Universitas Bench",
+            )), log)
+        gen.load(champion_model.Champion, ["id", "name", "position", "image_src", "description"], gen.standalone(
+            champion_model.Champion, volumes.champions, lambda rng, n: (
+                f"{MARKER}champion-{n}", "Campus Champion", "https://example.com/champion.png", LOREM,
+            )), log)
+        faq_colors = _enum_values(faq_model.FAQItem.__table__.c.color_variant)
+        gen.load(faq_model.FAQItem, ["id", "question", "answer", "color_variant"], gen.standalone(
+            faq_model.FAQItem, volumes.faqs, lambda rng, n: (f"{MARKER}question-{n}?", LOREM, rng.choice(faq_colors))), log)
+        contact_colors = _enum_values(contact_model.ContactCardInfo.__table__.c.color_variant)
+        gen.load(contact_model.ContactCardInfo, ["id", "platform_name", "logo_src", "description", "link_url",
+                                                 "color_variant"], gen.standalone(
+            contact_model.ContactCardInfo, volumes.contacts, lambda rng, n: (
+                f"{MARKER}platform-{n}", "https://example.com/logo.png", LOREM[:80], "https://example.com",
+                rng.choice(contact_colors),
+            )), log)
+        gen.load(partner_model.Partner, ["id", "name", "logo_src"], gen.standalone(
+            partner_model.Partner, volumes.partners, lambda rng, n: (f"{MARKER}partner-{n}", "https://example.com/logo.png")), log)
+        gen.load(documentation_model.Documentation, ["id", "image_src"], gen.standalone(
+            documentation_model.Documentation, volumes.documentations,
+            lambda rng, n: (f"https://example.com/{MARKER}documentation-{n}.png",)), log)
+
+        for model in (portfolio_model.PortfolioProject, mentor_model.Mentor, event_model.Event, event_model.Skill, event_model.Benefit,
+                      event_model.Session, participant_model.Participant, comment_model.Comment, blog_model.BlogArticle,
+                      alumni_model.Alumni, champion_model.Champion, faq_model.FAQItem, contact_model.ContactCardInfo,
+                      partner_model.Partner, documentation_model.Documentation):
+            _reset_sequence(conn, model)
+    with engine.connect().execution_options(isolation_level="AUTOCOMMIT") as conn:
+        conn.execute(text("ANALYZE"))
+
+def _generated_filters():
+    """Marker predicate per model whose rows identify generated data."""
+    Event = event_model.Event
+    return {
+        user_model.User: user_model.User.email.like(USER_EMAIL_TEMPLATE.format("%")),
+        Event: Event.title.startswith(MARKER),
+        mentor_model.Mentor: mentor_model.Mentor.name.startswith(MARKER),
+        comment_model.Comment: comment_model.Comment.discussion_id.startswith(MARKER),
+        blog_model.BlogArticle: blog_model.BlogArticle.slug.startswith(MARKER),
+        alumni_model.Alumni: alumni_model.Alumni.name.startswith(MARKER),
+        champion_model.Champion: champion_model.Champion.name.startswith(MARKER),
+        faq_model.FAQItem: faq_model.FAQItem.question.startswith(MARKER),
+        contact_model.ContactCardInfo: contact_model.ContactCardInfo.platform_name.startswith(MARKER),
+        partner_model.Partner: partner_model.Partner.name.startswith(MARKER),
+        documentation_model.Documentation: documentation_model.Documentation.image_src.startswith(f"https://example.com/{MARKER}"),
+    }
+
+# Foreign key columns without an index of their own. Deleting a parent row makes Postgres
+# look up referencing rows, which is a sequential scan per deleted row without these.
+CLEANUP_INDEXES = [
+    ("portfolio_projects", "user_id"), ("skills", "event_id"), ("benefits", "event_id"), ("sessions", "event_id"),
+]
+
+def cleanup() -> None:
+    """Deletes all generated rows, children first."""
+    filters = _generated_filters()
+    Comment, CommentLike = comment_model.Comment, comment_model.CommentLike
+    User, Event = user_model.User, event_model.Event
+    generated_users = select(User.id).where(filters[User])
+    generated_events = select(Event.id).where(filters[Event])
+    generated_comments = select(Comment.id).where(filters[Comment])
+    participant = participant_model.Participant
+    association = event_model.event_mentor_association
+    with engine.begin() as conn:
+        # Built inside the transaction and dropped before commit, so they never outlive the cleanup
+        for table, column in CLEANUP_INDEXES:
+            conn.execute(text(f'CREATE INDEX "tmp_cleanup_{table}_{column}" ON "{table}" ("{column}")'))
+
+        # One IN (...) per statement: an OR of two large subqueries cannot use a hash semi-join
+        conn.execute(delete(CommentLike).where(CommentLike.comment_id.in_(generated_comments)))
+        conn.execute(delete(CommentLike).where(CommentLike.user_id.in_(generated_users)))
+        conn.execute(delete(participant).where(participant.event_id.in_(generated_events)))
+        conn.execute(delete(participant).where(participant.member_id.in_(generated_users)))
+        conn.execute(delete(portfolio_model.PortfolioProject).where(portfolio_model.PortfolioProject.user_id.in_(generated_users)))
+        conn.execute(association.delete().where(association.c.event_id.in_(generated_events)))
+        conn.execute(association.delete().where(
+            association.c.mentor_id.in_(select(mentor_model.Mentor.id).where(filters[mentor_model.Mentor]))
+        ))
+        for child in (event_model.Skill, event_model.Benefit, event_model.Session):
+            conn.execute(delete(child).where(child.event_id.in_(generated_events)))
+        for model, predicate in filters.items():
+            conn.execute(delete(model).where(predicate))
+
+        for table, column in CLEANUP_INDEXES:
+            conn.execute(text(f'DROP INDEX "tmp_cleanup_{table}_{column}"'))
+
+def describe() -> dict:
+    """Counts generated rows per table."""
+    with engine.connect() as conn:
+        return {
+            model.__tablename__: conn.execute(select(func.count()).select_from(model).where(predicate)).scalar_one()
+            for model, predicate in _generated_filters().items()
+        }
+
+def sample_users(limit: int) -> list:
+    """Returns (id, email) of generated users, e.g. to log in as during benchmarks."""
+    User = user_model.User
+    with engine.connect() as conn:
+        return conn.execute(
+            select(User.id, User.email).where(_generated_filters()[User]).order_by(User.email).limit(limit)
+        ).all()
+
+def sample_discussions(limit: int) -> list:
+    """Returns generated discussion ids, busiest first."""
+    Comment = comment_model.Comment
+    with engine.connect() as conn:
+        return conn.execute(
+            select(Comment.discussion_id)
+            .where(Comment.discussion_id.startswith(MARKER))
+            .group_by(Comment.discussion_id)
+            .order_by(func.count().desc(), Comment.discussion_id)
+            .limit(limit)
+        ).scalars().all()
+
+def add_volume_arguments(parser: argparse.ArgumentParser) -> None:
+    parser.add_argument("--scale", type=float, default=1.0, help="Multiply every default volume")
+    for field in fields(Volumes):
+        parser.add_argument(f"--{field.name.replace('_', '-')}", dest=field.name, type=type(field.default),
+                            default=None, help=f"Override (default {field.default})")
+    parser.add_argument("--random-seed", type=int, default=42)
+
+def volumes_from_args(args) -> Volumes:
+    volumes = Volumes().scaled(args.scale)
+    overrides = {field.name: getattr(args, field.name) for field in fields(Volumes) if getattr(args, field.name) is not None}
+    return Volumes(**{**asdict(volumes), **overrides})
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    add_volume_arguments(parser)
+    parser.add_argument("--cleanup", action="store_true", help="Delete all generated rows and exit")
+    args = parser.parse_args()
+
+    if args.cleanup:
+        cleanup()
+        print("Removed generated rows.")
+        return
+
+    migrations.upgrade(engine)
+    volumes = volumes_from_args(args)
+    print(f"Generating with seed {args.random_seed}: {asdict(volumes)}")
+    started = time.perf_counter()
+    generate(volumes, seed=args.random_seed)
+    print(f"Done in {time.perf_counter() - started:.1f}s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# /shecodes-backend/benchmarks/import_time.py
+"""
+Reports where worker cold-start import time goes, using `python -X importtime`.
+
+Each run imports main in a fresh interpreter. The report lists the slowest modules
+and the self time per top-level package. Exits non-zero when the median import
+exceeds --budget-ms, or when a package that must stay lazy is imported at boot,
+so it can guard cold starts in CI.
+
+Usage (from the shecodes-backend directory):
+
+    python -m benchmarks.import_time
+    python -m benchmarks.import_time --runs 5 --budget-ms 1500
+"""
+
+import argparse
+import re
+import statistics
+import subprocess
+import sys
+from collections import defaultdict
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+# Heavy or rarely needed packages that must only be imported on first use
+LAZY_PACKAGES = ["supabase", "openpyxl", "pandas", "numpy", "scipy", "numba", "shap", "sklearn", "matplotlib", "httpx"]
+
+LINE = re.compile(r"^import time:\s+(\d+) \|\s+(\d+) \|( *)(\S+)$")
+
+def profile_once(module: str) -> list:
+    """Returns (module, self_us, cumulative_us, depth) for every import, in import order."""
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module}"],
+        cwd=BACKEND_DIR, capture_output=True, text=True,
+    )
+    if result.returncode != 0:
+        raise RuntimeError(f"Importing {module} failed:\n{result.stderr[-2000:]}")
+    entries = []
+    for line in result.stderr.splitlines():
+        match = LINE.match(line)
+        if match:
+            self_us, cumulative_us, indent, name = match.groups()
+            entries.append((name, int(self_us), int(cumulative_us), len(indent) // 2))
+    return entries
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--module", default="main")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=15)
+    parser.add_argument("--budget-ms", type=float, help="Fail if the median total import time is above this")
+    args = parser.parse_args()
+
+    runs = [profile_once(args.module) for _ in range(args.runs)]
+    totals = [next(cumulative for name, _, cumulative, _ in run if name == args.module) / 1000 for run in runs]
+    median_run = runs[totals.index(sorted(totals)[len(totals) // 2])]
+
+    print(f"import {args.module}: median {statistics.median(totals):.0f} ms over {args.runs} runs "
+          f"(min {min(totals):.0f}, max {max(totals):.0f})\n")
+
+    print("Slowest modules (cumulative, median run):")
+    for name, self_us, cumulative_us, depth in sorted(median_run, key=lambda entry: -entry[2])[:args.top]:
+        print(f"  {cumulative_us / 1000:>8.1f} ms  {self_us / 1000:>7.1f} ms self  {name}")
+
+    by_package = defaultdict(int)
+    for name, self_us, _, _ in median_run:
+        by_package[name.split(".")[0]] += self_us
+    print("\nSelf time by top-level package:")
+    for package, self_us in sorted(by_package.items(), key=lambda item: -item[1])[:args.top]:
+        print(f"  {self_us / 1000:>8.1f} ms  {package}")
+
+    failures = []
+    imported_lazy = sorted({name.split(".")[0] for name, _, _, _ in median_run} & set(LAZY_PACKAGES))
+    if imported_lazy:
+        failures.append(f"imported at boot but expected to load lazily: {', '.join(imported_lazy)}")
+    if args.budget_ms is not None and statistics.median(totals) > args.budget_ms:
+        failures.append(f"median import time {statistics.median(totals):.0f} ms is over the {args.budget_ms:.0f} ms budget")
+
+    if failures:
+        print()
+        for failure in failures:
+            print(f"FAIL: {failure}")
+        sys.exit(1)
+
+if __name__ == "__main__":
+    main()
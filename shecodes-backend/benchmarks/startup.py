@@ -0,0 +1,83 @@
+# /shecodes-backend/benchmarks/startup.py
+"""
+Measures worker boot time: importing main and running the app's startup (lifespan).
+
+Each round starts --workers fresh Python processes at once, like a multi-worker
+deploy, and reports per-worker boot time and the time until every worker is ready.
+--compare-create-all also measures the old boot, which ran Base.metadata.create_all
+in every worker, so the two can be compared on the same database.
+
+Usage (from the shecodes-backend directory, with .env pointing at a local database):
+
+    python -m benchmarks.startup --workers 4 --rounds 5 --compare-create-all
+"""
+
+import argparse
+import json
+import statistics
+import subprocess
+import sys
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+
+BOOT_SCRIPT = """
+import asyncio, json, sys, time
+started = time.perf_counter()
+import main
+imported = time.perf_counter()
+if sys.argv[1] == "create_all":
+    from database import Base
+    Base.metadata.create_all(bind=main.engine)
+
+async def boot():
+    async with main.app.router.lifespan_context(main.app):
+        pass
+
+asyncio.run(boot())
+finished = time.perf_counter()
+print(json.dumps({"import_ms": (imported - started) * 1000, "boot_ms": (finished - started) * 1000}))
+"""
+
+def run_round(workers: int, mode: str) -> dict:
+    started = time.perf_counter()
+    processes = [
+        subprocess.Popen([sys.executable, "-c", BOOT_SCRIPT, mode], cwd=BACKEND_DIR,
+                         stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True)
+        for _ in range(workers)
+    ]
+    results = []
+    for process in processes:
+        output, _ = process.communicate()
+        if process.returncode != 0:
+            raise RuntimeError(f"Worker boot failed in mode {mode!r} (exit code {process.returncode})")
+        results.append(json.loads(output.strip().splitlines()[-1]))
+    return {"all_ready_ms": (time.perf_counter() - started) * 1000, "workers": results}
+
+def summarize(rounds: list) -> dict:
+    boots = sorted(worker["boot_ms"] for round_ in rounds for worker in round_["workers"])
+    return {
+        "boot_p50_ms": statistics.median(boots),
+        "boot_max_ms": boots[-1],
+        "import_p50_ms": statistics.median(worker["import_ms"] for round_ in rounds for worker in round_["workers"]),
+        "all_ready_p50_ms": statistics.median(round_["all_ready_ms"] for round_ in rounds),
+    }
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--workers", type=int, default=4, help="Processes booted concurrently per round")
+    parser.add_argument("--rounds", type=int, default=5)
+    parser.add_argument("--compare-create-all", action="store_true", help="Also measure boot with create_all per worker")
+    args = parser.parse_args()
+
+    modes = ["current"] + (["create_all"] if args.compare_create_all else [])
+    print(f"{'mode':<12}{'import p50':>12}{'boot p50':>12}{'boot max':>12}{'all ready p50':>16}   (ms, {args.workers} workers)")
+    for mode in modes:
+        run_round(args.workers, mode) # warm the OS file cache and the database
+        summary = summarize([run_round(args.workers, mode) for _ in range(args.rounds)])
+        print(f"{mode:<12}{summary['import_p50_ms']:>12.0f}{summary['boot_p50_ms']:>12.0f}"
+              f"{summary['boot_max_ms']:>12.0f}{summary['all_ready_p50_ms']:>16.0f}")
+
+if __name__ == "__main__":
+    main()
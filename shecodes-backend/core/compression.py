@@ -0,0 +1,120 @@
+# /shecodes-backend/core/compression.py
+
+import gzip
+from typing import Optional
+
+from starlette.datastructures import Headers, MutableHeaders
+
+try: # Optional: without the brotli package only gzip is offered
+    import brotli
+except ImportError:
+    brotli = None
+
+COMPRESSIBLE_TYPES = ("application/json", "text/", "application/javascript", "application/xml", "image/svg+xml")
+
+# Levels for responses compressed on every request, and for cached bodies that are compressed once
+GZIP_LEVEL, GZIP_LEVEL_CACHED = 6, 9
+BROTLI_QUALITY, BROTLI_QUALITY_CACHED = 4, 9
+
+def supported_encodings() -> tuple:
+    """Encodings this server can produce, most preferred first."""
+    return ("br", "gzip") if brotli is not None else ("gzip",)
+
+def negotiate_encoding(accept_encoding: Optional[str]) -> Optional[str]:
+    """
+    Picks the encoding to use for an Accept-Encoding header, or None for an uncompressed response.
+    The highest q-value wins; on a tie brotli is preferred over gzip.
+    """
+    if not accept_encoding:
+        return None
+    weights = {}
+    for part in accept_encoding.split(","):
+        name, _, params = part.strip().partition(";")
+        q = 1.0
+        params = params.strip()
+        if params.startswith("q="):
+            try:
+                q = float(params[2:])
+            except ValueError:
+                q = 0.0
+        weights[name.strip().lower()] = q
+    wildcard = weights.get("*", 0.0)
+    best, best_q = None, 0.0
+    for encoding in supported_encodings():
+        q = weights.get(encoding, wildcard)
+        if q > best_q:
+            best, best_q = encoding, q
+    return best
+
+def should_compress(headers: Headers, body_size: int, minimum_size: int) -> bool:
+    """Only uncompressed text-like bodies of at least `minimum_size` bytes are worth compressing."""
+    if body_size < minimum_size or "content-encoding" in headers:
+        return False
+    content_type = headers.get("content-type", "")
+    if content_type.startswith("text/event-stream"):
+        return False
+    return content_type.startswith(COMPRESSIBLE_TYPES)
+
+def compress(body: bytes, encoding: str, cached: bool = False) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=BROTLI_QUALITY_CACHED if cached else BROTLI_QUALITY)
+    # mtime=0 so the same body always compresses to the same bytes
+    return gzip.compress(body, compresslevel=GZIP_LEVEL_CACHED if cached else GZIP_LEVEL, mtime=0)
+
+def set_encoded_body_headers(headers: MutableHeaders, encoding: Optional[str], body_size: int) -> None:
+    if encoding:
+        headers["Content-Encoding"] = encoding
+    headers["Content-Length"] = str(body_size)
+    headers.add_vary_header("Accept-Encoding")
+
+class CompressionMiddleware:
+    """
+    ASGI middleware compressing responses with brotli or gzip, as negotiated through Accept-Encoding.
+
+    Only complete bodies are compressed: streaming responses (exports, server-sent events) and
+    responses that already carry a Content-Encoding pass through untouched. Bodies smaller than
+    `minimum_size` are not worth the CPU and are sent as is.
+    """
+
+    def __init__(self, app, minimum_size: int = 1024):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        encoding = negotiate_encoding(Headers(scope=scope).get("accept-encoding"))
+        if encoding is None:
+            await self.app(scope, receive, send)
+            return
+
+        start_message = None
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+                return
+            if message["type"] == "http.response.start":
+                # Held back until the first body chunk shows whether the response can be compressed
+                start_message = message
+                return
+
+            body = message.get("body", b"")
+            headers = MutableHeaders(scope=start_message)
+            if message.get("more_body", False) or not should_compress(headers, len(body), self.minimum_size):
+                passthrough = True
+                if not message.get("more_body", False):
+                    headers.add_vary_header("Accept-Encoding")
+                await send(start_message)
+                await send(message)
+                return
+
+            compressed = compress(body, encoding)
+            set_encoded_body_headers(headers, encoding, len(compressed))
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed})
+
+        await self.app(scope, receive, send_wrapper)
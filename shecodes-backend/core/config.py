@@ -38,7 +38,8 @@ class Settings:
     # Email Settings
     EMAILS_ENABLED: bool = str(os.getenv("EMAILS_ENABLED", "False")).lower() == "true"
     SMTP_HOST: str | None = os.getenv("SMTP_HOST")
-    SMTP_PORT: int = int(os.getenv("SMTP_PORT"))
+    # Parsed and validated when an email is sent, so a missing value does not stop the app from booting
+    SMTP_PORT: str | None = os.getenv("SMTP_PORT")
     SMTP_USER: str | None = os.getenv("SMTP_USER")
     SMTP_PASSWORD: str | None = os.getenv("SMTP_PASSWORD")
     SMTP_TLS: bool = str(os.getenv("SMTP_TLS", "True")).lower() == "true"
@@ -50,6 +51,77 @@ class Settings:
     
     SUPABASE_URL: str = os.getenv("SUPABASE_URL")
     SUPABASE_SERVICE_KEY: str = os.getenv("SUPABASE_SERVICE_KEY")
+    # How often (seconds) the stored Event.status column is reconciled with event dates; 0 disables it
+    EVENT_STATUS_RECONCILE_SECONDS: int = int(os.getenv("EVENT_STATUS_RECONCILE_SECONDS", 300))
+
+    # Live updates (comment streams): "memory" fans out within one worker, "postgres" across workers via LISTEN/NOTIFY
+    PUBSUB_BACKEND: str = os.getenv("PUBSUB_BACKEND", "memory").lower()
+    # Messages buffered per stream client; clients that fall further behind are disconnected
+    SSE_CLIENT_BUFFER: int = int(os.getenv("SSE_CLIENT_BUFFER", 100))
+    SSE_KEEPALIVE_SECONDS: int = int(os.getenv("SSE_KEEPALIVE_SECONDS", 15))
+    # Cache invalidation after writes: "memory" evicts in the writing worker only, "postgres" in every worker
+    INVALIDATION_BACKEND: str = os.getenv("INVALIDATION_BACKEND", PUBSUB_BACKEND).lower()
+
+    # Per-worker cache of comment counts per discussion; evicted on comment create/delete through the invalidation bus
+    COMMENT_COUNTS_CACHE_TTL_SECONDS: int = int(os.getenv("COMMENT_COUNTS_CACHE_TTL_SECONDS", 30))
+
+    # Static JSON snapshots of the public lists (`python -m core.snapshots`)
+    SNAPSHOT_DIR: str = os.getenv("SNAPSHOT_DIR", "snapshots")
+    SNAPSHOT_KEEP_VERSIONS: int = int(os.getenv("SNAPSHOT_KEEP_VERSIONS", 3))
+    # Re-export the affected snapshots after writes, once no write has arrived for the debounce period
+    SNAPSHOT_ON_WRITE: bool = str(os.getenv("SNAPSHOT_ON_WRITE", "False")).lower() == "true"
+    SNAPSHOT_DEBOUNCE_SECONDS: float = float(os.getenv("SNAPSHOT_DEBOUNCE_SECONDS", 10))
+
+    # How often the admin dashboard statistics snapshot is recomputed (0 disables the schedule)
+    DASHBOARD_STATS_REFRESH_SECONDS: int = int(os.getenv("DASHBOARD_STATS_REFRESH_SECONDS", 300))
+
+    # Job queue (core.jobs): each API worker runs JOB_CONCURRENCY job threads unless disabled,
+    # e.g. when jobs run in their own processes with `python -m core.jobs`
+    JOB_WORKERS_ENABLED: bool = str(os.getenv("JOB_WORKERS_ENABLED", "True")).lower() == "true"
+    JOB_CONCURRENCY: int = int(os.getenv("JOB_CONCURRENCY", 2))
+    JOB_POLL_SECONDS: float = float(os.getenv("JOB_POLL_SECONDS", 2))
+    JOB_MAX_ATTEMPTS: int = int(os.getenv("JOB_MAX_ATTEMPTS", 5))
+    # Retry backoff: base * 2^(attempt - 1), capped at the max
+    JOB_RETRY_BASE_SECONDS: float = float(os.getenv("JOB_RETRY_BASE_SECONDS", 30))
+    JOB_RETRY_MAX_SECONDS: float = float(os.getenv("JOB_RETRY_MAX_SECONDS", 3600))
+    # A job running longer than this is assumed to have lost its worker and is queued again
+    JOB_LOCK_TIMEOUT_SECONDS: int = int(os.getenv("JOB_LOCK_TIMEOUT_SECONDS", 900))
+    JOB_RETENTION_DAYS: int = int(os.getenv("JOB_RETENTION_DAYS", 7))
+
+    # Max number of concurrent uploads for bulk operations (e.g. certificate ZIPs)
+    STORAGE_UPLOAD_CONCURRENCY: int = int(os.getenv("STORAGE_UPLOAD_CONCURRENCY", 8))
+
+    # Request/DB metrics middleware and the Prometheus /metrics endpoint
+    METRICS_ENABLED: bool = str(os.getenv("METRICS_ENABLED", "True")).lower() == "true"
+
+    # Query diagnostics: log statements slower than the threshold (parameters redacted)
+    SLOW_QUERY_LOG_ENABLED: bool = str(os.getenv("SLOW_QUERY_LOG_ENABLED", "False")).lower() == "true"
+    SLOW_QUERY_THRESHOLD_MS: int = int(os.getenv("SLOW_QUERY_THRESHOLD_MS", 200))
+    # N+1 detection: warn when one request runs the same statement this many times; on by default in development
+    N_PLUS_ONE_DETECTION_ENABLED: bool = str(
+        os.getenv("N_PLUS_ONE_DETECTION_ENABLED", str(APP_MODE in ["development", "dev"]))
+    ).lower() == "true"
+    N_PLUS_ONE_THRESHOLD: int = int(os.getenv("N_PLUS_ONE_THRESHOLD", 5))
+
+    # Rate limiting: "memory" keeps buckets per worker, "postgres" shares them between workers
+    RATE_LIMIT_ENABLED: bool = str(os.getenv("RATE_LIMIT_ENABLED", "True")).lower() == "true"
+    RATE_LIMIT_BACKEND: str = os.getenv("RATE_LIMIT_BACKEND", "memory").lower()
+    # Only enable behind a proxy that sets X-Forwarded-For, otherwise clients can spoof their IP
+    RATE_LIMIT_TRUST_PROXY: bool = str(os.getenv("RATE_LIMIT_TRUST_PROXY", "False")).lower() == "true"
+    # Limits are "<count>/<second|minute|hour|day>"
+    LOGIN_RATE_LIMIT_IP: str = os.getenv("LOGIN_RATE_LIMIT_IP", "20/minute")
+    LOGIN_RATE_LIMIT_ACCOUNT: str = os.getenv("LOGIN_RATE_LIMIT_ACCOUNT", "10/minute")
+    REGISTER_RATE_LIMIT_IP: str = os.getenv("REGISTER_RATE_LIMIT_IP", "5/minute")
+    PASSWORD_RESET_RATE_LIMIT_IP: str = os.getenv("PASSWORD_RESET_RATE_LIMIT_IP", "5/minute")
+    PASSWORD_RESET_RATE_LIMIT_ACCOUNT: str = os.getenv("PASSWORD_RESET_RATE_LIMIT_ACCOUNT", "3/hour")
+
+    # gzip/brotli response compression; smaller bodies are sent uncompressed
+    COMPRESSION_ENABLED: bool = str(os.getenv("COMPRESSION_ENABLED", "True")).lower() == "true"
+    COMPRESSION_MINIMUM_SIZE: int = int(os.getenv("COMPRESSION_MINIMUM_SIZE", 1024))
+    # Per-worker cache of anonymous GETs on public content (with their compressed variants)
+    RESPONSE_CACHE_ENABLED: bool = str(os.getenv("RESPONSE_CACHE_ENABLED", "True")).lower() == "true"
+    RESPONSE_CACHE_TTL_SECONDS: int = int(os.getenv("RESPONSE_CACHE_TTL_SECONDS", 30))
+    RESPONSE_CACHE_MAX_ENTRIES: int = int(os.getenv("RESPONSE_CACHE_MAX_ENTRIES", 500))
 
 settings = Settings()
 
@@ -57,7 +129,3 @@ if settings.APP_MODE in ["development", "dev"] and not settings.DEV_AUTH_TOKEN:
     print("WARNING: APP_MODE is development, but DEV_AUTH_TOKEN is not set in .env. Dev auto-login will not work.")
 if settings.APP_MODE in ["development", "dev"] and not settings.DEV_USER_EMAIL:
     print("WARNING: APP_MODE is development, but DEV_USER_EMAIL is not set in .env. Dev auto-login might fail.")
-
-if settings.EMAILS_ENABLED:
-    assert settings.SMTP_HOST, "SMTP_HOST must be set if emails are enabled."
-    assert settings.EMAILS_FROM_EMAIL, "EMAILS_FROM_EMAIL must be set if emails are enabled."
\ No newline at end of file
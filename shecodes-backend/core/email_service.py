@@ -2,8 +2,12 @@
 import smtplib
 from email.mime.text import MIMEText
 from email.mime.multipart import MIMEMultipart
-from typing import Dict, Any
+from datetime import timedelta
+from typing import Dict, Any, Literal, Tuple
+from pydantic import BaseModel
 from core.config import settings
+from core.jobs import job_handler
+from core.security import create_password_reset_token, create_verification_token
 
 def send_email(
     email_to: str,
@@ -14,8 +18,9 @@ def send_email(
         print(f"Email sending is disabled. To: {email_to}\nSubject: {subject}\nBody:\n{html_content}")
         return True # Simulate success
 
-    assert settings.EMAILS_FROM_EMAIL, "EMAILS_FROM_EMAIL must be configured"
-    assert settings.SMTP_HOST, "SMTP_HOST must be configured"
+    assert settings.EMAILS_FROM_EMAIL, "EMAILS_FROM_EMAIL must be set if emails are enabled."
+    assert settings.SMTP_HOST, "SMTP_HOST must be set if emails are enabled."
+    assert not settings.SMTP_PORT or settings.SMTP_PORT.isdigit(), "SMTP_PORT must be a number."
 
     msg = MIMEMultipart("alternative")
     msg["From"] = f"{settings.EMAILS_FROM_NAME} <{settings.EMAILS_FROM_EMAIL}>"
@@ -26,7 +31,7 @@ def send_email(
     try:
         server_args = {}
         if settings.SMTP_PORT:
-            server_args['port'] = settings.SMTP_PORT
+            server_args['port'] = int(settings.SMTP_PORT)
         if settings.SMTP_HOST:
             server_args['host'] = settings.SMTP_HOST
         
@@ -48,6 +53,33 @@ def send_email(
         traceback.print_exc()
         return False
 
+class EmailJob(BaseModel):
+    """
+    Payload of "send_email" jobs; enqueue these instead of sending from a request.
+    Only the recipient and the kind of e-mail are stored: the link token and the HTML are
+    built when the job runs, so no usable token is kept in the jobs table.
+    """
+    email_to: str
+    kind: Literal["verification", "password_reset"]
+
+def build_email(email_to: str, kind: str) -> Tuple[str, str]:
+    """Subject and HTML of an e-mail of the given kind, with a freshly issued link token."""
+    if kind == "verification":
+        token_expires = timedelta(hours=settings.EMAIL_VERIFICATION_TOKEN_EXPIRE_HOURS)
+        token = create_verification_token(email=email_to, expires_delta=token_expires)
+        link = f"{settings.FRONTEND_URL}/auth/verify-email?token={token}"
+        return settings.EMAIL_VERIFICATION_SUBJECT, generate_verification_email_content(link)
+    token_expires = timedelta(hours=settings.PASSWORD_RESET_TOKEN_EXPIRE_HOURS)
+    token = create_password_reset_token(email=email_to, expires_delta=token_expires)
+    link = f"{settings.FRONTEND_URL}/auth/reset-password?token={token}"
+    return settings.PASSWORD_RESET_SUBJECT, generate_password_reset_email_content(link)
+
+@job_handler("send_email", EmailJob)
+def send_email_job(payload: EmailJob) -> None:
+    subject, html_content = build_email(payload.email_to, payload.kind)
+    if not send_email(payload.email_to, subject, html_content):
+        raise RuntimeError(f"Could not send email to {payload.email_to}")
+
 def generate_verification_email_content(verification_link: str) -> str:
     """
     Generates a simple and professional HTML email for account verification.
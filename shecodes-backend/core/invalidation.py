@@ -0,0 +1,133 @@
+# /shecodes-backend/core/invalidation.py
+"""
+Keeps per-worker caches coherent when several workers serve the API.
+
+crud write paths call `publish_change(entity, id, **attrs)` after they commit, where `entity`
+is the table name. Caches register handlers with `on_change(entity, handler)` and evict what
+they hold for the change. The publishing worker runs its handlers at once, so it reads its own
+writes; with the postgres backend every other worker runs them when its listener receives the
+NOTIFY. A change with id None means any row of the entity may have changed.
+"""
+
+import json
+import threading
+import uuid
+from typing import Callable, Dict, List, Optional
+
+from core.config import settings
+from core.pubsub import PostgresListener, notify
+
+Handler = Callable[[dict], None]
+
+class InvalidationBus:
+    """
+    Runs the handlers of a change in this process only. Enough for a single worker,
+    scripts and tests (INVALIDATION_BACKEND=memory); the base of the postgres bus.
+    """
+
+    def __init__(self):
+        self._handlers: Dict[str, List[Handler]] = {}
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def on_change(self, entity: str, handler: Handler) -> None:
+        with self._lock:
+            self._handlers.setdefault(entity, []).append(handler)
+
+    def publish(self, change: dict) -> None:
+        self._dispatch(change)
+
+    def _dispatch(self, change: dict) -> None:
+        with self._lock:
+            handlers = list(self._handlers.get(change["entity"], ()))
+        for handler in handlers:
+            try:
+                handler(change)
+            except Exception as e:
+                print(f"WARNING: Invalidation handler for '{change['entity']}' failed: {e}")
+
+    def _dispatch_all(self) -> None:
+        with self._lock:
+            entities = list(self._handlers)
+        for entity in entities:
+            self._dispatch({"entity": entity, "id": None})
+
+class PostgresInvalidationBus(InvalidationBus):
+    """
+    Sends every change to all workers with Postgres NOTIFY; one listener connection per worker.
+
+    Changes are tagged with the worker's origin so the listener skips the ones this worker
+    has already handled. Notifications sent while a listener was disconnected are lost, so
+    after a reconnect the worker evicts everything it caches.
+    """
+
+    NOTIFY_CHANNEL = "shecodes_invalidation"
+    MAX_PAYLOAD_BYTES = 7900
+
+    def __init__(self, engine):
+        super().__init__()
+        self.engine = engine
+        self.origin: Optional[str] = None
+        self._connected_before = False
+        self._listener = PostgresListener(
+            engine, self.NOTIFY_CHANNEL, self._on_notification, "invalidation-listener", on_connect=self._on_connect
+        )
+
+    def start(self) -> None:
+        # Set here rather than in __init__, so workers forked from one process get their own
+        self.origin = uuid.uuid4().hex
+        self._listener.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._listener.stop(timeout)
+
+    def publish(self, change: dict) -> None:
+        self._dispatch(change)
+        payload = json.dumps({**change, "origin": self.origin}, default=str)
+        if len(payload.encode("utf-8")) > self.MAX_PAYLOAD_BYTES:
+            payload = json.dumps({"entity": change["entity"], "id": None, "origin": self.origin})
+        notify(self.engine, self.NOTIFY_CHANNEL, payload)
+
+    def _on_connect(self) -> None:
+        if self._connected_before:
+            self._dispatch_all()
+        self._connected_before = True
+
+    def _on_notification(self, payload: str) -> None:
+        try:
+            change = json.loads(payload)
+            if change.pop("origin", None) != self.origin:
+                self._dispatch(change)
+        except (ValueError, KeyError, AttributeError) as e:
+            print(f"WARNING: Ignoring malformed invalidation notification: {e}")
+
+_bus = None
+_bus_lock = threading.Lock()
+
+def get_bus() -> InvalidationBus:
+    """The bus selected by INVALIDATION_BACKEND ("memory" or "postgres"), created on first use."""
+    global _bus
+    if _bus is None:
+        with _bus_lock:
+            if _bus is None:
+                if settings.INVALIDATION_BACKEND == "postgres":
+                    from database import engine
+                    _bus = PostgresInvalidationBus(engine)
+                else:
+                    _bus = InvalidationBus()
+    return _bus
+
+def on_change(entity: str, handler: Handler) -> None:
+    get_bus().on_change(entity, handler)
+
+def publish_change(entity: str, id=None, **attrs) -> None:
+    """Publishes without failing the caller: the write is committed, stale caches still expire."""
+    try:
+        get_bus().publish({"entity": entity, "id": id, **attrs})
+    except Exception as e:
+        print(f"WARNING: Could not publish change of '{entity}': {e}")
@@ -0,0 +1,229 @@
+# /shecodes-backend/core/jobs.py
+"""
+A small job queue for work that should not run inside a request, such as e-mails and storage deletes.
+
+Each job type has a handler and a pydantic model for its payload:
+
+    class SendEmail(BaseModel):
+        email_to: str
+        ...
+
+    @job_handler("send_email", SendEmail)
+    def send_email_job(payload: SendEmail):
+        ...
+
+    enqueue(db, "send_email", SendEmail(...))                    # as soon as a worker is free
+    enqueue(db, "send_email", SendEmail(...), delay_seconds=3600) # or later
+
+Jobs are rows in the jobs table, so they survive restarts and any worker may run them.
+A handler that raises is retried with exponential backoff until its max_attempts are used
+up; raise PermanentJobError to fail at once. A job can run more than once (e.g. when its
+worker dies halfway), so handlers should be idempotent.
+
+With JOB_WORKERS_ENABLED every API worker runs JOB_CONCURRENCY job threads. To run jobs
+in separate processes instead, disable that and start workers from the shecodes-backend directory:
+
+    python -m core.jobs --concurrency 8
+"""
+
+import argparse
+import importlib
+import os
+import random
+import socket
+import threading
+import traceback
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Callable, Dict, List, Optional, Type, Union
+
+from pydantic import BaseModel, ValidationError
+from sqlalchemy.orm import Session
+
+import crud
+from core.config import settings
+from core.periodic import PeriodicTask
+from database import SessionLocal
+
+# Modules that register handlers, imported by standalone workers
+HANDLER_MODULES = ["core.email_service", "core.storage_service"]
+
+class PermanentJobError(Exception):
+    """Raised by a handler when retrying cannot help; the job fails without further attempts."""
+
+@dataclass
+class JobHandler:
+    job_type: str
+    payload_model: Type[BaseModel]
+    func: Callable[[BaseModel], None]
+    max_attempts: int
+
+HANDLERS: Dict[str, JobHandler] = {}
+
+def job_handler(job_type: str, payload_model: Type[BaseModel], max_attempts: Optional[int] = None):
+    """Registers the decorated function as the handler of `job_type`."""
+    def decorator(func):
+        if job_type in HANDLERS:
+            raise ValueError(f"A handler for job type '{job_type}' is already registered")
+        HANDLERS[job_type] = JobHandler(job_type, payload_model, func, max_attempts or settings.JOB_MAX_ATTEMPTS)
+        return func
+    return decorator
+
+def enqueue(
+    db: Session,
+    job_type: str,
+    payload: Union[BaseModel, dict],
+    delay_seconds: float = 0,
+    run_at: Optional[datetime] = None,
+):
+    """
+    Stores a job to run at `run_at` (naive UTC) or after `delay_seconds`. The payload is
+    validated against the handler's model now, so a bad payload fails the caller instead of the job.
+    """
+    handler = HANDLERS.get(job_type)
+    if handler is None:
+        raise ValueError(f"No handler registered for job type '{job_type}'")
+    if isinstance(payload, BaseModel):
+        payload = payload.model_dump(mode="json")
+    payload = handler.payload_model.model_validate(payload).model_dump(mode="json")
+    if run_at is None and delay_seconds:
+        run_at = datetime.utcnow() + timedelta(seconds=delay_seconds)
+
+    db_job = crud.enqueue_job(db, job_type, payload, max_attempts=handler.max_attempts, run_at=run_at)
+    if _pool is not None and run_at is None:
+        _pool.wake()
+    return db_job
+
+def retry_delay(attempts: int) -> float:
+    """Seconds before the next attempt: doubles per attempt, capped, with up to 10% jitter."""
+    delay = min(settings.JOB_RETRY_BASE_SECONDS * 2 ** (attempts - 1), settings.JOB_RETRY_MAX_SECONDS)
+    return delay * random.uniform(1.0, 1.1)
+
+def run_job(db: Session, job) -> bool:
+    """Runs a claimed job and records the outcome; returns whether it succeeded."""
+    try:
+        handler = HANDLERS.get(job.type)
+        if handler is None:
+            raise PermanentJobError(f"No handler registered for job type '{job.type}'")
+        handler.func(handler.payload_model.model_validate(job.payload))
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        retry = not isinstance(e, (PermanentJobError, ValidationError)) and job.attempts < job.max_attempts
+        retry_at = datetime.utcnow() + timedelta(seconds=retry_delay(job.attempts)) if retry else None
+        crud.fail_job(db, job.id, error, retry_at)
+        outcome = f"retrying at {retry_at:%H:%M:%S}" if retry else "giving up"
+        print(f"WARNING: Job {job.id} ({job.type}) failed on attempt {job.attempts}/{job.max_attempts}, {outcome}: {error}")
+        if not isinstance(e, PermanentJobError):
+            traceback.print_exc()
+        return False
+    crud.complete_job(db, job.id)
+    return True
+
+class JobWorkerPool:
+    """
+    `concurrency` threads that claim and run due jobs, polling every `poll_seconds` when the
+    queue is empty; jobs enqueued in this process wake an idle thread at once. The pool also
+    releases jobs of dead workers and purges old succeeded jobs once a minute.
+    """
+
+    def __init__(self, concurrency: int, poll_seconds: float):
+        self.concurrency = max(1, concurrency)
+        self.poll_seconds = poll_seconds
+        self.worker_id: Optional[str] = None
+        self._stop = threading.Event()
+        self._wakeup = threading.Condition()
+        self._threads: List[threading.Thread] = []
+        self._maintenance = PeriodicTask("job-maintenance", 60, self.maintain)
+
+    def start(self) -> None:
+        global _pool
+        if self._threads:
+            return
+        # Set here rather than in __init__, so forked workers get their own id
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}"
+        self._stop.clear()
+        for index in range(self.concurrency):
+            thread = threading.Thread(target=self._work, name=f"job-worker-{index}", daemon=True)
+            thread.start()
+            self._threads.append(thread)
+        self._maintenance.start()
+        _pool = self
+
+    def stop(self, timeout: float = 10.0) -> None:
+        """Lets running jobs finish (up to `timeout`); jobs still running then are released by maintenance."""
+        global _pool
+        self._stop.set()
+        self.wake(all_threads=True)
+        self._maintenance.stop()
+        for thread in self._threads:
+            thread.join(timeout=timeout)
+        self._threads = []
+        if _pool is self:
+            _pool = None
+
+    def wake(self, all_threads: bool = False) -> None:
+        with self._wakeup:
+            if all_threads:
+                self._wakeup.notify_all()
+            else:
+                self._wakeup.notify()
+
+    def run_next(self) -> bool:
+        """Claims and runs one due job; returns False when there was none."""
+        db = SessionLocal()
+        try:
+            job = crud.claim_job(db, self.worker_id)
+            if job is None:
+                return False
+            run_job(db, job)
+            return True
+        finally:
+            db.close()
+
+    def _work(self) -> None:
+        while not self._stop.is_set():
+            try:
+                ran = self.run_next()
+            except Exception as e:
+                print(f"ERROR: Job worker failed: {e}")
+                traceback.print_exc()
+                ran = False
+            if not ran and not self._stop.is_set():
+                with self._wakeup:
+                    self._wakeup.wait(self.poll_seconds)
+
+    def maintain(self) -> None:
+        db = SessionLocal()
+        try:
+            now = datetime.utcnow()
+            released = crud.requeue_stale_jobs(db, now - timedelta(seconds=settings.JOB_LOCK_TIMEOUT_SECONDS))
+            if released:
+                print(f"WARNING: Released {released} job(s) of workers that stopped while running them")
+            crud.purge_succeeded_jobs(db, now - timedelta(days=settings.JOB_RETENTION_DAYS))
+        finally:
+            db.close()
+
+_pool: Optional[JobWorkerPool] = None
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--concurrency", type=int, default=settings.JOB_CONCURRENCY,
+                        help=f"Job threads (default JOB_CONCURRENCY, {settings.JOB_CONCURRENCY})")
+    args = parser.parse_args()
+
+    from migrations import import_models
+    import_models()
+    for module in HANDLER_MODULES:
+        importlib.import_module(module)
+
+    pool = JobWorkerPool(args.concurrency, settings.JOB_POLL_SECONDS)
+    pool.start()
+    print(f"Job worker {pool.worker_id} running {pool.concurrency} thread(s) for: {', '.join(sorted(HANDLERS))}")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        print("Stopping job worker, waiting for running jobs...")
+        pool.stop()
+
+if __name__ == "__main__":
+    main()
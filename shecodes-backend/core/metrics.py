@@ -0,0 +1,192 @@
+# /shecodes-backend/core/metrics.py
+
+import threading
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Dict, Optional, Sequence, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# Default latency buckets (seconds) and per-request query-count buckets
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+QUERY_COUNT_BUCKETS = (0, 1, 2, 5, 10, 20, 50, 100, 200)
+
+@dataclass
+class RequestStats:
+    """Database work done while serving one request."""
+    queries: int = 0
+    db_seconds: float = 0.0
+
+_current_request: ContextVar[Optional[RequestStats]] = ContextVar("current_request_stats", default=None)
+
+def current_request_stats() -> Optional[RequestStats]:
+    """Returns the stats of the request being served, or None outside of a request."""
+    return _current_request.get()
+
+def _escape(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    parts = [f'{name}="{_escape(str(value))}"' for name, value in zip(names, values)]
+    if extra:
+        parts.append(extra)
+    return "{" + ",".join(parts) + "}" if parts else ""
+
+class Counter:
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self._values: Dict[Tuple[str, ...], float] = {}
+
+    def inc(self, labels: Tuple[str, ...], amount: float = 1.0) -> None:
+        self._values[labels] = self._values.get(labels, 0.0) + amount
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} counter"]
+        for labels, value in sorted(self._values.items()):
+            lines.append(f"{self.name}{_format_labels(self.label_names, labels)} {value:g}")
+        return lines
+
+class Gauge:
+    def __init__(self, name: str, help_text: str):
+        self.name = name
+        self.help_text = help_text
+        self.value = 0.0
+
+    def render(self) -> list:
+        return [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} gauge", f"{self.name} {self.value:g}"]
+
+class Histogram:
+    def __init__(self, name: str, help_text: str, label_names: Sequence[str], buckets: Sequence[float]):
+        self.name = name
+        self.help_text = help_text
+        self.label_names = tuple(label_names)
+        self.buckets = tuple(buckets)
+        # labels -> [per-bucket counts..., +Inf count, sum]
+        self._series: Dict[Tuple[str, ...], list] = {}
+
+    def observe(self, labels: Tuple[str, ...], value: float) -> None:
+        series = self._series.get(labels)
+        if series is None:
+            series = self._series[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                series[index] += 1
+                break
+        else:
+            series[len(self.buckets)] += 1
+        series[-1] += value
+
+    def render(self) -> list:
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, series in sorted(self._series.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets, series):
+                cumulative += count
+                le = _format_labels(self.label_names, labels, f'le="{bound:g}"')
+                lines.append(f"{self.name}_bucket{le} {cumulative}")
+            cumulative += series[len(self.buckets)]
+            inf = _format_labels(self.label_names, labels, 'le="+Inf"')
+            lines.append(f"{self.name}_bucket{inf} {cumulative}")
+            lines.append(f"{self.name}_sum{_format_labels(self.label_names, labels)} {series[-1]:g}")
+            lines.append(f"{self.name}_count{_format_labels(self.label_names, labels)} {cumulative}")
+        return lines
+
+class MetricsRegistry:
+    """
+    In-process request metrics for one worker, rendered in the Prometheus text format.
+    Each worker exposes its own numbers; aggregate across workers in Prometheus.
+    """
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.requests_total = Counter(
+            "http_requests_total", "Total HTTP requests by route and status code.", ("method", "route", "status")
+        )
+        self.request_duration = Histogram(
+            "http_request_duration_seconds", "HTTP request latency by route.", ("method", "route"), LATENCY_BUCKETS
+        )
+        self.in_flight = Gauge("http_requests_in_flight", "HTTP requests currently being served.")
+        self.db_queries = Histogram(
+            "http_request_db_queries", "Database queries executed per request.", ("method", "route"), QUERY_COUNT_BUCKETS
+        )
+        self.db_duration = Histogram(
+            "http_request_db_duration_seconds", "Time spent in database queries per request.", ("method", "route"), LATENCY_BUCKETS
+        )
+
+    def request_started(self) -> None:
+        with self._lock:
+            self.in_flight.value += 1
+
+    def request_finished(self, method: str, route: str, status_code: int, duration: float, stats: RequestStats) -> None:
+        labels = (method, route)
+        with self._lock:
+            self.in_flight.value -= 1
+            self.requests_total.inc((method, route, str(status_code)))
+            self.request_duration.observe(labels, duration)
+            self.db_queries.observe(labels, stats.queries)
+            self.db_duration.observe(labels, stats.db_seconds)
+
+    def render(self) -> str:
+        with self._lock:
+            lines = []
+            for metric in (self.requests_total, self.request_duration, self.in_flight, self.db_queries, self.db_duration):
+                lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+registry = MetricsRegistry()
+
+class MetricsMiddleware:
+    """
+    ASGI middleware recording latency, status and database usage for every HTTP request.
+    Requests are labelled with the matched route template (e.g. /events/{event_id}),
+    so path parameters do not create new series; unmatched paths share one label.
+    """
+
+    def __init__(self, app, registry: MetricsRegistry = registry):
+        self.app = app
+        self.registry = registry
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        stats = RequestStats()
+        token = _current_request.set(stats)
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        self.registry.request_started()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "<unmatched>"
+            self.registry.request_finished(
+                scope["method"], route_path, status_code, time.perf_counter() - started, stats
+            )
+            _current_request.reset(token)
+
+def install_query_listeners(engine: Engine) -> None:
+    """Counts queries and their duration against the current request via cursor execute events."""
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._metrics_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        stats = _current_request.get()
+        if stats is not None:
+            stats.queries += 1
+            stats.db_seconds += time.perf_counter() - context._metrics_started
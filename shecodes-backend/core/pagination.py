@@ -0,0 +1,42 @@
+# /shecodes-backend/core/pagination.py
+
+import base64
+import json
+from datetime import datetime
+from typing import Any, List
+
+from fastapi import HTTPException, status
+
+def encode_cursor(*values: Any) -> str:
+    """
+    Encodes the sort key of the last row of a page into an opaque cursor string.
+    Datetimes are stored as ISO strings and restored by `decode_cursor`.
+    """
+    payload = [
+        {"dt": value.isoformat()} if isinstance(value, datetime) else value
+        for value in values
+    ]
+    return base64.urlsafe_b64encode(json.dumps(payload).encode("utf-8")).decode("ascii")
+
+def decode_cursor(cursor: str, *types: type) -> List[Any]:
+    """
+    Decodes a cursor produced by `encode_cursor` whose values have the given `types`,
+    e.g. `decode_cursor(cursor, datetime, int)`. Raises a 400 if it is malformed.
+    """
+    try:
+        payload = json.loads(base64.urlsafe_b64decode(cursor.encode("ascii")))
+        if not isinstance(payload, list) or len(payload) != len(types):
+            raise ValueError("unexpected cursor shape")
+        return [_decode_value(value, expected) for value, expected in zip(payload, types)]
+    except (ValueError, KeyError, TypeError):
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="Invalid pagination cursor.")
+
+def _decode_value(value: Any, expected: type) -> Any:
+    if expected is datetime:
+        if not isinstance(value, dict) or not isinstance(value["dt"], str):
+            raise ValueError("expected a datetime")
+        return datetime.fromisoformat(value["dt"])
+    # bool is a subclass of int, but never a valid id
+    if not isinstance(value, expected) or isinstance(value, bool):
+        raise ValueError(f"expected {expected.__name__}")
+    return value
@@ -0,0 +1,39 @@
+# /shecodes-backend/core/periodic.py
+
+import threading
+import traceback
+from typing import Callable
+
+class PeriodicTask:
+    """
+    Runs a function every `interval_seconds` on a daemon thread.
+    Errors are printed and the task keeps running on the next tick.
+    """
+
+    def __init__(self, name: str, interval_seconds: float, func: Callable[[], object]):
+        self.name = name
+        self.interval_seconds = interval_seconds
+        self.func = func
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._thread = threading.Thread(target=self._run, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                self.func()
+            except Exception as e:
+                print(f"ERROR: Periodic task '{self.name}' failed: {e}")
+                traceback.print_exc()
+            self._stop.wait(self.interval_seconds)
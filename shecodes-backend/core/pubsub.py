@@ -0,0 +1,221 @@
+# /shecodes-backend/core/pubsub.py
+
+import asyncio
+import json
+import select
+import threading
+from typing import Callable, Dict, Optional, Set
+
+from sqlalchemy import text
+
+from core.config import settings
+
+class Subscription:
+    """
+    One subscriber's bounded queue of messages, consumed on the subscriber's event loop.
+    When the queue is full the subscriber is too slow: it is dropped instead of buffering more,
+    and `get()` returns None so the consumer can end its stream.
+    """
+
+    def __init__(self, broker: "InMemoryBroker", channel: str, maxsize: int):
+        self.broker = broker
+        self.channel = channel
+        self.loop = asyncio.get_running_loop()
+        self.queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.dropped = False
+
+    async def get(self) -> Optional[dict]:
+        if self.dropped:
+            return None
+        return await self.queue.get()
+
+    def _deliver(self, message: dict) -> None:
+        # Runs on the subscriber's loop
+        if self.dropped:
+            return
+        try:
+            self.queue.put_nowait(message)
+        except asyncio.QueueFull:
+            self.dropped = True
+            self.broker.unsubscribe(self)
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None) # Wakes up a consumer waiting in get()
+
+    def close(self) -> None:
+        self.broker.unsubscribe(self)
+
+class InMemoryBroker:
+    """
+    Fans messages out to the subscribers of a channel in this worker process.
+    `publish` may be called from any thread, e.g. from sync route handlers in the threadpool.
+    """
+
+    def __init__(self):
+        self._subscriptions: Dict[str, Set[Subscription]] = {}
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        pass
+
+    def stop(self) -> None:
+        pass
+
+    def subscribe(self, channel: str, maxsize: int = 100) -> Subscription:
+        """Must be called from a running event loop; messages are delivered on that loop."""
+        subscription = Subscription(self, channel, maxsize)
+        with self._lock:
+            self._subscriptions.setdefault(channel, set()).add(subscription)
+        return subscription
+
+    def unsubscribe(self, subscription: Subscription) -> None:
+        with self._lock:
+            subscribers = self._subscriptions.get(subscription.channel)
+            if subscribers is not None:
+                subscribers.discard(subscription)
+                if not subscribers:
+                    del self._subscriptions[subscription.channel]
+
+    def subscriber_count(self, channel: Optional[str] = None) -> int:
+        with self._lock:
+            if channel is not None:
+                return len(self._subscriptions.get(channel, ()))
+            return sum(len(subscribers) for subscribers in self._subscriptions.values())
+
+    def publish(self, channel: str, message: dict) -> None:
+        self._fan_out(channel, message)
+
+    def _fan_out(self, channel: str, message: dict) -> None:
+        with self._lock:
+            subscribers = list(self._subscriptions.get(channel, ()))
+        for subscription in subscribers:
+            try:
+                subscription.loop.call_soon_threadsafe(subscription._deliver, message)
+            except RuntimeError: # The subscriber's loop is closed
+                self.unsubscribe(subscription)
+
+class PostgresListener:
+    """
+    Holds one dedicated LISTEN connection on a background thread and passes the payload of
+    every notification on `channel` to `on_payload`, reconnecting with backoff when the
+    connection drops. Notifications sent while disconnected are lost; `on_connect` runs
+    each time the listener is (re)connected.
+    """
+
+    def __init__(self, engine, channel: str, on_payload: Callable[[str], None], name: str,
+                 on_connect: Optional[Callable[[], None]] = None):
+        self.engine = engine
+        self.channel = channel
+        self.on_payload = on_payload
+        self.name = name
+        self.on_connect = on_connect
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._listen_forever, name=self.name, daemon=True)
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=timeout)
+            self._thread = None
+
+    def _listen_forever(self) -> None:
+        backoff = 1.0
+        while not self._stop.is_set():
+            try:
+                self._listen()
+                backoff = 1.0
+            except Exception as e:
+                print(f"ERROR: Listener '{self.name}' disconnected, reconnecting in {backoff:.0f}s: {e}")
+                self._stop.wait(backoff)
+                backoff = min(backoff * 2, 30.0)
+
+    def _listen(self) -> None:
+        # A dedicated connection, taken out of the pool for the lifetime of the listener
+        pooled = self.engine.raw_connection()
+        connection = pooled.driver_connection
+        pooled.detach()
+        try:
+            connection.autocommit = True
+            with connection.cursor() as cursor:
+                cursor.execute(f"LISTEN {self.channel}")
+            if self.on_connect is not None:
+                self.on_connect()
+            while not self._stop.is_set():
+                if select.select([connection], [], [], 1.0)[0]:
+                    connection.poll()
+                    while connection.notifies:
+                        self.on_payload(connection.notifies.pop(0).payload)
+        finally:
+            connection.close()
+
+def notify(engine, channel: str, payload: str) -> None:
+    with engine.begin() as conn:
+        conn.execute(text("SELECT pg_notify(:channel, :payload)"), {"channel": channel, "payload": payload})
+
+class PostgresBroker(InMemoryBroker):
+    """
+    Fans messages out across all workers with Postgres LISTEN/NOTIFY.
+
+    `publish` sends a NOTIFY; one listener thread per worker receives every notification
+    (including its own) on a dedicated connection and fans it out to the local subscribers.
+    NOTIFY payloads are limited to 8000 bytes, so larger messages are reduced to their
+    "type" and "id" with "truncated": true; subscribers should re-fetch on those.
+    """
+
+    NOTIFY_CHANNEL = "shecodes_pubsub"
+    MAX_PAYLOAD_BYTES = 7900
+
+    def __init__(self, engine):
+        super().__init__()
+        self.engine = engine
+        self._listener = PostgresListener(engine, self.NOTIFY_CHANNEL, self._on_notification, "pubsub-listener")
+
+    def start(self) -> None:
+        self._listener.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        self._listener.stop(timeout)
+
+    def publish(self, channel: str, message: dict) -> None:
+        payload = json.dumps({"channel": channel, "message": message}, default=str)
+        if len(payload.encode("utf-8")) > self.MAX_PAYLOAD_BYTES:
+            reduced = {"type": message.get("type"), "id": message.get("id"), "truncated": True}
+            payload = json.dumps({"channel": channel, "message": reduced}, default=str)
+        notify(self.engine, self.NOTIFY_CHANNEL, payload)
+
+    def _on_notification(self, payload: str) -> None:
+        try:
+            envelope = json.loads(payload)
+            self._fan_out(envelope["channel"], envelope["message"])
+        except (ValueError, KeyError) as e:
+            print(f"WARNING: Ignoring malformed pub/sub notification: {e}")
+
+_broker = None
+_broker_lock = threading.Lock()
+
+def get_broker() -> InMemoryBroker:
+    """The broker selected by PUBSUB_BACKEND ("memory" or "postgres"), created on first use."""
+    global _broker
+    if _broker is None:
+        with _broker_lock:
+            if _broker is None:
+                if settings.PUBSUB_BACKEND == "postgres":
+                    from database import engine
+                    _broker = PostgresBroker(engine)
+                else:
+                    _broker = InMemoryBroker()
+    return _broker
+
+def publish(channel: str, message: dict) -> None:
+    """Publishes without failing the caller: live updates are best effort."""
+    try:
+        get_broker().publish(channel, message)
+    except Exception as e:
+        print(f"WARNING: Could not publish to '{channel}': {e}")
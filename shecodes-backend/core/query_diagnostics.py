@@ -0,0 +1,118 @@
+# /shecodes-backend/core/query_diagnostics.py
+
+import time
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.sql.util import find_tables
+
+@dataclass
+class _StatementUsage:
+    count: int = 0
+    total_seconds: float = 0.0
+    tables: Tuple[str, ...] = ()
+
+@dataclass
+class _RequestQueries:
+    """Statements executed while serving one request, keyed by their SQL text."""
+    scope: dict
+    statements: Dict[str, _StatementUsage] = field(default_factory=dict)
+
+_current_request: ContextVar[Optional[_RequestQueries]] = ContextVar("query_diagnostics_request", default=None)
+
+def _route_label(scope: Optional[dict]) -> str:
+    if scope is None:
+        return "<no request>"
+    route = scope.get("route")
+    return f"{scope.get('method', '')} {getattr(route, 'path', None) or scope.get('path', '')}".strip()
+
+def _redact(parameters, executemany: bool) -> str:
+    """Describes bound parameters by type only, so values (emails, tokens, hashes) never reach the log."""
+    if executemany:
+        return f"<{len(parameters)} parameter sets>"
+    if isinstance(parameters, dict):
+        return "{" + ", ".join(f"{key}: <{type(value).__name__}>" for key, value in parameters.items()) + "}"
+    if isinstance(parameters, (list, tuple)):
+        return "(" + ", ".join(f"<{type(value).__name__}>" for value in parameters) + ")"
+    return "<redacted>"
+
+def _statement_tables(context) -> Tuple[str, ...]:
+    statement = getattr(getattr(context, "compiled", None), "statement", None)
+    if statement is None:
+        return ()
+    names = []
+    for table in find_tables(statement, include_crud=True):
+        if table.name not in names:
+            names.append(table.name)
+    return tuple(names)
+
+def _models_for_tables(tables: Tuple[str, ...]) -> List[str]:
+    from database import Base
+    by_table = {mapper.local_table.name: mapper.class_.__name__ for mapper in Base.registry.mappers}
+    return [by_table.get(table, table) for table in tables]
+
+class QueryDiagnosticsMiddleware:
+    """
+    ASGI middleware that collects the statements of each request and, once the response
+    is sent, reports statements repeated enough times to look like an N+1 lazy-load pattern.
+    """
+
+    def __init__(self, app, threshold: int):
+        self.app = app
+        self.threshold = threshold
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        queries = _RequestQueries(scope=scope)
+        token = _current_request.set(queries)
+        try:
+            await self.app(scope, receive, send)
+        finally:
+            _current_request.reset(token)
+            self._report(queries)
+
+    def _report(self, queries: _RequestQueries) -> None:
+        for statement, usage in queries.statements.items():
+            if usage.count < self.threshold:
+                continue
+            models = ", ".join(_models_for_tables(usage.tables)) or "unknown"
+            sql = " ".join(statement.split())
+            print(
+                f"WARNING: Possible N+1 in {_route_label(queries.scope)}: same statement ran {usage.count} times "
+                f"({usage.total_seconds * 1000:.1f} ms total) loading {models}: {sql[:300]}"
+            )
+
+def install_query_diagnostics(engine: Engine, slow_query_ms: Optional[int], track_repeats: bool) -> None:
+    """
+    Hooks cursor execute events for the slow-query log (slow_query_ms=None disables it)
+    and for per-request statement tracking used by QueryDiagnosticsMiddleware.
+    """
+
+    @event.listens_for(engine, "before_cursor_execute")
+    def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        context._diagnostics_started = time.perf_counter()
+
+    @event.listens_for(engine, "after_cursor_execute")
+    def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany):
+        elapsed = time.perf_counter() - context._diagnostics_started
+        queries = _current_request.get()
+
+        if slow_query_ms is not None and elapsed * 1000 >= slow_query_ms:
+            sql = " ".join(statement.split())
+            print(
+                f"SLOW QUERY ({elapsed * 1000:.1f} ms) in {_route_label(queries.scope if queries else None)}: "
+                f"{sql} params={_redact(parameters, executemany)}"
+            )
+
+        if track_repeats and queries is not None:
+            usage = queries.statements.get(statement)
+            if usage is None:
+                usage = queries.statements[statement] = _StatementUsage(tables=_statement_tables(context))
+            usage.count += 1
+            usage.total_seconds += elapsed
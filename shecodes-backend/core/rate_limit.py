@@ -0,0 +1,144 @@
+# /shecodes-backend/core/rate_limit.py
+
+import math
+import threading
+import time
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+from fastapi import HTTPException, Request, status
+from sqlalchemy import text
+
+from core.config import settings
+
+PERIOD_SECONDS = {"second": 1, "minute": 60, "hour": 3600, "day": 86400}
+
+@dataclass(frozen=True)
+class RateLimit:
+    """Token bucket: up to `capacity` requests at once, refilled at `refill_per_second`."""
+    capacity: float
+    refill_per_second: float
+
+    @classmethod
+    def parse(cls, value: str) -> "RateLimit":
+        """Parses "<count>/<second|minute|hour|day>", e.g. "10/minute"."""
+        count, _, period = value.partition("/")
+        return cls(capacity=float(count), refill_per_second=float(count) / PERIOD_SECONDS[period.strip()])
+
+class InMemoryBackend:
+    """Buckets in a dict guarded by a lock. Limits are per worker process."""
+
+    def __init__(self, max_keys: int = 100_000):
+        self.max_keys = max_keys
+        self._buckets: Dict[str, Tuple[float, float, float]] = {} # key -> (tokens, updated_at, full_at)
+        self._lock = threading.Lock()
+
+    def take(self, key: str, limit: RateLimit) -> float:
+        """Takes one token; returns 0 if allowed, otherwise the seconds until a token is available."""
+        now = time.monotonic()
+        with self._lock:
+            tokens, updated_at, _ = self._buckets.get(key, (limit.capacity, now, now))
+            tokens = min(limit.capacity, tokens + (now - updated_at) * limit.refill_per_second)
+            allowed = tokens >= 1
+            if allowed:
+                tokens -= 1
+            self._buckets[key] = (tokens, now, now + (limit.capacity - tokens) / limit.refill_per_second)
+            if len(self._buckets) > self.max_keys:
+                self._prune(now)
+        return 0.0 if allowed else (1 - tokens) / limit.refill_per_second
+
+    def _prune(self, now: float) -> None:
+        # A bucket that has refilled completely is the same as no bucket at all
+        for key in [key for key, (_, _, full_at) in self._buckets.items() if full_at <= now]:
+            del self._buckets[key]
+
+class PostgresBackend:
+    """
+    Buckets shared by all workers in the UNLOGGED rate_limit_buckets table (models/rate_limit.py).
+    Each check is one upsert that refills and takes a token atomically, using the database clock.
+    """
+
+    # EXCLUDED.updated_at is "now"; SET expressions see the row as it was before the update
+    TAKE = text("""
+        INSERT INTO rate_limit_buckets AS bucket (key, tokens, updated_at, allowed)
+        VALUES (:key, :capacity - 1, extract(epoch FROM clock_timestamp()), true)
+        ON CONFLICT (key) DO UPDATE SET
+            tokens = LEAST(:capacity, bucket.tokens + (EXCLUDED.updated_at - bucket.updated_at) * :rate)
+                - CASE WHEN LEAST(:capacity, bucket.tokens + (EXCLUDED.updated_at - bucket.updated_at) * :rate) >= 1
+                       THEN 1 ELSE 0 END,
+            allowed = LEAST(:capacity, bucket.tokens + (EXCLUDED.updated_at - bucket.updated_at) * :rate) >= 1,
+            updated_at = EXCLUDED.updated_at
+        RETURNING tokens, allowed
+    """)
+
+    def __init__(self, engine):
+        self.engine = engine
+
+    def take(self, key: str, limit: RateLimit) -> float:
+        with self.engine.begin() as conn:
+            tokens, allowed = conn.execute(
+                self.TAKE, {"key": key, "capacity": limit.capacity, "rate": limit.refill_per_second}
+            ).one()
+        return 0.0 if allowed else (1 - tokens) / limit.refill_per_second
+
+    def purge(self, idle_seconds: int = 86400) -> None:
+        with self.engine.begin() as conn:
+            conn.execute(
+                text("DELETE FROM rate_limit_buckets WHERE updated_at < extract(epoch FROM clock_timestamp()) - :idle"),
+                {"idle": idle_seconds},
+            )
+
+_backend = None
+_backend_lock = threading.Lock()
+
+def get_backend():
+    """The backend selected by RATE_LIMIT_BACKEND ("memory" or "postgres"), created on first use."""
+    global _backend
+    if _backend is None:
+        with _backend_lock:
+            if _backend is None:
+                if settings.RATE_LIMIT_BACKEND == "postgres":
+                    from database import engine
+                    _backend = PostgresBackend(engine)
+                else:
+                    _backend = InMemoryBackend()
+    return _backend
+
+def client_ip(request: Request) -> str:
+    if settings.RATE_LIMIT_TRUST_PROXY:
+        forwarded_for = request.headers.get("x-forwarded-for")
+        if forwarded_for:
+            return forwarded_for.split(",")[0].strip()
+    return request.client.host if request.client else "unknown"
+
+class RateLimiter:
+    """
+    A named limit. Use an instance as a dependency to limit by client IP,
+    or call check(key) to limit by something else, such as an account email.
+    """
+
+    def __init__(self, name: str, limit: str, backend=None):
+        self.name = name
+        self.limit = RateLimit.parse(limit)
+        self._backend = backend
+
+    def check(self, key: str) -> None:
+        """Raises 429 with Retry-After when the bucket for `key` is empty."""
+        if not settings.RATE_LIMIT_ENABLED:
+            return
+        backend = self._backend or get_backend()
+        try:
+            retry_after = backend.take(f"{self.name}:{key}", self.limit)
+        except Exception as e:
+            # Fail open: an unavailable shared backend should not lock everyone out
+            print(f"WARNING: Rate limit check '{self.name}' failed, allowing request: {e}")
+            return
+        if retry_after > 0:
+            raise HTTPException(
+                status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+                detail="Too many requests. Please try again later.",
+                headers={"Retry-After": str(max(1, math.ceil(retry_after)))},
+            )
+
+    def __call__(self, request: Request) -> None:
+        self.check(client_ip(request))
@@ -0,0 +1,155 @@
+# /shecodes-backend/core/response_cache.py
+
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from starlette.datastructures import Headers, MutableHeaders
+
+from core.cache import TTLCache
+from core.compression import compress, negotiate_encoding, set_encoded_body_headers, should_compress
+
+@dataclass
+class CachedResponse:
+    """A complete response body plus its compressed variants, created on first request per encoding."""
+    status: int
+    headers: List[Tuple[bytes, bytes]]
+    body: bytes
+    # Route matched when the response was produced; set on hits so metrics keep their route label
+    route: Any = None
+    variants: Dict[str, bytes] = field(default_factory=dict)
+    lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def encoded(self, encoding: Optional[str], minimum_size: int) -> Tuple[Optional[str], bytes]:
+        if encoding is None or not should_compress(Headers(raw=self.headers), len(self.body), minimum_size):
+            return None, self.body
+        with self.lock:
+            if encoding not in self.variants:
+                self.variants[encoding] = compress(self.body, encoding, cached=True)
+            return encoding, self.variants[encoding]
+
+class ResponseCacheMiddleware:
+    """
+    ASGI middleware caching anonymous GET responses under the given path prefixes.
+
+    Only requests without an Authorization header are cached, so per-user responses never leak.
+    The cached entry keeps the uncompressed body and each compressed variant it has served,
+    so hot payloads are compressed once instead of on every request. A successful write
+    (POST/PUT/PATCH/DELETE) under a prefix drops the cached entries of that prefix and of the
+    prefixes listed for it in `invalidates`, e.g. mentor changes also drop cached event lists.
+    Caches are per worker; main.py also evicts entries on the crud changes published through
+    core.invalidation, which reach the other workers with INVALIDATION_BACKEND=postgres.
+    """
+
+    def __init__(self, app, cache: TTLCache, prefixes: Sequence[str],
+                 invalidates: Optional[Dict[str, Sequence[str]]] = None, minimum_size: int = 1024):
+        self.app = app
+        self.cache = cache
+        self.prefixes = tuple(prefixes)
+        self.invalidates = invalidates or {}
+        self.minimum_size = minimum_size
+
+    def _prefix_for(self, path: str) -> Optional[str]:
+        for prefix in self.prefixes:
+            if path == prefix or path.startswith(prefix + "/"):
+                return prefix
+        return None
+
+    def invalidate(self, prefix: str) -> None:
+        prefixes = {prefix, *self.invalidates.get(prefix, ())}
+        self.cache.delete_matching(lambda key: key[0] in prefixes)
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        prefix = self._prefix_for(scope["path"])
+        if prefix is None:
+            await self.app(scope, receive, send)
+            return
+
+        headers = Headers(scope=scope)
+        if scope["method"] == "GET" and "authorization" not in headers:
+            await self._cached_get(prefix, scope, receive, send, headers)
+        elif scope["method"] in ("POST", "PUT", "PATCH", "DELETE"):
+            await self._write(prefix, scope, receive, send)
+        else:
+            await self.app(scope, receive, send)
+
+    async def _cached_get(self, prefix, scope, receive, send, headers):
+        key = (prefix, scope["path"], scope.get("query_string", b""))
+        encoding = negotiate_encoding(headers.get("accept-encoding"))
+        entry = self.cache.get(key)
+        if entry is not None:
+            if entry.route is not None:
+                scope["route"] = entry.route
+            await self._send_cached(entry, encoding, send, "HIT")
+            return
+
+        # Ask for the identity body; this middleware does the compression and keeps the variants
+        upstream_scope = dict(scope)
+        upstream_scope["headers"] = [(k, v) for k, v in scope["headers"] if k != b"accept-encoding"]
+        start_message = None
+        body_parts = []
+        passthrough = False
+
+        async def send_wrapper(message):
+            nonlocal start_message, passthrough
+            if passthrough:
+                await send(message)
+            elif message["type"] == "http.response.start":
+                start_message = message
+            elif message["type"] == "http.response.body":
+                body_parts.append(message.get("body", b""))
+                if message.get("more_body", False):
+                    # Streaming responses are not cached; pass the rest on as it comes
+                    passthrough = True
+                    await send(start_message)
+                    await send({"type": "http.response.body", "body": b"".join(body_parts), "more_body": True})
+
+        try:
+            await self.app(upstream_scope, receive, send_wrapper)
+        finally:
+            # The router records the matched route on the scope it was given; outer middleware read it from ours
+            if "route" in upstream_scope:
+                scope["route"] = upstream_scope["route"]
+        if passthrough or start_message is None:
+            return
+
+        response = CachedResponse(
+            start_message["status"], list(start_message["headers"]), b"".join(body_parts), scope.get("route")
+        )
+        response_headers = Headers(raw=response.headers)
+        cacheable = (
+            response.status == 200
+            and "set-cookie" not in response_headers
+            and "no-store" not in response_headers.get("cache-control", "")
+        )
+        if cacheable:
+            self.cache.set(key, response)
+        await self._send_cached(response, encoding, send, "MISS" if cacheable else None)
+
+    async def _send_cached(self, entry: CachedResponse, encoding, send, cache_status):
+        used_encoding, body = entry.encoded(encoding, self.minimum_size)
+        start_message = {"type": "http.response.start", "status": entry.status, "headers": list(entry.headers)}
+        headers = MutableHeaders(scope=start_message)
+        set_encoded_body_headers(headers, used_encoding, len(body))
+        if cache_status:
+            headers["X-Cache"] = cache_status
+        await send(start_message)
+        await send({"type": "http.response.body", "body": body})
+
+    async def _write(self, prefix, scope, receive, send):
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            if status_code < 400:
+                self.invalidate(prefix)
@@ -0,0 +1,280 @@
+# /shecodes-backend/core/snapshots.py
+"""
+Exports the public content lists as static, versioned, precompressed JSON files.
+
+Each snapshot is the full list rendered with the same response schema as its API route,
+written as <name>.<version>.json plus .json.gz (and .json.br when brotli is installed).
+The version is a hash of the content, so unchanged lists keep their file names and
+files can be cached forever; manifest.json maps each name to its current file and
+is the only file that should be served with a short cache lifetime.
+
+Usage (from the shecodes-backend directory):
+
+    python -m core.snapshots                  # export everything into SNAPSHOT_DIR
+    python -m core.snapshots faqs events      # only these snapshots
+    python -m core.snapshots --out /tmp/site  # somewhere else
+
+With SNAPSHOT_ON_WRITE enabled, successful writes to the public routers re-export the
+affected snapshots in the background, debounced by SNAPSHOT_DEBOUNCE_SECONDS.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import threading
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Dict, Iterable, List, Optional, Sequence
+
+from pydantic import TypeAdapter
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session, selectinload
+
+from core.compression import compress, supported_encodings
+from core.config import settings
+from database import SessionLocal
+from models import (
+    alumni as alumni_model,
+    blog as blog_model,
+    champion as champion_model,
+    contact as contact_model,
+    documentation as doc_model,
+    event as event_model,
+    faq as faq_model,
+    mentor as mentor_model,
+    partner as partner_model,
+)
+from schemas import (
+    alumni as alumni_schema,
+    blog as blog_schema,
+    champion as champion_schema,
+    contact as contact_schema,
+    documentation as doc_schema,
+    event as event_schema,
+    faq as faq_schema,
+    mentor as mentor_schema,
+    partner as partner_schema,
+)
+
+SNAPSHOT_LOCK_ID = 4_610_200_003 # pg advisory lock, see migrations.MIGRATION_LOCK_ID
+MANIFEST = "manifest.json"
+EXTENSIONS = {"gzip": ".gz", "br": ".br"}
+
+@dataclass
+class SnapshotSpec:
+    name: str
+    model: type
+    schema: type
+    # Adds filters, ordering and eager loading to the base query
+    refine: Callable = lambda query, model: query.order_by(model.id)
+    adapter: TypeAdapter = field(init=False)
+
+    def __post_init__(self):
+        self.adapter = TypeAdapter(List[self.schema])
+
+    def render(self, db: Session) -> bytes:
+        items = self.refine(db.query(self.model), self.model).all()
+        return self.adapter.dump_json(self.adapter.validate_python(items, from_attributes=True), by_alias=True)
+
+def _published_blogs(query, BlogArticle):
+    return query.filter(BlogArticle.published_at <= func.now()).order_by(BlogArticle.published_at.desc(), BlogArticle.id)
+
+def _events_with_relations(query, Event):
+    return query.options(
+        selectinload(Event.mentors),
+        selectinload(Event.skills),
+        selectinload(Event.benefits),
+        selectinload(Event.sessions),
+    ).order_by(Event.start_date, Event.id)
+
+SNAPSHOTS: Dict[str, SnapshotSpec] = {spec.name: spec for spec in [
+    SnapshotSpec("faqs", faq_model.FAQItem, faq_schema.FAQItemResponse),
+    SnapshotSpec("contacts", contact_model.ContactCardInfo, contact_schema.ContactCardInfoResponse),
+    SnapshotSpec("partners", partner_model.Partner, partner_schema.PartnerResponse),
+    SnapshotSpec("champions", champion_model.Champion, champion_schema.ChampionResponse),
+    SnapshotSpec("documentations", doc_model.Documentation, doc_schema.DocumentationResponse),
+    SnapshotSpec("mentors", mentor_model.Mentor, mentor_schema.MentorResponse),
+    SnapshotSpec("alumni", alumni_model.Alumni, alumni_schema.AlumniResponse),
+    SnapshotSpec("blogs", blog_model.BlogArticle, blog_schema.BlogArticleResponse, refine=_published_blogs),
+    SnapshotSpec("events", event_model.Event, event_schema.EventResponse, refine=_events_with_relations),
+]}
+
+# Route prefix -> snapshots that a write under it can change (events embed their mentors)
+SNAPSHOTS_BY_PREFIX: Dict[str, List[str]] = {
+    "/faqs": ["faqs"],
+    "/contacts": ["contacts"],
+    "/partners": ["partners"],
+    "/champions": ["champions"],
+    "/documentations": ["documentations"],
+    "/mentors": ["mentors", "events"],
+    "/alumni": ["alumni"],
+    "/blogs": ["blogs"],
+    "/events": ["events"],
+}
+
+def _write_atomic(path: Path, content: bytes) -> None:
+    tmp_path = path.with_name(f".{path.name}.tmp")
+    tmp_path.write_bytes(content)
+    os.replace(tmp_path, path)
+
+def _write_or_touch(path: Path, render: Callable[[], bytes]) -> None:
+    """Writes a new version file, or marks an existing one as just used so pruning keeps it."""
+    if path.exists():
+        os.utime(path)
+    else:
+        _write_atomic(path, render())
+
+def _prune(out_dir: Path, name: str, keep: int, current: str) -> None:
+    """
+    Removes all but the `keep` most recently exported versions of a snapshot; older manifests
+    may still point at them. The `current` file is never removed, whatever its age.
+    """
+    versions = sorted(out_dir.glob(f"{name}.*.json"), key=lambda path: path.stat().st_mtime, reverse=True)
+    for path in versions[keep:]:
+        if path.name == current:
+            continue
+        for suffix in ["", *EXTENSIONS.values()]:
+            Path(f"{path}{suffix}").unlink(missing_ok=True)
+
+def export_snapshots(
+    names: Optional[Iterable[str]] = None,
+    out_dir: Optional[Path] = None,
+    keep_versions: Optional[int] = None,
+) -> dict:
+    """
+    Renders the given snapshots (all by default) into `out_dir` and updates the manifest.
+    Exports are serialized across workers with an advisory lock, so concurrent
+    exports cannot overwrite each other's manifest entries. Returns the manifest.
+    """
+    names = list(names or SNAPSHOTS)
+    unknown = sorted(set(names) - set(SNAPSHOTS))
+    if unknown:
+        raise ValueError(f"Unknown snapshot(s): {', '.join(unknown)}")
+    out_dir = Path(out_dir or settings.SNAPSHOT_DIR)
+    keep_versions = keep_versions or settings.SNAPSHOT_KEEP_VERSIONS
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    db = SessionLocal()
+    try:
+        db.execute(select(func.pg_advisory_xact_lock(SNAPSHOT_LOCK_ID)))
+        manifest_path = out_dir / MANIFEST
+        manifest = json.loads(manifest_path.read_text()) if manifest_path.exists() else {"snapshots": {}}
+
+        for name in names:
+            body = SNAPSHOTS[name].render(db)
+            version = hashlib.sha256(body).hexdigest()[:12]
+            file_name = f"{name}.{version}.json"
+            entry = {"version": version, "file": file_name, "bytes": len(body), "encodings": {}}
+            # A list can change back to an earlier version, whose files then already exist
+            _write_or_touch(out_dir / file_name, lambda: body)
+            for encoding in supported_encodings():
+                encoded_name = file_name + EXTENSIONS[encoding]
+                _write_or_touch(out_dir / encoded_name, lambda: compress(body, encoding, cached=True))
+                entry["encodings"][encoding] = {"file": encoded_name, "bytes": (out_dir / encoded_name).stat().st_size}
+            previous = manifest["snapshots"].get(name, {})
+            entry["updated_at"] = (
+                previous["updated_at"] if previous.get("version") == version
+                else datetime.now(timezone.utc).isoformat(timespec="seconds")
+            )
+            manifest["snapshots"][name] = entry
+            _prune(out_dir, name, keep_versions, file_name)
+
+        manifest["generated_at"] = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        _write_atomic(manifest_path, json.dumps(manifest, indent=2).encode("utf-8"))
+        db.commit() # Releases the advisory lock
+        return manifest
+    finally:
+        db.close()
+
+class SnapshotScheduler:
+    """
+    Collects snapshot names to re-export and exports them on a background thread once no
+    new write has arrived for `debounce_seconds`, so a burst of admin edits is one export.
+    """
+
+    def __init__(self, debounce_seconds: float):
+        self.debounce_seconds = debounce_seconds
+        self._pending: set = set()
+        self._timer: Optional[threading.Timer] = None
+        self._lock = threading.Lock()
+
+    def schedule(self, names: Iterable[str]) -> None:
+        with self._lock:
+            self._pending.update(names)
+            if self._timer is not None:
+                self._timer.cancel()
+            self._timer = threading.Timer(self.debounce_seconds, self._flush)
+            self._timer.daemon = True
+            self._timer.start()
+
+    def _flush(self) -> None:
+        with self._lock:
+            names, self._pending, self._timer = self._pending, set(), None
+        if not names:
+            return
+        try:
+            export_snapshots(sorted(names))
+            print(f"Exported snapshots: {', '.join(sorted(names))}")
+        except Exception as e:
+            print(f"ERROR: Snapshot export failed for {', '.join(sorted(names))}: {e}")
+
+    def stop(self) -> None:
+        """Cancels a pending export; the next explicit export picks up the changes."""
+        with self._lock:
+            if self._timer is not None:
+                self._timer.cancel()
+                self._timer = None
+
+class SnapshotOnWriteMiddleware:
+    """ASGI middleware scheduling a snapshot export after successful writes under `prefixes`."""
+
+    def __init__(self, app, scheduler: SnapshotScheduler, prefixes: Dict[str, Sequence[str]] = SNAPSHOTS_BY_PREFIX):
+        self.app = app
+        self.scheduler = scheduler
+        self.prefixes = prefixes
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http" or scope["method"] not in ("POST", "PUT", "PATCH", "DELETE"):
+            await self.app(scope, receive, send)
+            return
+        names = next(
+            (names for prefix, names in self.prefixes.items()
+             if scope["path"] == prefix or scope["path"].startswith(prefix + "/")),
+            None,
+        )
+        if names is None:
+            await self.app(scope, receive, send)
+            return
+
+        status_code = 500
+
+        async def send_wrapper(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        await self.app(scope, receive, send_wrapper)
+        if status_code < 400:
+            self.scheduler.schedule(names)
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("names", nargs="*", help=f"Snapshots to export (default all: {', '.join(SNAPSHOTS)})")
+    parser.add_argument("--out", type=Path, help=f"Output directory (default SNAPSHOT_DIR, {settings.SNAPSHOT_DIR})")
+    parser.add_argument("--keep", type=int, help="Versions to keep per snapshot (default SNAPSHOT_KEEP_VERSIONS)")
+    args = parser.parse_args()
+
+    from migrations import import_models
+    import_models() # Relationships of the exported models refer to every other model
+
+    manifest = export_snapshots(args.names or None, out_dir=args.out, keep_versions=args.keep)
+    for name in args.names or SNAPSHOTS:
+        entry = manifest["snapshots"][name]
+        sizes = ", ".join(f"{encoding} {info['bytes']:,}" for encoding, info in entry["encodings"].items())
+        print(f"{name:<16}{entry['file']:<36}{entry['bytes']:>12,} bytes ({sizes})")
+
+if __name__ == "__main__":
+    main()
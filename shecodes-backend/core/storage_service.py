@@ -2,8 +2,12 @@
 
 import uuid
 import mimetypes
+from typing import Optional
 from urllib.parse import urlparse
 from fastapi import UploadFile, HTTPException, status
+from pydantic import BaseModel
+from sqlalchemy.orm import Session
+from core.jobs import PermanentJobError, enqueue, job_handler
 from core.supabase_client import get_supabase_client
 
 # The name of the public bucket you created in the Supabase dashboard.
@@ -13,19 +17,24 @@ def upload_file_to_supabase(file: UploadFile, bucket_name: str = BUCKET_NAME) ->
     """
     Uploads a file to a specified Supabase storage bucket and returns its public URL.
     """
+    return upload_bytes_to_supabase(file.file.read(), file.content_type, bucket_name=bucket_name)
+
+def upload_bytes_to_supabase(file_content: bytes, content_type: str, bucket_name: str = BUCKET_NAME) -> str:
+    """
+    Uploads raw bytes to a specified Supabase storage bucket and returns its public URL.
+    Used when the content does not come from an UploadFile (e.g. entries of an archive).
+    """
     supabase = get_supabase_client()
     
     try:
-        file_ext = mimetypes.guess_extension(file.content_type) or '.tmp'
+        file_ext = mimetypes.guess_extension(content_type) or '.tmp'
         # The path inside the bucket. We'll add a 'public/' prefix for organization.
         file_path_in_bucket = f"public/{uuid.uuid4()}{file_ext}"
 
-        file_content = file.file.read()
-
         supabase.storage.from_(bucket_name).upload(
             path=file_path_in_bucket,
             file=file_content,
-            file_options={"content-type": file.content_type}
+            file_options={"content-type": content_type}
         )
         
         public_url = supabase.storage.from_(bucket_name).get_public_url(file_path_in_bucket)
@@ -38,6 +47,17 @@ def upload_file_to_supabase(file: UploadFile, bucket_name: str = BUCKET_NAME) ->
             detail="Error uploading file to cloud storage."
         )
 
+def _path_in_bucket(file_url: str, bucket_name: str) -> Optional[str]:
+    # Parse the URL to extract the path of the file in the bucket.
+    # e.g., from "https://<...>.supabase.co/storage/v1/object/public/images/public/uuid.jpg"
+    # we need to extract "public/uuid.jpg"
+    parsed_url = urlparse(file_url)
+    path_parts = parsed_url.path.split(f'/{bucket_name}/')
+    if len(path_parts) < 2:
+        print(f"Warning: Could not parse file path from URL: {file_url}")
+        return None
+    return path_parts[1]
+
 def delete_file_from_supabase(file_url: str, bucket_name: str = BUCKET_NAME) -> bool:
     """
     Deletes a file from Supabase storage using its full public URL.
@@ -49,17 +69,9 @@ def delete_file_from_supabase(file_url: str, bucket_name: str = BUCKET_NAME) ->
     supabase = get_supabase_client()
     
     try:
-        # Parse the URL to extract the path of the file in the bucket.
-        # e.g., from "https://<...>.supabase.co/storage/v1/object/public/images/public/uuid.jpg"
-        # we need to extract "public/uuid.jpg"
-        parsed_url = urlparse(file_url)
-        path_parts = parsed_url.path.split(f'/{bucket_name}/')
-        
-        if len(path_parts) < 2:
-            print(f"Warning: Could not parse file path from URL: {file_url}")
+        file_path_in_bucket = _path_in_bucket(file_url, bucket_name)
+        if file_path_in_bucket is None:
             return False
-
-        file_path_in_bucket = path_parts[1]
         
         # Supabase's remove function expects a list of paths
         response = supabase.storage.from_(bucket_name).remove([file_path_in_bucket])
@@ -70,4 +82,25 @@ def delete_file_from_supabase(file_url: str, bucket_name: str = BUCKET_NAME) ->
 
     except Exception as e:
         print(f"Supabase file deletion failed for URL {file_url}: {e}")
-        return False
\ No newline at end of file
+        return False
+
+class DeleteFileJob(BaseModel):
+    file_url: str
+    bucket_name: str = BUCKET_NAME
+
+@job_handler("delete_storage_file", DeleteFileJob)
+def delete_file_job(payload: DeleteFileJob) -> None:
+    """Unlike delete_file_from_supabase, raises on storage errors so that the job is retried."""
+    file_path_in_bucket = _path_in_bucket(payload.file_url, payload.bucket_name)
+    if file_path_in_bucket is None:
+        raise PermanentJobError(f"Not a file URL of bucket '{payload.bucket_name}': {payload.file_url}")
+    get_supabase_client().storage.from_(payload.bucket_name).remove([file_path_in_bucket])
+    print(f"Successfully deleted {file_path_in_bucket} from Supabase.")
+
+def schedule_file_deletion(db: Session, file_url: Optional[str], bucket_name: str = BUCKET_NAME) -> None:
+    """
+    Deletes a replaced or orphaned file in the background, with retries, instead of
+    making the request wait for the storage API. Does nothing without a URL.
+    """
+    if file_url:
+        enqueue(db, "delete_storage_file", DeleteFileJob(file_url=file_url, bucket_name=bucket_name))
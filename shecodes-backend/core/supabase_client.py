@@ -1,21 +1,33 @@
-# /shecodes-backend/core/supabase_client.py (New File)
+# /shecodes-backend/core/supabase_client.py
+
+import threading
+from typing import TYPE_CHECKING, Optional
 
-from supabase import create_client, Client
 from core.config import settings
 
-supabase_client: Client | None = None
+if TYPE_CHECKING:
+    from supabase import Client
 
-if settings.SUPABASE_URL and settings.SUPABASE_SERVICE_KEY:
-    try:
-        supabase_client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY)
-        print("Supabase client initialized successfully.")
-    except Exception as e:
-        print(f"ERROR: Failed to initialize Supabase client: {e}")
-else:
-    print("WARNING: SUPABASE_URL and SUPABASE_SERVICE_KEY are not set. Supabase integration is disabled.")
+# The supabase package is slow to import, so the client is built on first use
+# rather than when a worker boots.
+_client: Optional["Client"] = None
+_client_lock = threading.Lock()
 
-def get_supabase_client() -> Client:
-    """Dependency to get the Supabase client."""
-    if supabase_client is None:
-        raise RuntimeError("Supabase client has not been initialized. Check your .env file.")
-    return supabase_client
\ No newline at end of file
+def get_supabase_client() -> "Client":
+    """Returns the shared Supabase client, creating it on first call."""
+    global _client
+    if _client is not None:
+        return _client
+    with _client_lock:
+        if _client is None:
+            if not (settings.SUPABASE_URL and settings.SUPABASE_SERVICE_KEY):
+                print("WARNING: SUPABASE_URL and SUPABASE_SERVICE_KEY are not set. Supabase integration is disabled.")
+                raise RuntimeError("Supabase client has not been initialized. Check your .env file.")
+            from supabase import create_client
+            try:
+                _client = create_client(settings.SUPABASE_URL, settings.SUPABASE_SERVICE_KEY)
+                print("Supabase client initialized successfully.")
+            except Exception as e:
+                print(f"ERROR: Failed to initialize Supabase client: {e}")
+                raise RuntimeError("Supabase client could not be initialized. Check your .env file.") from e
+    return _client
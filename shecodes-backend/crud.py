@@ -1,9 +1,11 @@
 # /shecodes-backend/crud.py
 
-from sqlalchemy.orm import Session
-from typing import Optional, List, Type
-from sqlalchemy import or_
+from sqlalchemy.orm import Session, selectinload
+from typing import Optional, List, Type, Iterator, Dict
+from sqlalchemy import or_, and_, tuple_, func, select, insert, update, delete, exists, literal
+from sqlalchemy.dialects.postgresql import insert as pg_insert, array_agg, aggregate_order_by
 from pydantic import BaseModel
+from datetime import datetime
 
 # Import all models and schemas with aliases to prevent name conflicts
 from models import (
@@ -18,7 +20,9 @@ from models import (
     mentor as mentor_model,
     participant as participant_model,
     portfolio as portfolio_model,
-    partner as partner_model
+    partner as partner_model,
+    stats as stats_model,
+    job as job_model
 )
 from schemas import (
     user as user_schema,
@@ -32,10 +36,13 @@ from schemas import (
     mentor as mentor_schema,
     participant as participant_schema,
     portfolio as portfolio_schema,
-    partner as partner_schema
+    partner as partner_schema,
+    stats as stats_schema,
+    job as job_schema
 )
 
 from core.security import get_password_hash, verify_password
+from core.invalidation import publish_change
 
 # ===============================================
 #               User CRUD
@@ -49,6 +56,61 @@ def get_user_by_email(db: Session, email: str) -> Optional[user_model.User]:
 def get_all_users(db: Session, skip: int = 0, limit: int = 100) -> List[user_model.User]:
     return db.query(user_model.User).offset(skip).limit(limit).all()
 
+def search_users(
+    db: Session,
+    limit: int = 50,
+    cursor: Optional[tuple] = None,
+    role: Optional[user_schema.RoleEnum] = None,
+    is_verified: Optional[bool] = None,
+    search: Optional[str] = None,
+    with_participation_count: bool = False
+):
+    """
+    Returns one page of the admin user list, newest first, as rows of the `UserListItem` columns.
+
+    `cursor` is the (created_at, id) of the last user of the previous page; the order is
+    served by ix_users_created_at_id. `search` is a case-insensitive prefix of the name or
+    email, served by the lower(...) text_pattern_ops indexes. With `with_participation_count`,
+    participations of the users on the page are counted by one grouped subquery.
+    """
+    User = user_model.User
+    query = select(
+        User.id, User.email, User.name, User.role, User.is_verified,
+        User.occupation, User.profile_picture, User.created_at,
+    )
+
+    if role:
+        query = query.where(User.role == role.value)
+    if is_verified is not None:
+        query = query.where(User.is_verified == is_verified)
+    if search:
+        term = search.strip().lower()
+        query = query.where(or_(
+            func.lower(User.name).startswith(term, autoescape=True),
+            func.lower(User.email).startswith(term, autoescape=True),
+        ))
+    if cursor:
+        last_created_at, last_id = cursor
+        query = query.where(tuple_(User.created_at, User.id) < tuple_(last_created_at, last_id))
+    query = query.order_by(User.created_at.desc(), User.id.desc()).limit(limit)
+
+    if not with_participation_count:
+        return db.execute(query).all()
+
+    page = query.subquery()
+    Participant = participant_model.Participant
+    counts = (
+        select(Participant.member_id, func.count().label("participation_count"))
+        .where(Participant.member_id.in_(select(page.c.id)))
+        .group_by(Participant.member_id)
+        .subquery()
+    )
+    return db.execute(
+        select(page, func.coalesce(counts.c.participation_count, 0).label("participation_count"))
+        .outerjoin(counts, counts.c.member_id == page.c.id)
+        .order_by(page.c.created_at.desc(), page.c.id.desc())
+    ).all()
+
 def create_user(db: Session, user: user_schema.UserCreate) -> user_model.User:
     """Creates a new user in the database with a hashed password."""
     hashed_password = get_password_hash(user.password)
@@ -64,6 +126,7 @@ def create_user(db: Session, user: user_schema.UserCreate) -> user_model.User:
     db.add(db_user)
     db.commit()
     db.refresh(db_user)
+    publish_change("users", db_user.id)
     return db_user
 
 def update_user(db: Session, db_user: user_model.User, user_in: user_schema.UserUpdate) -> user_model.User:
@@ -86,12 +149,14 @@ def activate_user(db: Session, user: user_model.User) -> user_model.User:
     user.is_verified = True
     db.commit()
     db.refresh(user)
+    publish_change("users", user.id)
     return user
 
 def update_user_password(db: Session, user: user_model.User, new_password: str) -> user_model.User:
     user.password = get_password_hash(new_password)
     db.commit()
     db.refresh(user)
+    publish_change("users", user.id)
     return user
 
 # ===============================================
@@ -109,6 +174,7 @@ def create_alumni(db: Session, alumni: alumni_schema.AlumniCreate) -> alumni_mod
     db.add(db_alumni)
     db.commit()
     db.refresh(db_alumni)
+    publish_change("alumni", db_alumni.id)
     return db_alumni
     
 def update_alumni(db: Session, db_alumni: alumni_model.Alumni, alumni_in: alumni_schema.AlumniUpdate) -> alumni_model.Alumni:
@@ -118,6 +184,7 @@ def update_alumni(db: Session, db_alumni: alumni_model.Alumni, alumni_in: alumni
     db.add(db_alumni)
     db.commit()
     db.refresh(db_alumni)
+    publish_change("alumni", db_alumni.id)
     return db_alumni
 
 def delete_alumni(db: Session, alumni_id: int) -> Optional[alumni_model.Alumni]:
@@ -125,6 +192,7 @@ def delete_alumni(db: Session, alumni_id: int) -> Optional[alumni_model.Alumni]:
     if db_alumni:
         db.delete(db_alumni)
         db.commit()
+        publish_change("alumni", alumni_id)
     return db_alumni
 
 # ===============================================
@@ -173,6 +241,7 @@ def create_blog(db: Session, blog: blog_schema.BlogArticleCreate) -> blog_model.
     db.add(db_blog)
     db.commit()
     db.refresh(db_blog)
+    publish_change("blog_articles", db_blog.id)
     return db_blog
 
 def update_blog(db: Session, db_blog: blog_model.BlogArticle, blog_in: blog_schema.BlogArticleUpdate) -> blog_model.BlogArticle:
@@ -182,6 +251,7 @@ def update_blog(db: Session, db_blog: blog_model.BlogArticle, blog_in: blog_sche
     db.add(db_blog)
     db.commit()
     db.refresh(db_blog)
+    publish_change("blog_articles", db_blog.id)
     return db_blog
 
 def delete_blog(db: Session, blog_id: str) -> Optional[blog_model.BlogArticle]:
@@ -189,6 +259,7 @@ def delete_blog(db: Session, blog_id: str) -> Optional[blog_model.BlogArticle]:
     if db_blog:
         db.delete(db_blog)
         db.commit()
+        publish_change("blog_articles", db_blog.id)
     return db_blog
 
 # ===============================================
@@ -212,35 +283,86 @@ def get_comments_by_discussion(db: Session, discussion_id: str) -> List[comment_
             comment_model.Comment.discussion_id == discussion_id
         ).order_by(comment_model.Comment.date.desc()).all()
 
+def get_comment_counts(db: Session, discussion_ids: List[str]) -> Dict[str, tuple]:
+    """
+    Returns {discussion_id: (comment_count, reply_count)} for the given discussions with
+    one grouped query over ix_comments_discussion_id_date. Discussions without comments are
+    missing from the result. `comment_count` counts top-level comments, `reply_count` replies.
+    """
+    Comment = comment_model.Comment
+    rows = db.execute(
+        select(
+            Comment.discussion_id,
+            func.count().filter(Comment.parent_id.is_(None)),
+            func.count().filter(Comment.parent_id.isnot(None)),
+        )
+        .where(Comment.discussion_id.in_(discussion_ids))
+        .group_by(Comment.discussion_id)
+    ).all()
+    return {discussion_id: (comments, replies) for discussion_id, comments, replies in rows}
+
 def create_comment(db: Session, comment: comment_schema.CommentCreate) -> comment_model.Comment:
     db_comment = comment_model.Comment(**comment.model_dump())
     db.add(db_comment)
     db.commit()
     db.refresh(db_comment)
+    publish_change("comments", db_comment.id, discussion_id=db_comment.discussion_id)
     return db_comment
 
-def toggle_comment_like(db: Session, comment_id: int, user_id: str) -> Optional[comment_model.Comment]:
+def toggle_comment_like(db: Session, comment_id: int, user_id: str) -> Optional[dict]:
     """
-    Adds a like if it doesn't exist, or removes it if it does.
-    Returns the updated comment object.
+    Likes the comment if the user has not liked it yet, otherwise removes the like, in one
+    statement: a DELETE and an INSERT ... WHERE NOT EXISTS (deleted) as CTEs, plus the new count.
+    Returns None if the comment does not exist, otherwise a dict with `discussion_id`,
+    `parent_id`, `liked` and `like_count` after the toggle.
+
+    Concurrent toggles of the same like (e.g. a double click) are serialized by a transaction
+    advisory lock on (comment_id, user_id), taken before the statement so that its snapshot
+    already includes the previous toggle. Toggles of different users do not wait for each other.
     """
-    like = db.query(comment_model.CommentLike).filter(
-        comment_model.CommentLike.comment_id == comment_id,
-        comment_model.CommentLike.user_id == user_id
-    ).first()
-
-    if like:
-        # User has already liked it, so unlike (delete the record)
-        db.delete(like)
-        db.commit()
-    else:
-        # User has not liked it, so like (create the record)
-        new_like = comment_model.CommentLike(comment_id=comment_id, user_id=user_id)
-        db.add(new_like)
-        db.commit()
-
-    # Return the updated comment to get the new like count
-    return get_comment(db, comment_id)
+    Comment, CommentLike = comment_model.Comment, comment_model.CommentLike
+
+    target = select(Comment.id, Comment.discussion_id, Comment.parent_id).where(Comment.id == comment_id).cte("target")
+    removed = (
+        delete(CommentLike)
+        .where(CommentLike.comment_id == comment_id, CommentLike.user_id == user_id)
+        .returning(CommentLike.comment_id)
+        .cte("removed")
+    )
+    added = (
+        pg_insert(CommentLike)
+        .from_select(
+            ["user_id", "comment_id"],
+            select(literal(user_id), target.c.id).where(~exists(select(removed.c.comment_id)))
+        )
+        .on_conflict_do_nothing()
+        .returning(CommentLike.comment_id)
+        .cte("added")
+    )
+    num_removed = select(func.count()).select_from(removed).scalar_subquery()
+    num_added = select(func.count()).select_from(added).scalar_subquery()
+    # All CTEs see the same snapshot, so the count is from before the toggle; adjust it
+    count_before = select(func.count()).select_from(CommentLike).where(CommentLike.comment_id == target.c.id).scalar_subquery()
+    statement = select(
+        target.c.discussion_id,
+        target.c.parent_id,
+        num_added.label("added"),
+        (count_before - num_removed + num_added).label("like_count"),
+    ).select_from(target)
+
+    db.execute(select(func.pg_advisory_xact_lock(comment_id, func.hashtext(user_id))))
+    row = db.execute(statement).one_or_none()
+    if row is None:
+        db.rollback()
+        return None
+    db.commit() # Also releases the advisory lock
+    publish_change("comment_likes", comment_id, user_id=user_id)
+    return {
+        "discussion_id": row.discussion_id,
+        "parent_id": row.parent_id,
+        "liked": bool(row.added),
+        "like_count": row.like_count,
+    }
 
 def get_liked_comment_ids_by_user(db: Session, user_id: str) -> List[int]:
     """
@@ -255,8 +377,10 @@ def get_liked_comment_ids_by_user(db: Session, user_id: str) -> List[int]:
 def delete_comment(db: Session, comment_id: int) -> Optional[comment_model.Comment]:
     db_comment = get_comment(db, comment_id)
     if db_comment:
+        discussion_id = db_comment.discussion_id
         db.delete(db_comment)
         db.commit()
+        publish_change("comments", comment_id, discussion_id=discussion_id)
     return db_comment
 
 # ===============================================
@@ -274,6 +398,7 @@ def create_generic_item(db: Session, model, schema):
     db.add(db_item)
     db.commit()
     db.refresh(db_item)
+    publish_change(model.__tablename__, db_item.id)
     return db_item
 
 def update_generic_item(db: Session, db_item, schema_in):
@@ -283,6 +408,7 @@ def update_generic_item(db: Session, db_item, schema_in):
     db.add(db_item)
     db.commit()
     db.refresh(db_item)
+    publish_change(db_item.__tablename__, db_item.id)
     return db_item
 
 def delete_generic_item(db: Session, model, item_id):
@@ -290,8 +416,61 @@ def delete_generic_item(db: Session, model, item_id):
     if db_item:
         db.delete(db_item)
         db.commit()
+        publish_change(model.__tablename__, item_id)
     return db_item
     
+# ===============================================
+#               Mentor Directory
+# ===============================================
+
+def get_mentor_directory(
+    db: Session,
+    status: Optional[str] = None,
+    skip: int = 0,
+    limit: int = 100
+) -> List[mentor_schema.MentorDirectoryEntry]:
+    """
+    Lists mentors with event statistics computed by one grouped query over
+    event_mentor_association: total events mentored, upcoming events, and the
+    id/title/start of the next upcoming event (first element of an array_agg
+    ordered by start date).
+    """
+    Mentor = mentor_model.Mentor
+    Event = event_model.Event
+    association = event_model.event_mentor_association
+    is_upcoming = Event.start_date > datetime.utcnow()
+
+    def first_upcoming(column):
+        return array_agg(aggregate_order_by(column, Event.start_date.asc())).filter(is_upcoming)[1]
+
+    query = (
+        db.query(
+            Mentor,
+            func.count(Event.id).label("events_mentored"),
+            func.count(Event.id).filter(is_upcoming).label("upcoming_events"),
+            first_upcoming(Event.id).label("next_event_id"),
+            first_upcoming(Event.title).label("next_event_title"),
+            func.min(Event.start_date).filter(is_upcoming).label("next_event_start"),
+        )
+        .outerjoin(association, association.c.mentor_id == Mentor.id)
+        .outerjoin(Event, Event.id == association.c.event_id)
+    )
+    if status:
+        query = query.filter(Mentor.status == status)
+
+    rows = query.group_by(Mentor.id).order_by(Mentor.id).offset(skip).limit(limit).all()
+    return [
+        mentor_schema.MentorDirectoryEntry(
+            **mentor_schema.MentorResponse.model_validate(row.Mentor).model_dump(),
+            events_mentored=row.events_mentored,
+            upcoming_events=row.upcoming_events,
+            next_event_id=row.next_event_id,
+            next_event_title=row.next_event_title,
+            next_event_start=row.next_event_start,
+        )
+        for row in rows
+    ]
+
 # ===============================================
 #               Event CRUD (Complex)
 # ===============================================
@@ -299,15 +478,116 @@ def delete_generic_item(db: Session, model, item_id):
 def get_event(db: Session, event_id: int) -> Optional[event_model.Event]:
     return db.query(event_model.Event).filter(event_model.Event.id == event_id).first()
 
-def get_all_events(db: Session, skip: int = 0, limit: int = 100) -> List[event_model.Event]:
-    return db.query(event_model.Event).offset(skip).limit(limit).all()
+def _event_status_filter(status: str, now: datetime):
+    """
+    Expresses a derived status as plain range predicates on start_date/end_date
+    so the filter can use the B-tree indexes on those columns.
+    """
+    Event = event_model.Event
+    if status == "upcoming":
+        return Event.start_date > now
+    if status == "past":
+        return Event.end_date < now
+    return and_(Event.start_date <= now, Event.end_date >= now)
+
+def get_all_events(
+    db: Session,
+    skip: int = 0,
+    limit: int = 100,
+    status: Optional[event_schema.EventStatusEnum] = None
+) -> List[event_model.Event]:
+    query = db.query(event_model.Event)
+    if status:
+        query = query.filter(_event_status_filter(status.value, datetime.utcnow()))
+    return query.offset(skip).limit(limit).all()
+
+def event_search_query(
+    db: Session,
+    cursor: Optional[tuple] = None,
+    event_type: Optional[event_schema.EventTypeEnum] = None,
+    start_from: Optional[datetime] = None,
+    start_to: Optional[datetime] = None,
+    tags: Optional[List[str]] = None,
+    mentor_id: Optional[int] = None,
+    location: Optional[str] = None,
+    status: Optional[event_schema.EventStatusEnum] = None
+):
+    """
+    Builds the filtered event query used by `search_events`, ordered by (start_date, id).
+
+    `cursor` is the (start_date, id) of the last event of the previous page. Each filter
+    maps onto an index: event_type and the date range onto B-tree indexes, tags onto
+    the GIN index via JSONB containment, and mentor_id onto the association table.
+    """
+    Event = event_model.Event
+    query = db.query(Event)
+
+    if event_type:
+        query = query.filter(Event.event_type == event_type.value)
+    if start_from:
+        query = query.filter(Event.start_date >= start_from)
+    if start_to:
+        query = query.filter(Event.start_date <= start_to)
+    if tags:
+        query = query.filter(Event.tags.contains(tags))
+    if mentor_id is not None:
+        association = event_model.event_mentor_association
+        query = query.filter(Event.id.in_(
+            select(association.c.event_id).where(association.c.mentor_id == mentor_id)
+        ))
+    if location:
+        query = query.filter(Event.location.icontains(location, autoescape=True))
+    if status:
+        query = query.filter(_event_status_filter(status.value, datetime.utcnow()))
+    if cursor:
+        last_start_date, last_id = cursor
+        query = query.filter(tuple_(Event.start_date, Event.id) > tuple_(last_start_date, last_id))
+
+    return query.order_by(Event.start_date, Event.id)
+
+def search_events(db: Session, limit: int = 20, **filters) -> List[event_model.Event]:
+    """
+    Returns one keyset-paginated page of events matching `filters` (see `event_search_query`).
+    Related collections are loaded with one SELECT ... IN per relationship per page.
+    """
+    Event = event_model.Event
+    return (
+        event_search_query(db, **filters)
+        .options(
+            selectinload(Event.mentors),
+            selectinload(Event.skills),
+            selectinload(Event.benefits),
+            selectinload(Event.sessions),
+        )
+        .limit(limit)
+        .all()
+    )
+
+def reconcile_event_statuses(db: Session) -> int:
+    """
+    Rewrites the stored `status` column of every event whose value has drifted
+    from the one derived from its dates, in a single bulk UPDATE.
+    Returns the number of events that were corrected.
+    """
+    Event = event_model.Event
+    derived_status = Event.current_status
+    num_updated = (
+        db.query(Event)
+        .filter(Event.status != derived_status)
+        .update({Event.status: derived_status}, synchronize_session=False)
+    )
+    db.commit()
+    if num_updated:
+        publish_change("events")
+    return num_updated
 
 def create_event(db: Session, event_data: event_schema.EventCreate) -> event_model.Event:
     # Separate relational data from the main event data
     event_base_data = event_data.model_dump(exclude={'mentors', 'skills', 'benefits', 'sessions'})
     
-    # Create the main event object
+    # Create the main event object; the stored status always follows the dates
     new_event = event_model.Event(**event_base_data)
+    new_event.status = event_model.status_for(new_event.start_date, new_event.end_date)
     
     # Fetch and associate existing mentors
     if event_data.mentors:
@@ -327,48 +607,83 @@ def create_event(db: Session, event_data: event_schema.EventCreate) -> event_mod
     db.add(new_event)
     db.commit()
     db.refresh(new_event)
+    publish_change("events", new_event.id)
     return new_event
 
-def _update_one_to_many_relationship(
+def _sync_event_children(
     db: Session,
-    db_collection: List[Type[BaseModel]],
+    event_id: int,
     incoming_data: List[BaseModel],
     model_class: Type[event_model.Base] # type: ignore
 ):
     """
-    Synchronizes a one-to-many database collection with incoming data.
+    Synchronizes an event's one-to-many child rows (skills, benefits, sessions) with incoming data.
 
-    - Deletes items from the database that are not in the incoming data.
-    - Updates items that are in both the database and incoming data.
-    - Creates new items from the incoming data that are not in the database.
+    The current rows are read with one SELECT and diffed against the payload once, then:
+    - rows missing from the payload are removed with one bulk DELETE,
+    - rows whose values changed are written with one bulk UPDATE (by primary key),
+    - items without an id are created with one multi-row INSERT.
+    Unchanged rows are left alone, and ids that do not belong to the event are ignored.
 
     Args:
         db: The database session.
-        db_collection: The SQLAlchemy relationship collection from the parent object (e.g., db_event.skills).
+        event_id: The parent event's ID.
         incoming_data: The list of Pydantic models from the request.
         model_class: The SQLAlchemy model class for the items (e.g., event_model.Skill).
     """
-    db_items_map = {item.id: item for item in db_collection}
+    table = model_class.__table__
+    existing_rows = {
+        row.id: row for row in db.execute(select(table).where(table.c.event_id == event_id)).mappings()
+    }
     incoming_ids = {item.id for item in incoming_data if item.id is not None}
 
-    # 1. Delete: Find items in the DB that are not in the incoming data
-    ids_to_delete = db_items_map.keys() - incoming_ids
-    for id_to_delete in ids_to_delete:
-        db.delete(db_items_map[id_to_delete])
-
-    # 2. Update and Create
+    to_delete = existing_rows.keys() - incoming_ids
+    to_update = []
+    to_insert = []
     for item_data in incoming_data:
-        item_dict = item_data.model_dump(exclude_unset=True)
-        
-        if item_data.id is not None and item_data.id in db_items_map:
-            # Update existing item
-            db_item = db_items_map[item_data.id]
-            for key, value in item_dict.items():
-                setattr(db_item, key, value)
-        elif item_data.id is None:
-            # Create new item
-            new_item = model_class(**item_dict)
-            db_collection.append(new_item)
+        item_dict = item_data.model_dump(exclude={"id"})
+        if item_data.id is None:
+            to_insert.append({**item_dict, "event_id": event_id})
+        elif item_data.id in existing_rows:
+            current = existing_rows[item_data.id]
+            if any(current[key] != value for key, value in item_dict.items()):
+                to_update.append({**item_dict, "id": item_data.id})
+
+    if to_delete:
+        db.execute(
+            delete(model_class).where(model_class.id.in_(to_delete)),
+            execution_options={"synchronize_session": False}
+        )
+    if to_update:
+        db.execute(update(model_class), to_update)
+    if to_insert:
+        db.execute(insert(model_class).values(to_insert))
+
+def _sync_event_mentors(db: Session, event_id: int, mentor_ids: List[int]):
+    """
+    Synchronizes the event/mentor association by inserting and deleting only the
+    rows that differ, instead of clearing and re-adding every mentor.
+    Unknown mentor IDs are ignored.
+    """
+    association = event_model.event_mentor_association
+    current_ids = set(db.scalars(
+        select(association.c.mentor_id).where(association.c.event_id == event_id)
+    ))
+    wanted_ids = set(mentor_ids)
+    to_remove = current_ids - wanted_ids
+    to_add = wanted_ids - current_ids
+    if to_add:
+        # Only associate mentors that actually exist
+        to_add = set(db.scalars(select(mentor_model.Mentor.id).where(mentor_model.Mentor.id.in_(to_add))))
+    if to_remove:
+        db.execute(delete(association).where(
+            association.c.event_id == event_id,
+            association.c.mentor_id.in_(to_remove)
+        ))
+    if to_add:
+        db.execute(insert(association).values([
+            {"event_id": event_id, "mentor_id": mentor_id} for mentor_id in sorted(to_add)
+        ]))
 
 def update_event(db: Session, db_event: event_model.Event, event_in: event_schema.EventUpdate) -> event_model.Event:
     # 1. Get update data, excluding relationships which are handled separately
@@ -380,29 +695,32 @@ def update_event(db: Session, db_event: event_model.Event, event_in: event_schem
     # 2. Update the top-level fields on the Event object
     for key, value in update_data.items():
         setattr(db_event, key, value)
+    db_event.status = event_model.status_for(db_event.start_date, db_event.end_date)
         
-    # 3. Handle relationship updates if they are provided in the payload
-    
-    # Mentors (Many-to-Many): Clear and replace
+    # 3. Handle relationship updates if they are provided in the payload.
+    # These are applied as set-based statements, so the ORM collections are
+    # not loaded; they are expired by the commit below and reloaded on access.
+
+    # Mentors (Many-to-Many): Apply only the differences
     if event_in.mentors is not None:
-        mentors = db.query(mentor_model.Mentor).filter(mentor_model.Mentor.id.in_(event_in.mentors)).all()
-        db_event.mentors = mentors
+        _sync_event_mentors(db, db_event.id, event_in.mentors)
 
     # Skills (One-to-Many): Synchronize
     if event_in.skills is not None:
-        _update_one_to_many_relationship(db, db_event.skills, event_in.skills, event_model.Skill)
+        _sync_event_children(db, db_event.id, event_in.skills, event_model.Skill)
 
     # Benefits (One-to-Many): Synchronize
     if event_in.benefits is not None:
-        _update_one_to_many_relationship(db, db_event.benefits, event_in.benefits, event_model.Benefit)
+        _sync_event_children(db, db_event.id, event_in.benefits, event_model.Benefit)
 
     # Sessions (One-to-Many): Synchronize
     if event_in.sessions is not None:
-        _update_one_to_many_relationship(db, db_event.sessions, event_in.sessions, event_model.Session)
+        _sync_event_children(db, db_event.id, event_in.sessions, event_model.Session)
 
     db.add(db_event)
     db.commit()
     db.refresh(db_event)
+    publish_change("events", db_event.id)
     return db_event
 
 def delete_event(db: Session, event_id: int) -> Optional[event_model.Event]:
@@ -410,6 +728,7 @@ def delete_event(db: Session, event_id: int) -> Optional[event_model.Event]:
     if db_event:
         db.delete(db_event)
         db.commit()
+        publish_change("events", event_id)
     return db_event
 
 # ===============================================
@@ -422,6 +741,7 @@ def create_portfolio_project(db: Session, schema: portfolio_schema.PortfolioProj
     db.add(db_item)
     db.commit()
     db.refresh(db_item)
+    publish_change("portfolio_projects", db_item.id, user_id=user_id)
     return db_item
 
 def get_portfolio_projects_by_user_id(db: Session, user_id: str, skip: int = 0, limit: int = 100) -> List[portfolio_model.PortfolioProject]:
@@ -439,6 +759,31 @@ def get_participants_by_event(db: Session, event_id: int) -> List[participant_mo
     """Fetches all participants for a specific event."""
     return db.query(participant_model.Participant).filter(participant_model.Participant.event_id == event_id).all()
 
+def iter_participant_export_rows(db: Session, event_id: int, batch_size: int = 1000) -> Iterator[tuple]:
+    """
+    Streams (id, name, email, status, registration_date, certificate_url) rows for an event.
+    Uses yield_per so rows are read through a server-side cursor in batches
+    instead of being materialized all at once.
+    """
+    Participant = participant_model.Participant
+    User = user_model.User
+    query = (
+        db.query(
+            Participant.id,
+            User.name,
+            User.email,
+            Participant.status,
+            Participant.registration_date,
+            Participant.certificate_url,
+        )
+        .join(User, Participant.member_id == User.id)
+        .filter(Participant.event_id == event_id)
+        .order_by(Participant.id)
+        .yield_per(batch_size)
+    )
+    for row in query:
+        yield tuple(row)
+
 def create_participant(db: Session, participant: participant_schema.ParticipantCreate) -> participant_model.Participant:
     """
     Creates a new participant record after validating that the event and user exist.
@@ -454,33 +799,115 @@ def create_participant(db: Session, participant: participant_schema.ParticipantC
     if not user:
         raise ValueError(f"Validation failed: User with ID {participant.member_id} not found.")
 
-    # 3. Check for duplicates: Is this user already registered for this event?
-    existing_participant = db.query(participant_model.Participant).filter(
-        participant_model.Participant.event_id == participant.event_id,
-        participant_model.Participant.member_id == participant.member_id
-    ).first()
-    if existing_participant:
+    # 3. Insert, letting the (event_id, member_id) unique constraint reject duplicates.
+    # ON CONFLICT DO NOTHING makes concurrent sign-ups race-free without a prior SELECT;
+    # an empty RETURNING means the user was already registered.
+    stmt = (
+        pg_insert(participant_model.Participant)
+        .values(
+            event_id=participant.event_id,
+            member_id=participant.member_id,
+            registration_date=participant.registration_date,
+            status=participant.status
+        )
+        .on_conflict_do_nothing(constraint="uq_participants_event_member")
+        .returning(participant_model.Participant)
+    )
+    db_participant = db.scalars(stmt).first()
+    if db_participant is None:
+        db.rollback()
         raise ValueError(f"User {user.name} is already registered for event '{event.title}'.")
 
-
-    # If all checks pass, proceed with creation
-    db_participant = participant_model.Participant(
-        event_id=participant.event_id,
-        member_id=participant.member_id,
-        registration_date=participant.registration_date,
-        status=participant.status
-    )
-    db.add(db_participant)
     db.commit()
     db.refresh(db_participant)
+    publish_change("participants", db_participant.id, event_id=db_participant.event_id)
     return db_participant
 
+def create_participants_bulk(
+    db: Session,
+    participants: List[participant_schema.ParticipantCreate]
+) -> participant_schema.ParticipantBatchResponse:
+    """
+    Registers many (event, member) pairs at once.
+
+    Event and member IDs are validated with one set-based query each, existing
+    registrations are found with a single tuple IN lookup, and every remaining
+    row is written with one multi-row INSERT. Pairs that are invalid or already
+    registered are skipped and reported back instead of failing the whole batch.
+    """
+    event_ids = {p.event_id for p in participants}
+    member_ids = {p.member_id for p in participants}
+
+    found_event_ids = {
+        row[0] for row in db.query(event_model.Event.id).filter(event_model.Event.id.in_(event_ids))
+    }
+    found_member_ids = {
+        row[0] for row in db.query(user_model.User.id).filter(user_model.User.id.in_(member_ids))
+    }
+
+    valid = [
+        p for p in participants
+        if p.event_id in found_event_ids and p.member_id in found_member_ids
+    ]
+
+    existing_pairs = set()
+    if valid:
+        pairs = {(p.event_id, p.member_id) for p in valid}
+        existing_pairs = set(
+            db.query(participant_model.Participant.event_id, participant_model.Participant.member_id)
+            .filter(tuple_(participant_model.Participant.event_id, participant_model.Participant.member_id).in_(pairs))
+            .all()
+        )
+
+    rows = []
+    duplicates = []
+    seen = set(existing_pairs)
+    for p in valid:
+        key = (p.event_id, p.member_id)
+        if key in seen:
+            duplicates.append(participant_schema.ParticipantKey(event_id=p.event_id, member_id=p.member_id))
+            continue
+        seen.add(key)
+        rows.append({
+            "event_id": p.event_id,
+            "member_id": p.member_id,
+            "registration_date": p.registration_date,
+            "status": p.status,
+        })
+
+    created = 0
+    if rows:
+        # Registrations committed concurrently since the lookup above are
+        # skipped by the unique constraint and reported as duplicates.
+        stmt = (
+            pg_insert(participant_model.Participant)
+            .values(rows)
+            .on_conflict_do_nothing(constraint="uq_participants_event_member")
+            .returning(participant_model.Participant.event_id, participant_model.Participant.member_id)
+        )
+        inserted = set(db.execute(stmt).all())
+        db.commit()
+        publish_change("participants")
+        created = len(inserted)
+        for row in rows:
+            key = (row["event_id"], row["member_id"])
+            if key not in inserted:
+                duplicates.append(participant_schema.ParticipantKey(event_id=key[0], member_id=key[1]))
+
+    return participant_schema.ParticipantBatchResponse(
+        created=created,
+        duplicates=duplicates,
+        missing_event_ids=sorted(event_ids - found_event_ids),
+        missing_member_ids=sorted(member_ids - found_member_ids),
+    )
+
 def update_participant_status(db: Session, db_participant: participant_model.Participant, status: str) -> participant_model.Participant:
     """Updates the status of a single participant."""
     db_participant.status = status
     db.add(db_participant)
     db.commit()
     db.refresh(db_participant)
+    publish_change("participants", db_participant.id, event_id=db_participant.event_id)
     return db_participant
 
 def update_participant_certificate(db: Session, db_participant: participant_model.Participant, certificate_url: str) -> participant_model.Participant:
@@ -489,12 +916,287 @@ def update_participant_certificate(db: Session, db_participant: participant_mode
     db.add(db_participant)
     db.commit()
     db.refresh(db_participant)
+    publish_change("participants", db_participant.id, event_id=db_participant.event_id)
     return db_participant
 
+def get_participant_certificate_targets(db: Session, event_id: int) -> List[tuple]:
+    """Returns (participant_id, member_email) pairs for an event, used to match uploaded files."""
+    return (
+        db.query(participant_model.Participant.id, user_model.User.email)
+        .join(user_model.User, participant_model.Participant.member_id == user_model.User.id)
+        .filter(participant_model.Participant.event_id == event_id)
+        .all()
+    )
+
+def update_participant_certificates_bulk(db: Session, certificate_urls: Dict[int, str]) -> int:
+    """
+    Sets certificate_url for many participants with a single batched UPDATE
+    (one statement executed with one parameter set per participant).
+    """
+    if not certificate_urls:
+        return 0
+    db.execute(
+        update(participant_model.Participant),
+        [{"id": participant_id, "certificate_url": url} for participant_id, url in certificate_urls.items()]
+    )
+    db.commit()
+    publish_change("participants")
+    return len(certificate_urls)
+
 def delete_participants_by_ids(db: Session, ids: List[int]) -> int:
     """Deletes multiple participants by their IDs and returns the count of deleted rows."""
     if not ids:
         return 0
     num_deleted = db.query(participant_model.Participant).filter(participant_model.Participant.id.in_(ids)).delete(synchronize_session=False)
     db.commit()
-    return num_deleted
\ No newline at end of file
+    publish_change("participants")
+    return num_deleted
+
+# ===============================================
+#               Dashboard Statistics
+# ===============================================
+
+DASHBOARD_STATS = "dashboard"
+DASHBOARD_RECENT_EVENTS = 50
+DASHBOARD_REFRESH_LOCK_ID = 4_610_200_002 # pg advisory lock; migrations use ..._001
+
+def _ratio(part: int, whole: int) -> Optional[float]:
+    return round(part / whole, 4) if whole else None
+
+def compute_dashboard_stats(db: Session) -> stats_schema.DashboardStats:
+    """
+    Computes the dashboard totals with one grouped query per table
+    (plus one for the most recent events). Used by the snapshot refresh, not per request.
+    """
+    User, Participant = user_model.User, participant_model.Participant
+    Event, BlogArticle = event_model.Event, blog_model.BlogArticle
+    now = datetime.utcnow()
+
+    users_by_role, verified_users = {}, 0
+    for role, total, verified in db.execute(
+        select(User.role, func.count(), func.count().filter(User.is_verified.is_(True))).group_by(User.role)
+    ):
+        users_by_role[role] = total
+        verified_users += verified
+    users_total = sum(users_by_role.values())
+
+    registrations_by_status = dict(db.execute(
+        select(Participant.status, func.count()).group_by(Participant.status)
+    ).all())
+    ended_attendance = db.execute(
+        select(
+            func.count().filter(Participant.status == "attended"),
+            func.count().filter(Participant.status != "cancelled"),
+        )
+        .join(Event, Participant.event_id == Event.id)
+        .where(Event.end_date < now)
+    ).one()
+
+    recent_events = db.execute(
+        select(
+            Event.id, Event.title, Event.start_date, Event.end_date,
+            func.count(Participant.id).filter(Participant.status == "registered"),
+            func.count(Participant.id).filter(Participant.status == "attended"),
+            func.count(Participant.id).filter(Participant.status == "cancelled"),
+        )
+        .outerjoin(Participant, Participant.event_id == Event.id)
+        .where(Event.id.in_(
+            select(Event.id).order_by(Event.start_date.desc(), Event.id.desc()).limit(DASHBOARD_RECENT_EVENTS)
+        ))
+        .group_by(Event.id)
+        .order_by(Event.start_date.desc(), Event.id.desc())
+    ).all()
+
+    blogs_by_category = dict(db.execute(
+        select(BlogArticle.category, func.count()).group_by(BlogArticle.category)
+    ).all())
+
+    return stats_schema.DashboardStats(
+        users_total=users_total,
+        users_by_role=users_by_role,
+        verified_users=verified_users,
+        verified_ratio=_ratio(verified_users, users_total) or 0.0,
+        registrations_total=sum(registrations_by_status.values()),
+        registrations_by_status={status or "unknown": count for status, count in registrations_by_status.items()},
+        attendance_rate=_ratio(*ended_attendance),
+        recent_events=[
+            stats_schema.EventRegistrationStats(
+                event_id=event_id, title=title, start_date=start_date,
+                registered=registered, attended=attended, cancelled=cancelled,
+                attendance_rate=_ratio(attended, registered + attended) if end_date < now else None,
+            )
+            for event_id, title, start_date, end_date, registered, attended, cancelled in recent_events
+        ],
+        blogs_total=sum(blogs_by_category.values()),
+        blogs_by_category=blogs_by_category,
+    )
+
+def get_stats_snapshot(db: Session, name: str) -> Optional[stats_model.StatsSnapshot]:
+    return db.get(stats_model.StatsSnapshot, name)
+
+def refresh_dashboard_stats(
+    db: Session, min_age_seconds: float = 0, wait: bool = False
+) -> Optional[stats_model.StatsSnapshot]:
+    """
+    Recomputes and stores the dashboard snapshot, and returns it. Only one worker refreshes
+    at a time: if another one is busy, returns None, or with `wait` blocks until it is done.
+    A stored snapshot younger than `min_age_seconds` is returned as is, so every worker can
+    schedule the refresh but only one per interval does the work.
+    """
+    Snapshot = stats_model.StatsSnapshot
+    if wait:
+        db.execute(select(func.pg_advisory_xact_lock(DASHBOARD_REFRESH_LOCK_ID)))
+    elif not db.scalar(select(func.pg_try_advisory_xact_lock(DASHBOARD_REFRESH_LOCK_ID))):
+        db.rollback()
+        return None
+    if min_age_seconds > 0:
+        snapshot = get_stats_snapshot(db, DASHBOARD_STATS)
+        if snapshot and (datetime.utcnow() - snapshot.refreshed_at).total_seconds() < min_age_seconds:
+            db.commit() # Releases the advisory lock
+            return snapshot
+
+    started = datetime.utcnow()
+    data = compute_dashboard_stats(db).model_dump(mode="json")
+    refreshed_at = datetime.utcnow()
+    values = {
+        "name": DASHBOARD_STATS,
+        "data": data,
+        "refreshed_at": refreshed_at,
+        "refresh_ms": (refreshed_at - started).total_seconds() * 1000,
+    }
+    statement = pg_insert(Snapshot).values(**values)
+    db.execute(statement.on_conflict_do_update(index_elements=[Snapshot.name], set_=values))
+    db.commit() # Also releases the advisory lock
+    return get_stats_snapshot(db, DASHBOARD_STATS)
+
+# ===============================================
+#               Job Queue
+# ===============================================
+# Jobs are run by the worker pool in core.jobs; enqueue them with core.jobs.enqueue,
+# which validates the payload against the handler's schema.
+
+def enqueue_job(
+    db: Session, job_type: str, payload: dict, max_attempts: int, run_at: Optional[datetime] = None
+) -> job_model.Job:
+    db_job = job_model.Job(
+        type=job_type, payload=payload, max_attempts=max_attempts, run_at=run_at or datetime.utcnow()
+    )
+    db.add(db_job)
+    db.commit()
+    db.refresh(db_job)
+    return db_job
+
+def claim_job(db: Session, worker_id: str):
+    """
+    Marks the next due job as running and returns its (id, type, payload, attempts, max_attempts),
+    or None when nothing is due. FOR UPDATE SKIP LOCKED lets concurrent workers each claim
+    a different job without waiting on each other's row locks.
+    """
+    Job = job_model.Job
+    now = datetime.utcnow()
+    next_job_id = (
+        select(Job.id)
+        .where(Job.status == "queued", Job.run_at <= now)
+        .order_by(Job.run_at, Job.id)
+        .limit(1)
+        .with_for_update(skip_locked=True)
+        .scalar_subquery()
+    )
+    row = db.execute(
+        update(Job)
+        .where(Job.id == next_job_id)
+        .values(status="running", attempts=Job.attempts + 1, locked_at=now, locked_by=worker_id)
+        .returning(Job.id, Job.type, Job.payload, Job.attempts, Job.max_attempts)
+    ).first()
+    db.commit()
+    return row
+
+def complete_job(db: Session, job_id: int) -> None:
+    Job = job_model.Job
+    db.execute(
+        update(Job).where(Job.id == job_id)
+        .values(status="succeeded", finished_at=datetime.utcnow(), locked_at=None, locked_by=None, last_error=None)
+    )
+    db.commit()
+
+def fail_job(db: Session, job_id: int, error: str, retry_at: Optional[datetime]) -> None:
+    """Queues the job again at `retry_at`, or marks it failed for good when `retry_at` is None."""
+    Job = job_model.Job
+    values = {"locked_at": None, "locked_by": None, "last_error": error}
+    if retry_at is None:
+        values.update(status="failed", finished_at=datetime.utcnow())
+    else:
+        values.update(status="queued", run_at=retry_at)
+    db.execute(update(Job).where(Job.id == job_id).values(**values))
+    db.commit()
+
+def requeue_stale_jobs(db: Session, locked_before: datetime) -> int:
+    """
+    Releases jobs whose worker died while running them (locked before `locked_before`).
+    The interrupted run counts as an attempt, so a job that keeps killing its worker ends up failed.
+    """
+    Job = job_model.Job
+    stale = (Job.status == "running", Job.locked_at < locked_before)
+    error = "Worker stopped while running the job"
+    requeued = db.execute(
+        update(Job).where(*stale, Job.attempts < Job.max_attempts)
+        .values(status="queued", run_at=datetime.utcnow(), locked_at=None, locked_by=None, last_error=error)
+    ).rowcount
+    failed = db.execute(
+        update(Job).where(*stale)
+        .values(status="failed", finished_at=datetime.utcnow(), locked_at=None, locked_by=None, last_error=error)
+    ).rowcount
+    db.commit()
+    return requeued + failed
+
+def purge_succeeded_jobs(db: Session, finished_before: datetime) -> int:
+    Job = job_model.Job
+    num_deleted = db.execute(
+        delete(Job).where(Job.status == "succeeded", Job.finished_at < finished_before)
+    ).rowcount
+    db.commit()
+    return num_deleted
+
+def get_job_queue_stats(db: Session) -> job_schema.JobQueueStats:
+    Job = job_model.Job
+    now = datetime.utcnow()
+    stats = job_schema.JobQueueStats()
+    by_type: Dict[str, job_schema.JobTypeStats] = {}
+    for job_type, status, count in db.execute(
+        select(Job.type, Job.status, func.count()).group_by(Job.type, Job.status).order_by(Job.type)
+    ):
+        type_stats = by_type.setdefault(job_type, job_schema.JobTypeStats(type=job_type))
+        setattr(type_stats, status, count)
+        if status != "succeeded":
+            setattr(stats, status, getattr(stats, status) + count)
+    stats.by_type = list(by_type.values())
+
+    # Served by the partial index on queued jobs
+    due, oldest_run_at = db.execute(
+        select(func.count(), func.min(Job.run_at)).where(Job.status == "queued", Job.run_at <= now)
+    ).one()
+    stats.due = due
+    if oldest_run_at is not None:
+        stats.oldest_due_seconds = round((now - oldest_run_at).total_seconds(), 1)
+    return stats
+
+def get_failed_jobs(db: Session, job_type: Optional[str] = None, limit: int = 50) -> List[job_model.Job]:
+    Job = job_model.Job
+    query = db.query(Job).filter(Job.status == "failed")
+    if job_type:
+        query = query.filter(Job.type == job_type)
+    return query.order_by(Job.finished_at.desc(), Job.id.desc()).limit(limit).all()
+
+def retry_failed_job(db: Session, job_id: int) -> Optional[job_model.Job]:
+    """Queues a failed job again with a fresh set of attempts; None if there is no such failed job."""
+    Job = job_model.Job
+    db_job = db.query(Job).filter(Job.id == job_id, Job.status == "failed").first()
+    if db_job is None:
+        return None
+    db_job.status = "queued"
+    db_job.attempts = 0
+    db_job.run_at = datetime.utcnow()
+    db_job.finished_at = None
+    db.commit()
+    db.refresh(db_job)
+    return db_job
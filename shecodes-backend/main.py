@@ -1,11 +1,23 @@
 # /shecodes-backend/main.py (Modified)
 
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
-from database import engine
-from models.user import Base # Import Base from a model to link metadata
+from database import engine, SessionLocal
 from core.config import settings
-from core.supabase_client import supabase_client # To check initialization
+from core.periodic import PeriodicTask
+from core.jobs import JobWorkerPool
+from core.rate_limit import get_backend as get_rate_limit_backend
+from core.pubsub import get_broker
+from core.invalidation import get_bus as get_invalidation_bus, on_change
+from migrations import check_schema_version
+from core.metrics import MetricsMiddleware, install_query_listeners
+from core.query_diagnostics import QueryDiagnosticsMiddleware, install_query_diagnostics
+from core.cache import TTLCache
+from core.compression import CompressionMiddleware
+from core.response_cache import ResponseCacheMiddleware
+from core.snapshots import SnapshotScheduler, SnapshotOnWriteMiddleware
+import crud
 import os
 import uvicorn
 
@@ -15,15 +27,76 @@ from routers import (
     partner, alumni, faq, contact, blog, comment, participant,
     upload as upload_router,
     champion as champion_router,
-    portfolio as portfolio_router
+    portfolio as portfolio_router,
+    metrics as metrics_router,
+    stats as stats_router,
+    job as job_router
 )
 
-# This single line ensures all tables inheriting from Base are created.
-Base.metadata.create_all(bind=engine)
+# Tables are managed by versioned migrations (`python -m migrations`), run once per deploy.
+# Workers only check the schema version on startup, in the lifespan below.
+
+def reconcile_event_statuses_job():
+    db = SessionLocal()
+    try:
+        crud.reconcile_event_statuses(db)
+    finally:
+        db.close()
+
+def refresh_dashboard_stats_job():
+    db = SessionLocal()
+    try:
+        # Skipped when another worker refreshed within the last half interval
+        crud.refresh_dashboard_stats(db, min_age_seconds=settings.DASHBOARD_STATS_REFRESH_SECONDS / 2)
+    finally:
+        db.close()
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    check_schema_version(engine)
+
+    periodic_tasks = []
+    if settings.EVENT_STATUS_RECONCILE_SECONDS > 0:
+        # Every worker runs its own reconciler; the UPDATE only touches drifted rows, so this is idempotent.
+        periodic_tasks.append(PeriodicTask(
+            "event-status-reconciler", settings.EVENT_STATUS_RECONCILE_SECONDS, reconcile_event_statuses_job
+        ))
+
+    if settings.DASHBOARD_STATS_REFRESH_SECONDS > 0:
+        periodic_tasks.append(PeriodicTask(
+            "dashboard-stats-refresh", settings.DASHBOARD_STATS_REFRESH_SECONDS, refresh_dashboard_stats_job
+        ))
+
+    if settings.RATE_LIMIT_ENABLED and settings.RATE_LIMIT_BACKEND == "postgres":
+        # Drop buckets idle for a day so the shared table does not grow with every IP ever seen
+        periodic_tasks.append(PeriodicTask("rate-limit-purge", 3600, get_rate_limit_backend().purge))
+
+    broker = get_broker()
+    broker.start()
+    invalidation_bus = get_invalidation_bus()
+    invalidation_bus.start()
+    for task in periodic_tasks:
+        task.start()
+    job_pool = None
+    if settings.JOB_WORKERS_ENABLED:
+        job_pool = JobWorkerPool(settings.JOB_CONCURRENCY, settings.JOB_POLL_SECONDS)
+        job_pool.start()
+    yield
+    if job_pool is not None:
+        job_pool.stop()
+    for task in periodic_tasks:
+        task.stop()
+    invalidation_bus.stop()
+    broker.stop()
+    if snapshot_scheduler is not None:
+        snapshot_scheduler.stop()
+
+snapshot_scheduler = SnapshotScheduler(settings.SNAPSHOT_DEBOUNCE_SECONDS) if settings.SNAPSHOT_ON_WRITE else None
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     version=settings.PROJECT_VERSION,
+    lifespan=lifespan,
 )
 
 # Your CORS settings
@@ -37,6 +110,47 @@ origins = [
     "https://www.shecodessociety.org"
 ]
 
+# Public content read by anonymous visitors; writes under a prefix also drop the prefixes listed here
+CACHED_PREFIXES = [
+    "/blogs", "/events", "/mentors", "/alumni", "/faqs",
+    "/contacts", "/partners", "/champions", "/documentations",
+]
+CACHE_INVALIDATES = {
+    "/events": ["/mentors"], # mentor directory statistics
+    "/mentors": ["/events"], # events embed their mentors
+}
+# Tables whose changes, published by crud, evict the cached responses of a prefix in every worker
+CACHED_PREFIX_BY_ENTITY = {
+    "blog_articles": "/blogs", "events": "/events", "mentors": "/mentors", "alumni": "/alumni",
+    "faq_items": "/faqs", "contact_cards": "/contacts", "partners": "/partners",
+    "champions": "/champions", "documentations": "/documentations",
+}
+
+# Added before CORS so CORS headers are applied per request, also to cached responses
+if settings.COMPRESSION_ENABLED:
+    app.add_middleware(CompressionMiddleware, minimum_size=settings.COMPRESSION_MINIMUM_SIZE)
+if settings.RESPONSE_CACHE_ENABLED:
+    response_cache = TTLCache(settings.RESPONSE_CACHE_TTL_SECONDS, max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES)
+    app.add_middleware(
+        ResponseCacheMiddleware,
+        cache=response_cache,
+        prefixes=CACHED_PREFIXES,
+        invalidates=CACHE_INVALIDATES,
+        # The cache compresses its own entries, so without compression it must not either
+        minimum_size=settings.COMPRESSION_MINIMUM_SIZE if settings.COMPRESSION_ENABLED else float("inf"),
+    )
+
+    def evict_cached_responses(change: dict):
+        prefix = CACHED_PREFIX_BY_ENTITY[change["entity"]]
+        prefixes = {prefix, *CACHE_INVALIDATES.get(prefix, ())}
+        response_cache.delete_matching(lambda key: key[0] in prefixes)
+
+    for entity in CACHED_PREFIX_BY_ENTITY:
+        on_change(entity, evict_cached_responses)
+
+if snapshot_scheduler is not None:
+    app.add_middleware(SnapshotOnWriteMiddleware, scheduler=snapshot_scheduler)
+
 app.add_middleware(
     CORSMiddleware,
     allow_origins=origins,
@@ -45,6 +159,21 @@ app.add_middleware(
     allow_headers=["*"],
 )
 
+if settings.SLOW_QUERY_LOG_ENABLED or settings.N_PLUS_ONE_DETECTION_ENABLED:
+    install_query_diagnostics(
+        engine,
+        slow_query_ms=settings.SLOW_QUERY_THRESHOLD_MS if settings.SLOW_QUERY_LOG_ENABLED else None,
+        track_repeats=settings.N_PLUS_ONE_DETECTION_ENABLED,
+    )
+if settings.N_PLUS_ONE_DETECTION_ENABLED:
+    app.add_middleware(QueryDiagnosticsMiddleware, threshold=settings.N_PLUS_ONE_THRESHOLD)
+
+if settings.METRICS_ENABLED:
+    # Added last so it wraps every other middleware and sees the final status code
+    install_query_listeners(engine)
+    app.add_middleware(MetricsMiddleware)
+    app.include_router(metrics_router.router)
+
 # Include all routers
 app.include_router(auth.router)
 app.include_router(user.router)
@@ -61,6 +190,8 @@ app.include_router(blog.router)
 app.include_router(comment.router)
 app.include_router(participant.router)
 app.include_router(upload_router.router)
+app.include_router(stats_router.router)
+app.include_router(job_router.router)
 
 @app.get("/", tags=["Root"])
 def read_root():
@@ -0,0 +1,131 @@
+# /shecodes-backend/migrations/__init__.py
+"""
+Versioned schema migrations.
+
+Migrations live in migrations/versions as NNNN_<name>.py modules with an
+upgrade(conn) function; NNNN is the version. Applied versions are recorded in
+the schema_version table. A migration spells out its DDL and never reads the
+models, so it keeps doing what it did when it was written. Run them once per
+deploy, before starting workers:
+
+    python -m migrations            # apply pending migrations
+    python -m migrations --status   # show current and latest version
+
+Workers only compare versions on startup (see check_schema_version) and never
+create or alter tables themselves.
+"""
+
+import importlib
+import pkgutil
+from dataclasses import dataclass
+from typing import Callable, List, Optional
+
+from sqlalchemy import Column, DateTime, Integer, MetaData, String, Table, func, inspect, select, text
+from sqlalchemy.engine import Connection, Engine
+
+# Arbitrary key for pg_advisory_lock so concurrent deploys apply migrations one at a time
+MIGRATION_LOCK_ID = 4_610_200_001
+
+version_metadata = MetaData()
+schema_version_table = Table(
+    "schema_version",
+    version_metadata,
+    Column("version", Integer, primary_key=True),
+    Column("description", String, nullable=False),
+    Column("applied_at", DateTime, nullable=False, server_default=func.now()),
+)
+
+@dataclass
+class Migration:
+    version: int
+    name: str
+    description: str
+    upgrade: Callable[[Connection], None]
+
+def load_migrations() -> List[Migration]:
+    from migrations import versions
+    migrations = []
+    for module_info in pkgutil.iter_modules(versions.__path__):
+        prefix, _, name = module_info.name.partition("_")
+        if not prefix.isdigit():
+            continue
+        module = importlib.import_module(f"{versions.__name__}.{module_info.name}")
+        description = (module.__doc__ or name).strip().splitlines()[0]
+        migrations.append(Migration(int(prefix), name, description, module.upgrade))
+    migrations.sort(key=lambda migration: migration.version)
+    return migrations
+
+def latest_version() -> int:
+    migrations = load_migrations()
+    return migrations[-1].version if migrations else 0
+
+def current_version(conn: Connection) -> Optional[int]:
+    """Highest applied version, or None when the database has never been migrated."""
+    if not inspect(conn).has_table(schema_version_table.name):
+        return None
+    return conn.execute(select(func.max(schema_version_table.c.version))).scalar() or 0
+
+def import_models() -> None:
+    """Imports every module under models/ so Base.metadata describes the full schema."""
+    import models
+    for module_info in pkgutil.iter_modules(models.__path__):
+        importlib.import_module(f"models.{module_info.name}")
+
+def _record(conn: Connection, migration: Migration) -> None:
+    conn.execute(schema_version_table.insert().values(version=migration.version, description=migration.description))
+
+def upgrade(engine: Engine, log: Callable[[str], None] = print) -> List[int]:
+    """
+    Applies pending migrations, each in its own transaction, and returns the versions applied.
+    An empty database is created from the current models and stamped with the latest version,
+    since the models already include every migration's changes.
+    """
+    from database import Base
+    import_models()
+    migrations = load_migrations()
+    applied = []
+
+    with engine.connect() as conn:
+        conn.execute(select(func.pg_advisory_lock(MIGRATION_LOCK_ID)))
+        conn.commit()
+        try:
+            with conn.begin():
+                version = current_version(conn)
+                fresh = version is None and not inspect(conn).has_table("users")
+                version_metadata.create_all(conn)
+                if fresh:
+                    log("Empty database: creating schema from models.")
+                    Base.metadata.create_all(conn)
+                    for migration in migrations:
+                        _record(conn, migration)
+                    return [migration.version for migration in migrations]
+
+            for migration in migrations:
+                if migration.version <= (version or 0):
+                    continue
+                log(f"Applying migration {migration.version:04d}: {migration.description}")
+                with conn.begin():
+                    migration.upgrade(conn)
+                    _record(conn, migration)
+                applied.append(migration.version)
+        finally:
+            conn.execute(select(func.pg_advisory_unlock(MIGRATION_LOCK_ID)))
+            conn.commit()
+    return applied
+
+def check_schema_version(engine: Engine) -> None:
+    """
+    Startup check: one small query comparing the database version with the code's latest.
+    Only warns, so a briefly unavailable database or a pending migration never blocks a worker from booting.
+    """
+    expected = latest_version()
+    try:
+        with engine.connect() as conn:
+            version = conn.execute(text("SELECT max(version) FROM schema_version")).scalar()
+    except Exception as e:
+        print(f"WARNING: Could not check the schema version ({e.__class__.__name__}). Is the database reachable and migrated?")
+        return
+    if version is None or version < expected:
+        print(f"WARNING: Database schema is at version {version or 0}, code expects {expected}. Run `python -m migrations`.")
+    elif version > expected:
+        print(f"WARNING: Database schema version {version} is newer than this code ({expected}).")
@@ -0,0 +1,23 @@
+# /shecodes-backend/migrations/__main__.py
+
+import argparse
+
+from database import engine
+from migrations import current_version, latest_version, upgrade
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Apply database schema migrations.")
+    parser.add_argument("--status", action="store_true", help="Show the current and latest version and exit")
+    args = parser.parse_args()
+
+    if args.status:
+        with engine.connect() as conn:
+            version = current_version(conn)
+        print(f"Database version: {'not migrated' if version is None else version}, latest: {latest_version()}")
+        return
+
+    applied = upgrade(engine)
+    print(f"Applied {len(applied)} migration(s)." if applied else "Database is up to date.")
+
+if __name__ == "__main__":
+    main()
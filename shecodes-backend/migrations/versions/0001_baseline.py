@@ -0,0 +1,278 @@
+"""Baseline schema created by Base.metadata.create_all before migrations existed"""
+
+from sqlalchemy import text
+
+# The schema as of the first migration, written out so later model changes cannot alter it.
+# Databases from the create_all era already have these objects, hence IF NOT EXISTS throughout.
+ENUMS = {
+    "blog_category": ("Tech Trends", "Career Growth", "Community", "Event", "Others", "Tech & Innovation", "Success Stories"),
+    "contact_colorvariant": ("pink", "blue"),
+    "event_type_enum": ("Workshop", "Seminar", "Webinar", "Mentorship"),
+    "event_status_enum": ("upcoming", "past", "ongoing"),
+    "faq_colorvariant": ("pink", "blue", "purple"),
+    "mentor_status_enum": ("active", "inactive"),
+    "participant_status_enum": ("registered", "attended", "cancelled"),
+    "role_enum": ("mentor", "admin", "member", "alumni"),
+}
+
+TABLES = [
+    """
+    CREATE TABLE IF NOT EXISTS alumni (
+        id SERIAL NOT NULL,
+        name VARCHAR NOT NULL,
+        batch INTEGER NOT NULL,
+        image_src VARCHAR NOT NULL,
+        story TEXT NOT NULL,
+        email VARCHAR,
+        instagram VARCHAR,
+        linkedin VARCHAR,
+        phone VARCHAR,
+        university VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_alumni_id ON alumni (id)",
+    """
+    CREATE TABLE IF NOT EXISTS blog_articles (
+        id SERIAL NOT NULL,
+        slug VARCHAR NOT NULL,
+        excerpt VARCHAR NOT NULL,
+        title VARCHAR NOT NULL,
+        category blog_category NOT NULL,
+        published_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now() NOT NULL,
+        author_name VARCHAR NOT NULL,
+        author_avatar_url VARCHAR NOT NULL,
+        image_src VARCHAR NOT NULL,
+        featured_image_url VARCHAR NOT NULL,
+        sections TEXT NOT NULL,
+        view_count INTEGER,
+        like_count INTEGER,
+        created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+        updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_blog_articles_id ON blog_articles (id)",
+    """
+    CREATE TABLE IF NOT EXISTS champions (
+        id SERIAL NOT NULL,
+        name VARCHAR NOT NULL,
+        position VARCHAR NOT NULL,
+        image_src VARCHAR NOT NULL,
+        description TEXT,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_champions_id ON champions (id)",
+    """
+    CREATE TABLE IF NOT EXISTS comments (
+        id SERIAL NOT NULL,
+        discussion_id VARCHAR NOT NULL,
+        parent_id INTEGER,
+        author VARCHAR NOT NULL,
+        text TEXT NOT NULL,
+        avatar VARCHAR,
+        date TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+        PRIMARY KEY (id),
+        FOREIGN KEY (parent_id) REFERENCES comments (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_comments_id ON comments (id)",
+    """
+    CREATE TABLE IF NOT EXISTS contact_cards (
+        id SERIAL NOT NULL,
+        platform_name VARCHAR NOT NULL,
+        logo_src VARCHAR NOT NULL,
+        description VARCHAR NOT NULL,
+        link_url VARCHAR NOT NULL,
+        color_variant contact_colorvariant NOT NULL,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_contact_cards_id ON contact_cards (id)",
+    """
+    CREATE TABLE IF NOT EXISTS documentations (
+        id SERIAL NOT NULL,
+        image_src VARCHAR NOT NULL,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_documentations_id ON documentations (id)",
+    """
+    CREATE TABLE IF NOT EXISTS events (
+        id SERIAL NOT NULL,
+        title VARCHAR NOT NULL,
+        description TEXT NOT NULL,
+        event_type event_type_enum NOT NULL,
+        start_date TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        end_date TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        location VARCHAR NOT NULL,
+        created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        status event_status_enum NOT NULL,
+        image_src VARCHAR,
+        image_alt VARCHAR,
+        tags JSONB,
+        long_description TEXT,
+        register_link VARCHAR,
+        tools JSONB,
+        key_points JSONB,
+        group_link VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_events_id ON events (id)",
+    """
+    CREATE TABLE IF NOT EXISTS faq_items (
+        id SERIAL NOT NULL,
+        question VARCHAR NOT NULL,
+        answer VARCHAR NOT NULL,
+        color_variant faq_colorvariant NOT NULL,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_faq_items_id ON faq_items (id)",
+    """
+    CREATE TABLE IF NOT EXISTS mentors (
+        id SERIAL NOT NULL,
+        name VARCHAR NOT NULL,
+        occupation VARCHAR NOT NULL,
+        description TEXT NOT NULL,
+        image_src VARCHAR NOT NULL,
+        story TEXT NOT NULL,
+        instagram VARCHAR,
+        linkedin VARCHAR,
+        status mentor_status_enum NOT NULL,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_mentors_id ON mentors (id)",
+    """
+    CREATE TABLE IF NOT EXISTS partners (
+        id SERIAL NOT NULL,
+        name VARCHAR NOT NULL,
+        logo_src VARCHAR NOT NULL,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_partners_id ON partners (id)",
+    """
+    CREATE TABLE IF NOT EXISTS users (
+        id VARCHAR NOT NULL,
+        email VARCHAR NOT NULL,
+        password VARCHAR NOT NULL,
+        is_verified BOOLEAN,
+        created_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+        updated_at TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+        name VARCHAR NOT NULL,
+        role role_enum NOT NULL,
+        about_me TEXT,
+        birth_date DATE,
+        gender VARCHAR,
+        phone VARCHAR,
+        occupation VARCHAR,
+        cv_link VARCHAR,
+        linkedin VARCHAR,
+        profile_picture VARCHAR,
+        PRIMARY KEY (id)
+    )
+    """,
+    "CREATE UNIQUE INDEX IF NOT EXISTS ix_users_email ON users (email)",
+    """
+    CREATE TABLE IF NOT EXISTS comment_likes (
+        user_id VARCHAR NOT NULL,
+        comment_id INTEGER NOT NULL,
+        PRIMARY KEY (user_id, comment_id),
+        FOREIGN KEY (user_id) REFERENCES users (id) ON DELETE CASCADE,
+        FOREIGN KEY (comment_id) REFERENCES comments (id) ON DELETE CASCADE
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS event_mentor_association (
+        event_id INTEGER,
+        mentor_id INTEGER,
+        FOREIGN KEY (event_id) REFERENCES events (id),
+        FOREIGN KEY (mentor_id) REFERENCES mentors (id)
+    )
+    """,
+    """
+    CREATE TABLE IF NOT EXISTS skills (
+        id SERIAL NOT NULL,
+        title VARCHAR NOT NULL,
+        description TEXT NOT NULL,
+        event_id INTEGER NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY (event_id) REFERENCES events (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_skills_id ON skills (id)",
+    """
+    CREATE TABLE IF NOT EXISTS benefits (
+        id SERIAL NOT NULL,
+        title VARCHAR NOT NULL,
+        text TEXT NOT NULL,
+        event_id INTEGER NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY (event_id) REFERENCES events (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_benefits_id ON benefits (id)",
+    """
+    CREATE TABLE IF NOT EXISTS sessions (
+        id SERIAL NOT NULL,
+        topic VARCHAR NOT NULL,
+        description TEXT NOT NULL,
+        start TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        "end" TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+        event_id INTEGER NOT NULL,
+        PRIMARY KEY (id),
+        FOREIGN KEY (event_id) REFERENCES events (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_sessions_id ON sessions (id)",
+    """
+    CREATE TABLE IF NOT EXISTS participants (
+        id SERIAL NOT NULL,
+        event_id INTEGER NOT NULL,
+        member_id VARCHAR NOT NULL,
+        registration_date TIMESTAMP WITHOUT TIME ZONE DEFAULT now(),
+        status participant_status_enum,
+        certificate_url VARCHAR,
+        feedback VARCHAR,
+        PRIMARY KEY (id),
+        FOREIGN KEY (event_id) REFERENCES events (id),
+        FOREIGN KEY (member_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_participants_id ON participants (id)",
+    """
+    CREATE TABLE IF NOT EXISTS portfolio_projects (
+        id SERIAL NOT NULL,
+        user_id VARCHAR NOT NULL,
+        name VARCHAR NOT NULL,
+        description TEXT,
+        image_url VARCHAR NOT NULL,
+        project_url VARCHAR,
+        PRIMARY KEY (id),
+        FOREIGN KEY (user_id) REFERENCES users (id)
+    )
+    """,
+    "CREATE INDEX IF NOT EXISTS ix_portfolio_projects_id ON portfolio_projects (id)",
+]
+
+def create_enum(conn, name, values):
+    """CREATE TYPE has no IF NOT EXISTS, so an existing type is skipped by catching duplicate_object."""
+    labels = ", ".join("'" + value + "'" for value in values)
+    conn.execute(text(f"""
+        DO $$
+        BEGIN
+            CREATE TYPE {name} AS ENUM ({labels});
+        EXCEPTION
+            WHEN duplicate_object THEN NULL;
+        END $$
+    """))
+
+def upgrade(conn):
+    for name, values in ENUMS.items():
+        create_enum(conn, name, values)
+    for statement in TABLES:
+        conn.execute(text(statement))
@@ -0,0 +1,32 @@
+"""Participant uniqueness and event search/directory indexes"""
+
+from sqlalchemy import text
+
+def upgrade(conn):
+    # Keep the earliest registration of any duplicated (event, member) pair before enforcing uniqueness
+    conn.execute(text("""
+        DELETE FROM participants p
+        USING participants earlier
+        WHERE p.event_id = earlier.event_id
+          AND p.member_id = earlier.member_id
+          AND p.id > earlier.id
+    """))
+    conn.execute(text("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (SELECT 1 FROM pg_constraint WHERE conname = 'uq_participants_event_member') THEN
+                ALTER TABLE participants
+                    ADD CONSTRAINT uq_participants_event_member UNIQUE (event_id, member_id);
+            END IF;
+        END $$
+    """))
+
+    # Keyset pagination of the event search orders by (start_date, id)
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_events_start_date_id ON events (start_date, id)"))
+    # Serves `tags @> '[...]'` containment filters
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_events_tags ON events USING gin (tags)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_events_event_type ON events (event_type)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_events_end_date ON events (end_date)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_event_mentor_association_event_id ON event_mentor_association (event_id)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_event_mentor_association_mentor_id ON event_mentor_association (mentor_id)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_mentors_status ON mentors (status)"))
@@ -0,0 +1,15 @@
+"""Shared token buckets for the Postgres rate limit backend"""
+
+from sqlalchemy import text
+
+def upgrade(conn):
+    # UNLOGGED: bucket state is disposable, so skip WAL writes on every request
+    conn.execute(text("""
+        CREATE UNLOGGED TABLE IF NOT EXISTS rate_limit_buckets (
+            key VARCHAR NOT NULL,
+            tokens FLOAT NOT NULL,
+            updated_at FLOAT NOT NULL,
+            allowed BOOLEAN NOT NULL,
+            PRIMARY KEY (key)
+        )
+    """))
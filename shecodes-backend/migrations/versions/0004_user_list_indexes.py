@@ -0,0 +1,10 @@
+"""Indexes for the admin user list: keyset order, name/email prefix search, participation counts"""
+
+from sqlalchemy import text
+
+def upgrade(conn):
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_created_at_id ON users (created_at, id)"))
+    # text_pattern_ops lets LIKE 'abc%' on lower(...) use the index
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_lower_name ON users (lower(name) text_pattern_ops)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_users_lower_email ON users (lower(email) text_pattern_ops)"))
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_participants_member_id ON participants (member_id)"))
@@ -0,0 +1,14 @@
+"""Precomputed admin dashboard statistics"""
+
+from sqlalchemy import text
+
+def upgrade(conn):
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS stats_snapshots (
+            name VARCHAR NOT NULL,
+            data JSONB NOT NULL,
+            refreshed_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            refresh_ms FLOAT,
+            PRIMARY KEY (name)
+        )
+    """))
@@ -0,0 +1,6 @@
+"""Index comments by discussion for per-discussion counts and threads"""
+
+from sqlalchemy import text
+
+def upgrade(conn):
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_comments_discussion_id_date ON comments (discussion_id, date)"))
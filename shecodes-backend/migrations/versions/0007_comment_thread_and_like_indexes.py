@@ -0,0 +1,8 @@
+"""Index comment replies by (parent_id, date) and likes by comment_id"""
+
+from sqlalchemy import text
+
+def upgrade(conn):
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_comments_parent_id_date ON comments (parent_id, date)"))
+    # The (user_id, comment_id) primary key cannot serve per-comment loads and counts
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_comment_likes_comment_id ON comment_likes (comment_id)"))
@@ -0,0 +1,34 @@
+"""Job queue for deferred work"""
+
+from sqlalchemy import text
+
+def upgrade(conn):
+    conn.execute(text("""
+        DO $$
+        BEGIN
+            CREATE TYPE job_status_enum AS ENUM ('queued', 'running', 'succeeded', 'failed');
+        EXCEPTION
+            WHEN duplicate_object THEN NULL;
+        END $$
+    """))
+    conn.execute(text("""
+        CREATE TABLE IF NOT EXISTS jobs (
+            id BIGSERIAL NOT NULL,
+            type VARCHAR NOT NULL,
+            payload JSONB NOT NULL,
+            status job_status_enum NOT NULL,
+            attempts INTEGER NOT NULL,
+            max_attempts INTEGER NOT NULL,
+            run_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            locked_at TIMESTAMP WITHOUT TIME ZONE,
+            locked_by VARCHAR,
+            last_error TEXT,
+            created_at TIMESTAMP WITHOUT TIME ZONE NOT NULL,
+            finished_at TIMESTAMP WITHOUT TIME ZONE,
+            PRIMARY KEY (id)
+        )
+    """))
+    # The claim query: the next queued job that is due
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_jobs_queued_run_at ON jobs (run_at, id) WHERE status = 'queued'"))
+    # Finding jobs of workers that died while running them
+    conn.execute(text("CREATE INDEX IF NOT EXISTS ix_jobs_running_locked_at ON jobs (locked_at) WHERE status = 'running'"))
@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, PrimaryKeyConstraint, func
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, PrimaryKeyConstraint, Index, func
 from sqlalchemy.orm import relationship
 from datetime import datetime
 from database import Base
@@ -6,12 +6,22 @@ from database import Base
 # New table to track likes
 class CommentLike(Base):
     __tablename__ = "comment_likes"
+    __table_args__ = (
+        # The primary key leads with user_id; likes are loaded and counted per comment
+        Index("ix_comment_likes_comment_id", "comment_id"),
+    )
 
     user_id = Column(String, ForeignKey("users.id", ondelete="CASCADE"), primary_key=True)
     comment_id = Column(Integer, ForeignKey("comments.id", ondelete="CASCADE"), primary_key=True)
 
 class Comment(Base):
     __tablename__ = "comments"
+    __table_args__ = (
+        # Comment counts per discussion, and discussion threads ordered by date
+        Index("ix_comments_discussion_id_date", "discussion_id", "date"),
+        # Replies of a thread ordered by date
+        Index("ix_comments_parent_id_date", "parent_id", "date"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     discussion_id = Column(String, nullable=False)
@@ -1,31 +1,56 @@
-from sqlalchemy import Column, Integer, String, Enum, DateTime, Text, Table, ForeignKey, func
+from sqlalchemy import Column, Integer, String, Enum, DateTime, Text, Table, ForeignKey, Index, case, cast, func
 from sqlalchemy.orm import relationship
+from sqlalchemy.ext.hybrid import hybrid_property
 from sqlalchemy.dialects.postgresql import JSONB
 from database import Base
-from datetime import datetime
+from datetime import datetime, timezone
 
 event_mentor_association = Table(
     "event_mentor_association",
     Base.metadata,
-    Column("event_id", Integer, ForeignKey("events.id")),
-    Column("mentor_id", Integer, ForeignKey("mentors.id"))
+    Column("event_id", Integer, ForeignKey("events.id"), index=True),
+    Column("mentor_id", Integer, ForeignKey("mentors.id"), index=True)
 )
 
+def naive_utc(value: datetime) -> datetime:
+    """Dates are stored as naive UTC; the admin UI sends aware ones (toISOString(), "...Z")."""
+    if value.tzinfo is not None:
+        return value.astimezone(timezone.utc).replace(tzinfo=None)
+    return value
+
+def status_for(start_date: datetime, end_date: datetime, now: datetime | None = None) -> str:
+    """Derives 'upcoming' / 'ongoing' / 'past' from an event's dates, naive or aware."""
+    start_date, end_date = naive_utc(start_date), naive_utc(end_date)
+    now = naive_utc(now) if now else datetime.utcnow()
+    if now < start_date:
+        return "upcoming"
+    if now > end_date:
+        return "past"
+    return "ongoing"
+
 # /models/event.py
 
 class Event(Base):
     __tablename__ = "events"
+    __table_args__ = (
+        # Keyset pagination in the search API orders by (start_date, id)
+        Index("ix_events_start_date_id", "start_date", "id"),
+        # Serves `tags @> '[...]'` containment filters
+        Index("ix_events_tags", "tags", postgresql_using="gin"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     title = Column(String, nullable=False)
     description = Column(Text, nullable=False)
-    event_type = Column(Enum("Workshop", "Seminar", "Webinar", "Mentorship", name="event_type_enum"), nullable=False)
-    start_date = Column(DateTime, nullable=False)
-    end_date = Column(DateTime, nullable=False)
+    event_type = Column(Enum("Workshop", "Seminar", "Webinar", "Mentorship", name="event_type_enum"), nullable=False, index=True)
+    start_date = Column(DateTime, nullable=False) # indexed by ix_events_start_date_id
+    end_date = Column(DateTime, nullable=False, index=True)
     location = Column(String, nullable=False)
     created_at = Column(DateTime, default=func.now(), nullable=False)
     
     # --- Updated Fields ---
+    # Stored for older consumers and kept in sync by a periodic reconciler;
+    # API responses use `current_status`, which is derived from the dates.
     status = Column(Enum("upcoming", "past", "ongoing", name="event_status_enum"), nullable=False, default="upcoming")
     image_src = Column(String, nullable=True) # Renamed from imageSrc
     image_alt = Column(String, nullable=True)
@@ -43,6 +68,22 @@ class Event(Base):
     sessions = relationship("Session", cascade="all, delete-orphan", backref="event")
     participants = relationship("Participant", back_populates="event")
 
+    @hybrid_property
+    def current_status(self):
+        return status_for(self.start_date, self.end_date)
+
+    @current_status.expression
+    def current_status(cls):
+        now = datetime.utcnow()
+        return cast(
+            case(
+                (cls.start_date > now, "upcoming"),
+                (cls.end_date < now, "past"),
+                else_="ongoing"
+            ),
+            cls.__table__.c.status.type
+        )
+
 class Skill(Base):
     __tablename__ = "skills"
     id = Column(Integer, primary_key=True, index=True)
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, BigInteger, Integer, String, Text, DateTime, Enum, Index, text
+from sqlalchemy.dialects.postgresql import JSONB
+from datetime import datetime
+from database import Base
+
+class Job(Base):
+    """
+    Deferred work, run by the worker pool in core.jobs. A job is claimed once it is queued
+    and its run_at has passed; failed attempts are queued again with a backoff until
+    max_attempts is used up, and then stay as "failed" for an admin to look at.
+    """
+    __tablename__ = "jobs"
+    __table_args__ = (
+        # The claim query: the next queued job that is due
+        Index("ix_jobs_queued_run_at", "run_at", "id", postgresql_where=text("status = 'queued'")),
+        # Finding jobs of workers that died while running them
+        Index("ix_jobs_running_locked_at", "locked_at", postgresql_where=text("status = 'running'")),
+    )
+
+    id = Column(BigInteger, primary_key=True)
+    type = Column(String, nullable=False) # Name of the registered handler
+    payload = Column(JSONB, nullable=False)
+    status = Column(
+        Enum("queued", "running", "succeeded", "failed", name="job_status_enum"),
+        nullable=False, default="queued"
+    )
+    attempts = Column(Integer, nullable=False, default=0)
+    max_attempts = Column(Integer, nullable=False)
+    run_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    locked_at = Column(DateTime, nullable=True)
+    locked_by = Column(String, nullable=True) # Worker that is running the job
+    last_error = Column(Text, nullable=True)
+    created_at = Column(DateTime, nullable=False, default=datetime.utcnow)
+    finished_at = Column(DateTime, nullable=True)
@@ -14,6 +14,6 @@ class Mentor(Base):
 
     instagram = Column(String, nullable=True)
     linkedin = Column(String, nullable=True)
-    status = Column(Enum("active", "inactive", name="mentor_status_enum"), default="active", nullable=False)
+    status = Column(Enum("active", "inactive", name="mentor_status_enum"), default="active", nullable=False, index=True)
     
     events = relationship("Event", secondary="event_mentor_association", back_populates="mentors")
\ No newline at end of file
@@ -1,10 +1,15 @@
-from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum, String, func
+from sqlalchemy import Column, Integer, ForeignKey, DateTime, Enum, String, UniqueConstraint, Index, func
 from datetime import datetime
 from database import Base
 from sqlalchemy.orm import relationship
 
 class Participant(Base):
     __tablename__ = "participants"
+    __table_args__ = (
+        UniqueConstraint("event_id", "member_id", name="uq_participants_event_member"),
+        # Per-user lookups (participation history and counts); the unique constraint leads with event_id
+        Index("ix_participants_member_id", "member_id"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     event_id = Column(Integer, ForeignKey("events.id"), nullable=False)
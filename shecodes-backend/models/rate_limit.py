@@ -0,0 +1,14 @@
+from sqlalchemy import Column, Float, String, Boolean, Table
+from database import Base
+
+# Token buckets of the shared (Postgres) rate limit backend, see core/rate_limit.py.
+# UNLOGGED: bucket state is disposable, so skip WAL writes on every request.
+rate_limit_buckets = Table(
+    "rate_limit_buckets",
+    Base.metadata,
+    Column("key", String, primary_key=True),
+    Column("tokens", Float, nullable=False),
+    Column("updated_at", Float, nullable=False), # epoch seconds, from the database clock
+    Column("allowed", Boolean, nullable=False),
+    prefixes=["UNLOGGED"],
+)
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, DateTime, Float
+from sqlalchemy.dialects.postgresql import JSONB
+from database import Base
+
+class StatsSnapshot(Base):
+    """
+    Precomputed statistics, one row per snapshot name (e.g. "dashboard").
+    Rows are rewritten by the periodic refresh in crud.refresh_dashboard_stats and read by primary key.
+    """
+    __tablename__ = "stats_snapshots"
+
+    name = Column(String, primary_key=True)
+    data = Column(JSONB, nullable=False)
+    refreshed_at = Column(DateTime, nullable=False)
+    refresh_ms = Column(Float, nullable=True) # How long computing the snapshot took
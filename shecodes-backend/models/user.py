@@ -1,6 +1,6 @@
 # /shecodes-backend/models/user.py (Corrected)
 
-from sqlalchemy import Column, String, Enum, Boolean, DateTime, Text, Date, func
+from sqlalchemy import Column, String, Enum, Boolean, DateTime, Text, Date, Index, func
 from sqlalchemy.orm import relationship
 from database import Base
 import uuid
@@ -8,6 +8,10 @@ from datetime import datetime
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Keyset pagination in the admin user list orders by (created_at, id)
+        Index("ix_users_created_at_id", "created_at", "id"),
+    )
 
     # Core Auth Fields
     id = Column(String, primary_key=True, default=lambda: str(uuid.uuid4()))
@@ -34,5 +38,9 @@ class User(Base):
     portfolio_projects = relationship("PortfolioProject", back_populates="user", cascade="all, delete-orphan")
     comment_likes = relationship("CommentLike", back_populates="user", cascade="all, delete-orphan")
     
+# Case-insensitive prefix search on name and email; text_pattern_ops lets LIKE 'abc%' use the index
+Index("ix_users_lower_name", func.lower(User.name).label("lower_name"), postgresql_ops={"lower_name": "text_pattern_ops"})
+Index("ix_users_lower_email", func.lower(User.email).label("lower_email"), postgresql_ops={"lower_email": "text_pattern_ops"})
+
 from .comment import CommentLike
 CommentLike.user = relationship("User", back_populates="comment_likes")
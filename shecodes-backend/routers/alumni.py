@@ -7,7 +7,7 @@ from models import alumni as alumni_model, user as user_model
 from schemas import alumni as alumni_schema
 from database import get_db
 from core.security import get_current_user
-from core.storage_service import upload_file_to_supabase, delete_file_from_supabase
+from core.storage_service import upload_file_to_supabase, schedule_file_deletion
 
 router = APIRouter(
     prefix="/alumni",
@@ -86,7 +86,7 @@ def update_alumni(
     if image:
         if not image.content_type.startswith("image/"):
             raise HTTPException(status_code=400, detail="Uploaded file is not an image.")
-        delete_file_from_supabase(db_alumni.imageSrc)
+        schedule_file_deletion(db, db_alumni.imageSrc)
         new_image_url = upload_file_to_supabase(image)
 
     alumni_update_data = alumni_schema.AlumniUpdate(
@@ -105,6 +105,6 @@ def delete_alumni(
     if not db_alumni:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Alumni not found")
 
-    delete_file_from_supabase(db_alumni.imageSrc)
+    schedule_file_deletion(db, db_alumni.imageSrc)
     crud.delete_alumni(db, alumni_id=alumni_id)
     return {"message": "Alumni and associated image deleted successfully"}
\ No newline at end of file
@@ -1,6 +1,6 @@
 # /shecodes-backend/routers/auth.py
 
-from fastapi import APIRouter, Depends, HTTPException, status, BackgroundTasks
+from fastapi import APIRouter, Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordRequestForm
 from sqlalchemy.orm import Session
 from datetime import timedelta
@@ -11,21 +11,27 @@ from schemas import user as user_schema
 from schemas import common as common_schema # <-- IMPORT THE NEW COMMON SCHEMAS
 from database import get_db
 from core.config import settings
-from core.security import (
-    create_access_token, create_password_reset_token,
-    create_verification_token
-)
-from core.email_service import send_email, generate_verification_email_content, generate_password_reset_email_content
+from core.security import create_access_token
+from core.email_service import EmailJob
+from core.rate_limit import RateLimiter
+from core import jobs
 
 router = APIRouter(
     prefix="/auth",
     tags=["Authentication"]
 )
 
-@router.post("/register", response_model=common_schema.Msg, status_code=status.HTTP_201_CREATED)
+# Used as dependencies they limit by client IP; .check(email) limits by account
+login_ip_limiter = RateLimiter("login-ip", settings.LOGIN_RATE_LIMIT_IP)
+login_account_limiter = RateLimiter("login-account", settings.LOGIN_RATE_LIMIT_ACCOUNT)
+register_ip_limiter = RateLimiter("register-ip", settings.REGISTER_RATE_LIMIT_IP)
+password_reset_ip_limiter = RateLimiter("password-reset-ip", settings.PASSWORD_RESET_RATE_LIMIT_IP)
+password_reset_account_limiter = RateLimiter("password-reset-account", settings.PASSWORD_RESET_RATE_LIMIT_ACCOUNT)
+
+@router.post("/register", response_model=common_schema.Msg, status_code=status.HTTP_201_CREATED,
+             dependencies=[Depends(register_ip_limiter)])
 def register_user(
     user_in: user_schema.UserCreate,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """Handles new user registration."""
@@ -39,26 +45,18 @@ def register_user(
     new_user = crud.create_user(db=db, user=user_in)
     
     if settings.EMAILS_ENABLED:
-        token_expires = timedelta(hours=settings.EMAIL_VERIFICATION_TOKEN_EXPIRE_HOURS)
-        verification_token = create_verification_token(email=new_user.email, expires_delta=token_expires)
-        verification_link = f"{settings.FRONTEND_URL}/auth/verify-email?token={verification_token}"
-        
-        email_html = generate_verification_email_content(verification_link)
-        background_tasks.add_task(
-            send_email,
-            email_to=new_user.email,
-            subject=settings.EMAIL_VERIFICATION_SUBJECT,
-            html_content=email_html
-        )
+        # The job issues the verification token when it sends the e-mail
+        jobs.enqueue(db, "send_email", EmailJob(email_to=new_user.email, kind="verification"))
     
     return common_schema.Msg(msg="Registration successful. Please check your email to verify your account.")
 
-@router.post("/token", response_model=common_schema.Token)
+@router.post("/token", response_model=common_schema.Token, dependencies=[Depends(login_ip_limiter)])
 def login_for_access_token(
     form_data: OAuth2PasswordRequestForm = Depends(),
     db: Session = Depends(get_db)
 ):
     """Provides a JWT token for valid credentials."""
+    login_account_limiter.check(form_data.username.strip().lower())
     result = crud.authenticate_user(db, email=form_data.username, password=form_data.password)
     if result["status"] == "inactive":
         raise HTTPException(
@@ -109,24 +107,16 @@ def verify_email(token: str, db: Session = Depends(get_db)):
     crud.activate_user(db, user=user)
     return common_schema.Msg(msg="Email verified successfully. You can now log in.")
 
-@router.post("/password-reset/request", response_model=common_schema.Msg, status_code=status.HTTP_202_ACCEPTED)
+@router.post("/password-reset/request", response_model=common_schema.Msg, status_code=status.HTTP_202_ACCEPTED,
+             dependencies=[Depends(password_reset_ip_limiter)])
 def request_password_reset(
     request_body: user_schema.PasswordResetRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
+    password_reset_account_limiter.check(request_body.email.strip().lower())
     user = crud.get_user_by_email(db, email=request_body.email)
     if user and settings.EMAILS_ENABLED:
-        token_expires = timedelta(hours=settings.PASSWORD_RESET_TOKEN_EXPIRE_HOURS)
-        reset_token = create_password_reset_token(email=user.email, expires_delta=token_expires)
-        reset_link = f"{settings.FRONTEND_URL}/auth/reset-password?token={reset_token}"
-        email_html = generate_password_reset_email_content(reset_link)
-        background_tasks.add_task(
-            send_email,
-            email_to=user.email,
-            subject=settings.PASSWORD_RESET_SUBJECT,
-            html_content=email_html
-        )
+        jobs.enqueue(db, "send_email", EmailJob(email_to=user.email, kind="password_reset"))
     return common_schema.Msg(msg="If an account with that email exists, a password reset link has been sent.")
 
 @router.post("/password-reset/confirm", response_model=common_schema.Msg)
@@ -10,7 +10,7 @@ from schemas.blog import ArticleCategoryEnum
 from models import blog as blog_model, user as user_model
 from database import get_db
 from core.security import get_current_user
-from core.storage_service import upload_file_to_supabase, delete_file_from_supabase
+from core.storage_service import upload_file_to_supabase, schedule_file_deletion
 
 router = APIRouter(prefix="/blogs", tags=["Blogs"])
 
@@ -99,7 +99,7 @@ def update_blog(
     if image:
         if not image.content_type.startswith("image/"):
             raise HTTPException(status_code=400, detail="Uploaded file is not an image.")
-        delete_file_from_supabase(db_blog.featured_image_url)
+        schedule_file_deletion(db, db_blog.featured_image_url)
         new_image_url = upload_file_to_supabase(image)
     
     blog_update_data = blog_schema.BlogArticleUpdate(
@@ -118,6 +118,6 @@ def delete_blog(
     if not db_blog:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Blog not found")
 
-    delete_file_from_supabase(db_blog.featured_image_url)
+    schedule_file_deletion(db, db_blog.featured_image_url)
     crud.delete_blog(db, blog_id=blog_id)
     return {"message": "Blog and associated image deleted successfully"}
\ No newline at end of file
@@ -7,7 +7,7 @@ from schemas import champion as champion_schema
 from models import champion as champion_model, user as user_model
 from database import get_db
 from core.security import get_current_user
-from core.storage_service import upload_file_to_supabase, delete_file_from_supabase
+from core.storage_service import upload_file_to_supabase, schedule_file_deletion
 
 router = APIRouter(prefix="/champions", tags=["Champions (Team)"])
 
@@ -46,7 +46,7 @@ def update_champion(
 
     new_image_url = db_champion.image_src
     if image:
-        delete_file_from_supabase(db_champion.image_src)
+        schedule_file_deletion(db, db_champion.image_src)
         new_image_url = upload_file_to_supabase(image)
 
     update_data = champion_schema.ChampionUpdate(
@@ -64,6 +64,6 @@ def delete_champion(
     if not db_champion:
         raise HTTPException(status_code=404, detail="Champion not found")
     
-    delete_file_from_supabase(db_champion.image_src)
+    schedule_file_deletion(db, db_champion.image_src)
     crud.delete_generic_item(db, model=champion_model.Champion, item_id=champion_id)
     return {"message": "Champion deleted"}
\ No newline at end of file
@@ -1,19 +1,52 @@
 # /shecodes-backend/routers/comment.py (Updated)
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
 from typing import List, Optional
+import asyncio
+import json
 
 import crud
 from models import user as user_model
 from schemas import comment as comment_schema
 from database import get_db
 from core.security import get_current_user, get_current_user_optional
+from core.config import settings
+from core.cache import TTLCache
+from core import invalidation, pubsub
 
 router = APIRouter(
     prefix="/comments", 
     tags=["Comments"]
 )
 
+MAX_COUNT_DISCUSSIONS = 100
+
+# discussion_id -> (comment_count, reply_count)
+comment_counts_cache = TTLCache(settings.COMMENT_COUNTS_CACHE_TTL_SECONDS, max_entries=10_000)
+
+def _evict_comment_counts(change: dict) -> None:
+    if change.get("discussion_id") is None:
+        comment_counts_cache.clear()
+    else:
+        comment_counts_cache.delete(change["discussion_id"])
+
+invalidation.on_change("comments", _evict_comment_counts)
+
+def _channel(discussion_id) -> str:
+    return f"comments:{discussion_id}"
+
+def _publish_comment_event(discussion_id: str, comment_id: int, parent_id: Optional[int], message: dict) -> None:
+    """
+    Publishes to every stream that shows this comment: its discussion, and the thread
+    streams (numeric discussion ids) of its parent and of the comment itself.
+    """
+    thread_ids = {discussion_id, str(comment_id)}
+    if parent_id is not None:
+        thread_ids.add(str(parent_id))
+    for thread_id in thread_ids:
+        pubsub.publish(_channel(thread_id), message)
+
 @router.post("/", response_model=comment_schema.CommentResponse, status_code=status.HTTP_201_CREATED)
 def create_comment(
     # Use the new request schema
@@ -27,7 +60,78 @@ def create_comment(
         author=current_user.name,
         avatar=current_user.profile_picture
     )
-    return crud.create_comment(db=db, comment=comment_data)
+    db_comment = crud.create_comment(db=db, comment=comment_data)
+    _publish_comment_event(db_comment.discussion_id, db_comment.id, db_comment.parent_id, {
+        "type": "comment.created",
+        "id": db_comment.id,
+        "comment": comment_schema.CommentResponse.model_validate(db_comment, from_attributes=True).model_dump(mode="json"),
+    })
+    return db_comment
+
+@router.get("/counts", response_model=List[comment_schema.DiscussionCommentCounts])
+def get_comment_counts(
+    discussion_id: List[str] = Query(..., description="Repeat for each discussion, e.g. ?discussion_id=a&discussion_id=b"),
+    db: Session = Depends(get_db)
+):
+    """
+    Returns comment and reply counts for many discussions at once, in the order requested,
+    e.g. for the comment badges on blog and event cards.
+    """
+    discussion_ids = list(dict.fromkeys(discussion_id)) # Drop duplicates, keep the order
+    if len(discussion_ids) > MAX_COUNT_DISCUSSIONS:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"At most {MAX_COUNT_DISCUSSIONS} discussions can be counted per request."
+        )
+
+    counts = {}
+    missing = []
+    for key in discussion_ids:
+        cached = comment_counts_cache.get(key)
+        if cached is None:
+            missing.append(key)
+        else:
+            counts[key] = cached
+    if missing:
+        fetched = crud.get_comment_counts(db, missing)
+        for key in missing:
+            counts[key] = fetched.get(key, (0, 0))
+            comment_counts_cache.set(key, counts[key])
+
+    return [
+        comment_schema.DiscussionCommentCounts(discussion_id=key, comment_count=counts[key][0], reply_count=counts[key][1])
+        for key in discussion_ids
+    ]
+
+@router.get("/{discussion_id}/stream")
+async def stream_discussion(discussion_id: str):
+    """
+    Server-Sent Events stream of changes to a discussion (or a thread, for a numeric id):
+    `comment.created` (with the comment), `comment.deleted` and `comment.liked` (with the new like count).
+    Clients that cannot keep up are disconnected and should reconnect and re-fetch the thread.
+    """
+    subscription = pubsub.get_broker().subscribe(_channel(discussion_id), maxsize=settings.SSE_CLIENT_BUFFER)
+
+    async def events():
+        try:
+            yield "retry: 3000\n\n"
+            while True:
+                try:
+                    message = await asyncio.wait_for(subscription.get(), timeout=settings.SSE_KEEPALIVE_SECONDS)
+                except asyncio.TimeoutError:
+                    yield ": keep-alive\n\n" # Keeps proxies from closing an idle connection
+                    continue
+                if message is None: # Dropped for falling behind
+                    break
+                yield f"event: {message['type']}\ndata: {json.dumps(message)}\n\n"
+        finally:
+            subscription.close()
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
 
 @router.get("/{discussion_id}", response_model=List[comment_schema.CommentResponse])
 def get_comments_for_discussion(
@@ -57,22 +161,25 @@ def get_my_liked_comment_ids(
     return crud.get_liked_comment_ids_by_user(db, user_id=current_user.id)
 
 
-@router.put("/{comment_id}/like", response_model=comment_schema.CommentResponse)
+@router.put("/{comment_id}/like", response_model=comment_schema.CommentLikeToggleResponse)
 def toggle_like_on_comment(
     comment_id: int, 
     db: Session = Depends(get_db),
     current_user: user_model.User = Depends(get_current_user)
 ):
-    db_comment = crud.get_comment(db, comment_id=comment_id)
-    if not db_comment:
+    """
+    Likes or unlikes the comment for the current user and returns the resulting state.
+    """
+    result = crud.toggle_comment_like(db=db, comment_id=comment_id, user_id=current_user.id)
+    if result is None:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Comment not found")
 
-    updated_comment = crud.toggle_comment_like(db=db, comment_id=comment_id, user_id=current_user.id)
-    
-    # Manually set the flag for the response
-    updated_comment.is_liked_by_current_user = True # If we just liked it, it's true. If we unliked, we'll fix on frontend.
-    
-    return updated_comment
+    _publish_comment_event(result["discussion_id"], comment_id, result["parent_id"], {
+        "type": "comment.liked", "id": comment_id, "like_count": result["like_count"]
+    })
+    return comment_schema.CommentLikeToggleResponse(
+        id=comment_id, is_liked_by_current_user=result["liked"], like_count=result["like_count"]
+    )
 
 # DELETE endpoint remains the same, but ensure you add authorization in a real app
 @router.delete("/{comment_id}", status_code=status.HTTP_204_NO_CONTENT)
@@ -89,5 +196,9 @@ def delete_comment(
     if db_comment.author != current_user.name and current_user.role != 'admin':
         raise HTTPException(status_code=403, detail="Not authorized to delete this comment")
 
+    discussion_id, parent_id = db_comment.discussion_id, db_comment.parent_id
     crud.delete_comment(db, comment_id=comment_id)
+    _publish_comment_event(discussion_id, comment_id, parent_id, {
+        "type": "comment.deleted", "id": comment_id, "discussion_id": discussion_id
+    })
     return {"message": "Comment deleted successfully"}
\ No newline at end of file
@@ -9,7 +9,7 @@ from models import documentation as doc_model, user as user_model
 from schemas import documentation as doc_schema
 from database import get_db
 from core.security import get_current_user
-from core.storage_service import upload_file_to_supabase, delete_file_from_supabase
+from core.storage_service import upload_file_to_supabase, schedule_file_deletion
 
 router = APIRouter(
     prefix="/documentations",
@@ -42,7 +42,7 @@ def update_documentation(
     if not image.content_type.startswith("image/"):
         raise HTTPException(status_code=400, detail="Uploaded file is not an image.")
         
-    delete_file_from_supabase(db_doc.image_src)
+    schedule_file_deletion(db, db_doc.image_src)
     new_image_url = upload_file_to_supabase(image)
 
     doc_update_data = doc_schema.DocumentationUpdate(image_src=new_image_url)
@@ -58,7 +58,7 @@ def delete_documentation(
     if not db_doc:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Documentation not found")
 
-    delete_file_from_supabase(db_doc.image_src)
+    schedule_file_deletion(db, db_doc.image_src)
     crud.delete_generic_item(db, model=doc_model.Documentation, item_id=doc_id)
     return {"message": "Documentation and associated image deleted successfully"}
 
@@ -1,13 +1,15 @@
 # /shecodes-backend/routers/event.py
-from fastapi import APIRouter, HTTPException, Depends, status
+from fastapi import APIRouter, HTTPException, Depends, status, Query
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Optional
+from datetime import datetime
 
 import crud
 from models import user as user_model
 from schemas import event as event_schema
 from database import get_db
 from core.security import get_current_user
+from core.pagination import encode_cursor, decode_cursor
 
 router = APIRouter(
     prefix="/events",
@@ -23,8 +25,52 @@ def create_event(
     return crud.create_event(db=db, event_data=event_data)
 
 @router.get("/", response_model=List[event_schema.EventResponse])
-def get_all_events(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
-    return crud.get_all_events(db, skip=skip, limit=limit)
+def get_all_events(
+    skip: int = 0,
+    limit: int = 100,
+    status_filter: Optional[event_schema.EventStatusEnum] = Query(
+        None, alias="status", description="Only return events that are currently upcoming, ongoing or past"
+    ),
+    db: Session = Depends(get_db)
+):
+    return crud.get_all_events(db, skip=skip, limit=limit, status=status_filter)
+
+@router.get("/search", response_model=event_schema.EventPage)
+def search_events(
+    event_type: Optional[event_schema.EventTypeEnum] = None,
+    start_from: Optional[datetime] = Query(None, description="Only events starting at or after this time"),
+    start_to: Optional[datetime] = Query(None, description="Only events starting at or before this time"),
+    tag: Optional[List[str]] = Query(None, description="Only events having all of these tags"),
+    mentor_id: Optional[int] = None,
+    location: Optional[str] = Query(None, description="Case-insensitive substring of the location"),
+    status_filter: Optional[event_schema.EventStatusEnum] = Query(None, alias="status"),
+    cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page"),
+    limit: int = Query(20, ge=1, le=100),
+    db: Session = Depends(get_db)
+):
+    """
+    Searches events by type, start date range, tags, mentor, location and status.
+    Results are ordered by start date and paginated with an opaque cursor.
+    """
+    decoded_cursor = tuple(decode_cursor(cursor, datetime, int)) if cursor else None
+    events = crud.search_events(
+        db,
+        limit=limit + 1, # Fetch one extra row to know whether there is a next page
+        cursor=decoded_cursor,
+        event_type=event_type,
+        start_from=start_from,
+        start_to=start_to,
+        tags=tag,
+        mentor_id=mentor_id,
+        location=location,
+        status=status_filter
+    )
+
+    next_cursor = None
+    if len(events) > limit:
+        events = events[:limit]
+        next_cursor = encode_cursor(events[-1].start_date, events[-1].id)
+    return event_schema.EventPage(items=events, next_cursor=next_cursor)
 
 @router.get("/{event_id}", response_model=event_schema.EventResponse)
 def get_event_by_id(event_id: int, db: Session = Depends(get_db)):
@@ -21,12 +21,8 @@ def create_faq(
     db: Session = Depends(get_db),
     current_user: user_model.User = Depends(get_current_user)
 ):
-    # The ID is part of the create schema for this model, so we can't use the generic create
-    db_faq = faq_model.FAQItem(**faq.model_dump())
-    db.add(db_faq)
-    db.commit()
-    db.refresh(db_faq)
-    return db_faq
+    # The ID is part of the create schema for this model; the generic create passes it through
+    return crud.create_generic_item(db, model=faq_model.FAQItem, schema=faq)
 
 @router.get("/", response_model=List[faq_schema.FAQItemResponse])
 def get_all_faqs(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
@@ -0,0 +1,59 @@
+# /shecodes-backend/routers/job.py
+from typing import List, Optional
+
+from fastapi import APIRouter, HTTPException, Depends, Query, status
+from sqlalchemy.orm import Session
+
+import crud
+from models import user as user_model
+from schemas import job as job_schema
+from database import get_db
+from core.security import get_current_user
+
+router = APIRouter(
+    prefix="/jobs",
+    tags=["Jobs"]
+)
+
+@router.get("/stats", response_model=job_schema.JobQueueStats)
+def get_job_queue_stats(
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user)
+):
+    """
+    Returns the depth of the job queue (overall and per job type), how long the oldest
+    due job has been waiting, and the number of failed jobs. Requires admin authentication.
+    """
+    if current_user.role != 'admin':
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+    return crud.get_job_queue_stats(db)
+
+@router.get("/failed", response_model=List[job_schema.JobResponse])
+def get_failed_jobs(
+    type: Optional[str] = Query(None, description="Only jobs of this type"),
+    limit: int = Query(50, ge=1, le=500),
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user)
+):
+    """
+    Lists jobs that used up their attempts, most recent first, with their last error.
+    Requires admin authentication.
+    """
+    if current_user.role != 'admin':
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+    return crud.get_failed_jobs(db, job_type=type, limit=limit)
+
+@router.post("/{job_id}/retry", response_model=job_schema.JobResponse)
+def retry_failed_job(
+    job_id: int,
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user)
+):
+    """Queues a failed job again with a fresh set of attempts. Requires admin authentication."""
+    if current_user.role != 'admin':
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    db_job = crud.retry_failed_job(db, job_id)
+    if db_job is None:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Failed job not found")
+    return db_job
@@ -1,15 +1,15 @@
 # /shecodes-backend/routers/mentor.py
 
-from fastapi import APIRouter, HTTPException, Depends, status, Form, File, UploadFile
+from fastapi import APIRouter, HTTPException, Depends, status, Form, File, UploadFile, Query
 from sqlalchemy.orm import Session
-from typing import List, Optional
+from typing import List, Optional, Literal
 
 import crud
 from models import mentor as mentor_model, user as user_model
 from schemas import mentor as mentor_schema
 from database import get_db
 from core.security import get_current_user
-from core.storage_service import upload_file_to_supabase, delete_file_from_supabase
+from core.storage_service import upload_file_to_supabase, schedule_file_deletion
 
 router = APIRouter(
     prefix="/mentors",
@@ -47,6 +47,19 @@ def create_mentor_with_upload(
 def get_all_mentors(skip: int = 0, limit: int = 100, db: Session = Depends(get_db)):
     return crud.get_all_generic_items(db, model=mentor_model.Mentor, skip=skip, limit=limit)
 
+@router.get("/directory", response_model=List[mentor_schema.MentorDirectoryEntry])
+def get_mentor_directory(
+    status_filter: Optional[Literal['active', 'inactive']] = Query(None, alias="status"),
+    skip: int = 0,
+    limit: int = 100,
+    db: Session = Depends(get_db)
+):
+    """
+    Lists mentors together with how many events they mentor and their next upcoming event.
+    Can be filtered by mentor status.
+    """
+    return crud.get_mentor_directory(db, status=status_filter, skip=skip, limit=limit)
+
 @router.get("/{mentor_id}", response_model=mentor_schema.MentorResponse)
 def get_mentor_by_id(mentor_id: int, db: Session = Depends(get_db)):
     db_mentor = crud.get_generic_item(db, model=mentor_model.Mentor, item_id=mentor_id)
@@ -74,7 +87,7 @@ def update_mentor(
     if image:
         if not image.content_type.startswith("image/"):
             raise HTTPException(status_code=400, detail="Uploaded file is not an image.")
-        delete_file_from_supabase(db_mentor.imageSrc)
+        schedule_file_deletion(db, db_mentor.imageSrc)
         new_image_url = upload_file_to_supabase(image)
 
     mentor_update_data = mentor_schema.MentorUpdate(
@@ -92,6 +105,6 @@ def delete_mentor(
     if not db_mentor:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Mentor not found")
 
-    delete_file_from_supabase(db_mentor.imageSrc)
+    schedule_file_deletion(db, db_mentor.imageSrc)
     crud.delete_generic_item(db, model=mentor_model.Mentor, item_id=mentor_id)
     return {"message": "Mentor and associated image deleted successfully"}
\ No newline at end of file
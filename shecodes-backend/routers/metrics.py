@@ -0,0 +1,16 @@
+# /shecodes-backend/routers/metrics.py
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from core.metrics import registry
+
+router = APIRouter(
+    tags=["Monitoring"]
+)
+
+PROMETHEUS_CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+@router.get("/metrics", include_in_schema=False)
+def read_metrics():
+    """Request and database metrics of this worker in Prometheus text format."""
+    return PlainTextResponse(registry.render(), media_type=PROMETHEUS_CONTENT_TYPE)
@@ -1,15 +1,25 @@
 # /shecodes-backend/routers/participant.py
 
-from fastapi import APIRouter, HTTPException, Depends, status, File, UploadFile
+from fastapi import APIRouter, HTTPException, Depends, status, File, UploadFile, Query
+from fastapi.responses import StreamingResponse
 from sqlalchemy.orm import Session
-from typing import List
+from typing import List, Iterator, Literal
+from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from pathlib import PurePosixPath
+import csv
+import io
+import mimetypes
+import tempfile
+import zipfile
 
 import crud
 from models import user as user_model
 from schemas import participant as participant_schema, common as common_schema
-from database import get_db
+from database import get_db, SessionLocal
+from core.config import settings
 from core.security import get_current_user
-from core.storage_service import upload_file_to_supabase
+from core.storage_service import upload_file_to_supabase, upload_bytes_to_supabase
 
 router = APIRouter(
     prefix="/participants",
@@ -47,6 +57,25 @@ def add_participant(
             detail=error_detail
         )
 
+@router.post("/batch", response_model=participant_schema.ParticipantBatchResponse, status_code=status.HTTP_201_CREATED)
+def add_participants_in_batch(
+    participants: List[participant_schema.ParticipantCreate],
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user) # Protected
+):
+    """
+    Registers many members for one or more events in a single request.
+    Unknown events/members and existing registrations are skipped and reported.
+    Requires admin authentication.
+    """
+    if current_user.role != 'admin':
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    if not participants:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="No participants provided.")
+
+    return crud.create_participants_bulk(db, participants=participants)
+
 @router.get("/event/{event_id}", response_model=List[participant_schema.ParticipantResponse])
 def get_event_participants(event_id: int, db: Session = Depends(get_db)):
     """
@@ -59,6 +88,86 @@ def get_event_participants(event_id: int, db: Session = Depends(get_db)):
         raise HTTPException(status_code=404, detail="Event not found")
     return crud.get_participants_by_event(db, event_id=event_id)
 
+EXPORT_COLUMNS = ["participant_id", "name", "email", "status", "registration_date", "certificate_url"]
+EXPORT_CHUNK_ROWS = 500
+
+def _export_cell(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return "" if value is None else value
+
+def _stream_participants_csv(event_id: int) -> Iterator[bytes]:
+    # The request-scoped session is closed before a streaming body is sent,
+    # so the export owns its own session for the lifetime of the stream.
+    db = SessionLocal()
+    try:
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(EXPORT_COLUMNS)
+        for index, row in enumerate(crud.iter_participant_export_rows(db, event_id=event_id), start=1):
+            writer.writerow([_export_cell(value) for value in row])
+            if index % EXPORT_CHUNK_ROWS == 0:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate(0)
+        yield buffer.getvalue().encode("utf-8")
+    finally:
+        db.close()
+
+def _stream_participants_xlsx(event_id: int) -> Iterator[bytes]:
+    from openpyxl import Workbook
+
+    db = SessionLocal()
+    try:
+        # write_only workbooks flush rows to a temp file as they are appended,
+        # so memory stays flat; the finished archive is then streamed in chunks.
+        workbook = Workbook(write_only=True)
+        sheet = workbook.create_sheet(title="Participants")
+        sheet.append(EXPORT_COLUMNS)
+        for row in crud.iter_participant_export_rows(db, event_id=event_id):
+            sheet.append([_export_cell(value) for value in row])
+    finally:
+        db.close()
+
+    with tempfile.TemporaryFile() as tmp:
+        workbook.save(tmp)
+        tmp.seek(0)
+        while chunk := tmp.read(64 * 1024):
+            yield chunk
+
+@router.get("/event/{event_id}/export")
+def export_event_participants(
+    event_id: int,
+    format: Literal["csv", "xlsx"] = Query("csv", description="Export file format"),
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user) # Protected
+):
+    """
+    Streams the participants of an event, with member name and email, as CSV or XLSX.
+    Rows are read through a server-side cursor, so memory use does not grow with event size.
+    Requires admin authentication.
+    """
+    if current_user.role != 'admin':
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    event = crud.get_event(db, event_id=event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    if format == "xlsx":
+        body = _stream_participants_xlsx(event_id)
+        media_type = "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet"
+    else:
+        body = _stream_participants_csv(event_id)
+        media_type = "text/csv; charset=utf-8"
+
+    filename = f"event-{event_id}-participants.{format}"
+    return StreamingResponse(
+        body,
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="{filename}"'}
+    )
+
 @router.patch("/{participant_id}/status", response_model=participant_schema.ParticipantResponse)
 def update_participant_status(
     participant_id: int,
@@ -131,3 +240,103 @@ def upload_certificate_for_participant(
     crud.update_participant_certificate(db, db_participant=db_participant, certificate_url=certificate_url)
     
     return common_schema.Msg(msg="Certificate uploaded successfully")
+
+MAX_CERTIFICATE_BYTES = 10 * 1024 * 1024
+
+def _upload_archive_entry(archive: zipfile.ZipFile, info: zipfile.ZipInfo, content_type: str) -> str:
+    # Entries are only decompressed when a worker picks them up, so at most
+    # STORAGE_UPLOAD_CONCURRENCY certificates are held in memory at a time.
+    with archive.open(info) as entry:
+        return upload_bytes_to_supabase(entry.read(), content_type)
+
+@router.post("/event/{event_id}/certificates", response_model=participant_schema.CertificateBatchResponse)
+def upload_certificates_from_archive(
+    event_id: int,
+    archive_file: UploadFile = File(...),
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user)
+):
+    """
+    Uploads certificates for many participants of an event from one ZIP archive.
+    Each file must be named after the participant ID or the member's email,
+    e.g. `42.png` or `jane@example.com.jpg`.
+    Returns a per-file report. Requires admin authentication.
+    """
+    if current_user.role != 'admin':
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    event = crud.get_event(db, event_id=event_id)
+    if not event:
+        raise HTTPException(status_code=404, detail="Event not found")
+
+    try:
+        archive = zipfile.ZipFile(archive_file.file)
+    except zipfile.BadZipFile:
+        raise HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="File must be a valid ZIP archive.")
+
+    targets = crud.get_participant_certificate_targets(db, event_id=event_id)
+    participant_ids = {participant_id for participant_id, _ in targets}
+    participant_by_email = {email.lower(): participant_id for participant_id, email in targets}
+
+    results: List[participant_schema.CertificateUploadResult] = []
+    pending = []
+    claimed = set()
+
+    for info in archive.infolist():
+        if info.is_dir() or info.filename.startswith("__MACOSX/"):
+            continue
+        name = PurePosixPath(info.filename).name
+        if name.startswith("."):
+            continue
+
+        stem = PurePosixPath(name).stem
+        content_type = mimetypes.guess_type(name)[0]
+        if stem.isdigit() and int(stem) in participant_ids:
+            participant_id = int(stem)
+        else:
+            participant_id = participant_by_email.get(stem.lower())
+
+        def report(result_status, detail):
+            results.append(participant_schema.CertificateUploadResult(
+                filename=info.filename, participant_id=participant_id, status=result_status, detail=detail
+            ))
+
+        if participant_id is None:
+            report("skipped", "No participant of this event matches the file name.")
+        elif participant_id in claimed:
+            report("skipped", "Another file in the archive already targets this participant.")
+        elif not content_type or not content_type.startswith("image/"):
+            report("failed", "File must be an image.")
+        elif info.file_size > MAX_CERTIFICATE_BYTES:
+            report("failed", "File is too large.")
+        else:
+            claimed.add(participant_id)
+            pending.append((info, participant_id, content_type))
+
+    certificate_urls = {}
+    with ThreadPoolExecutor(max_workers=max(1, settings.STORAGE_UPLOAD_CONCURRENCY)) as executor:
+        futures = {
+            executor.submit(_upload_archive_entry, archive, info, content_type): (info, participant_id)
+            for info, participant_id, content_type in pending
+        }
+        for future in as_completed(futures):
+            info, participant_id = futures[future]
+            try:
+                certificate_urls[participant_id] = future.result()
+                results.append(participant_schema.CertificateUploadResult(
+                    filename=info.filename, participant_id=participant_id, status="uploaded"
+                ))
+            except Exception as e:
+                detail = e.detail if isinstance(e, HTTPException) else str(e)
+                results.append(participant_schema.CertificateUploadResult(
+                    filename=info.filename, participant_id=participant_id, status="failed", detail=detail
+                ))
+
+    crud.update_participant_certificates_bulk(db, certificate_urls=certificate_urls)
+
+    return participant_schema.CertificateBatchResponse(
+        uploaded=sum(1 for r in results if r.status == "uploaded"),
+        skipped=sum(1 for r in results if r.status == "skipped"),
+        failed=sum(1 for r in results if r.status == "failed"),
+        results=results
+    )
@@ -9,7 +9,7 @@ from models import partner as partner_model, user as user_model
 from schemas import partner as partner_schema
 from database import get_db
 from core.security import get_current_user
-from core.storage_service import upload_file_to_supabase, delete_file_from_supabase
+from core.storage_service import upload_file_to_supabase, schedule_file_deletion
 
 router = APIRouter(
     prefix="/partners",
@@ -66,8 +66,8 @@ def update_partner(
         if not logo.content_type.startswith("image/"):
             raise HTTPException(status_code=400, detail="Uploaded file is not an image.")
         
-        # Delete the old logo from Supabase before uploading the new one
-        delete_file_from_supabase(db_partner.logoSrc)
+        # Queue the old logo for deletion from Supabase before uploading the new one
+        schedule_file_deletion(db, db_partner.logoSrc)
         new_logo_url = upload_file_to_supabase(logo)
 
     partner_update_data = partner_schema.PartnerUpdate(name=name, logoSrc=new_logo_url)
@@ -83,8 +83,8 @@ def delete_partner(
     if not db_partner:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Partner not found")
 
-    # Delete the image from Supabase first
-    delete_file_from_supabase(db_partner.logoSrc)
+    # Queue the image for deletion from Supabase first
+    schedule_file_deletion(db, db_partner.logoSrc)
     
     # Then delete the database record
     crud.delete_generic_item(db, model=partner_model.Partner, item_id=partner_id)
@@ -8,7 +8,7 @@ from schemas import portfolio as portfolio_schema
 from models import portfolio as portfolio_model, user as user_model
 from database import get_db
 from core.security import get_current_user
-from core.storage_service import upload_file_to_supabase, delete_file_from_supabase
+from core.storage_service import upload_file_to_supabase, schedule_file_deletion
 
 router = APIRouter(prefix="/portfolio", tags=["Portfolio Projects"])
 
@@ -60,7 +60,7 @@ def update_portfolio_project(
     if image:
         if not image.content_type.startswith("image/"):
             raise HTTPException(status_code=400, detail="Uploaded file is not an image.")
-        delete_file_from_supabase(db_project.image_url)
+        schedule_file_deletion(db, db_project.image_url)
         new_image_url = upload_file_to_supabase(image)
 
     update_data = portfolio_schema.PortfolioProjectUpdate(
@@ -82,6 +82,6 @@ def delete_portfolio_project(
     if db_project.user_id != current_user.id:
         raise HTTPException(status_code=403, detail="Not authorized to delete this project")
     
-    delete_file_from_supabase(db_project.image_url)
+    schedule_file_deletion(db, db_project.image_url)
     crud.delete_generic_item(db, model=portfolio_model.PortfolioProject, item_id=project_id)
     return {"message": "Portfolio project deleted"}
\ No newline at end of file
@@ -0,0 +1,59 @@
+# /shecodes-backend/routers/stats.py
+from datetime import datetime
+
+from fastapi import APIRouter, HTTPException, Depends, status
+from sqlalchemy.orm import Session
+
+import crud
+from models import user as user_model
+from schemas import stats as stats_schema
+from database import get_db
+from core.security import get_current_user
+
+router = APIRouter(
+    prefix="/stats",
+    tags=["Statistics"]
+)
+
+def _dashboard_response(snapshot) -> stats_schema.DashboardStatsResponse:
+    return stats_schema.DashboardStatsResponse(
+        **snapshot.data,
+        refreshed_at=snapshot.refreshed_at,
+        age_seconds=round((datetime.utcnow() - snapshot.refreshed_at).total_seconds(), 1),
+    )
+
+@router.get("/dashboard", response_model=stats_schema.DashboardStatsResponse)
+def get_dashboard_stats(
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user)
+):
+    """
+    Returns the precomputed admin dashboard totals and when they were computed.
+    The snapshot is refreshed in the background every DASHBOARD_STATS_REFRESH_SECONDS.
+    Requires admin authentication.
+    """
+    if current_user.role != 'admin':
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    snapshot = crud.get_stats_snapshot(db, crud.DASHBOARD_STATS)
+    if snapshot is None:
+        # First request after deploying: compute it now, or wait for the worker already doing so
+        snapshot = crud.refresh_dashboard_stats(db, min_age_seconds=float("inf"), wait=True)
+    return _dashboard_response(snapshot)
+
+@router.post("/dashboard/refresh", response_model=stats_schema.DashboardStatsResponse)
+def refresh_dashboard_stats(
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user)
+):
+    """
+    Recomputes the dashboard totals now instead of waiting for the next scheduled refresh.
+    Requires admin authentication.
+    """
+    if current_user.role != 'admin':
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized")
+
+    snapshot = crud.refresh_dashboard_stats(db)
+    if snapshot is None:
+        raise HTTPException(status_code=status.HTTP_409_CONFLICT, detail="A refresh is already running.")
+    return _dashboard_response(snapshot)
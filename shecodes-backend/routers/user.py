@@ -1,9 +1,9 @@
 # /shecodes-backend/routers/user.py (Final and Complete)
 
-from fastapi import APIRouter, HTTPException, Depends, status, File, UploadFile, Form
+from fastapi import APIRouter, HTTPException, Depends, status, File, UploadFile, Form, Query
 from sqlalchemy.orm import Session
 from typing import List, Optional
-from datetime import date
+from datetime import date, datetime
 
 import crud
 from models import user as user_model
@@ -11,7 +11,8 @@ from schemas import user as user_schema
 from schemas.user import RoleEnum # Import RoleEnum for type hinting
 from database import get_db
 from core.security import get_current_user
-from core.storage_service import upload_file_to_supabase, delete_file_from_supabase
+from core.pagination import encode_cursor, decode_cursor
+from core.storage_service import upload_file_to_supabase, schedule_file_deletion
 from schemas import common as common_schema 
 from core.security import verify_password
 
@@ -44,7 +45,7 @@ def update_my_profile(
         if not picture.content_type.startswith("image/"):
             raise HTTPException(status_code=400, detail="Uploaded file is not an image.")
         # Delete the old picture if it exists before uploading the new one
-        delete_file_from_supabase(current_user.profile_picture)
+        schedule_file_deletion(db, current_user.profile_picture)
         new_picture_url = upload_file_to_supabase(picture)
 
     # Create the Pydantic schema object with all the form data
@@ -79,7 +80,7 @@ def delete_user(
     if not db_user_to_delete:
         raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="User not found")
         
-    delete_file_from_supabase(db_user_to_delete.profile_picture)
+    schedule_file_deletion(db, db_user_to_delete.profile_picture)
     crud.delete_user(db, user_id=user_id)
     return {"message": "User and associated data deleted successfully"}
 
@@ -105,6 +106,40 @@ def read_all_users(
     users = crud.get_all_users(db, skip=skip, limit=limit)
     return users
 
+@router.get("/search", response_model=user_schema.UserPage)
+def search_users(
+    role: Optional[RoleEnum] = None,
+    is_verified: Optional[bool] = None,
+    q: Optional[str] = Query(None, description="Case-insensitive prefix of the name or email"),
+    participation_count: bool = Query(False, description="Include each user's number of event registrations"),
+    cursor: Optional[str] = Query(None, description="`next_cursor` from the previous page"),
+    limit: int = Query(50, ge=1, le=200),
+    db: Session = Depends(get_db),
+    current_user: user_model.User = Depends(get_current_user)
+):
+    """
+    Lists users for the admin area, newest first, without their participation history. (Admin access only).
+    """
+    if current_user.role != RoleEnum.admin:
+        raise HTTPException(status_code=status.HTTP_403_FORBIDDEN, detail="Not authorized to view all users")
+
+    decoded_cursor = tuple(decode_cursor(cursor, datetime, str)) if cursor else None
+    users = crud.search_users(
+        db,
+        limit=limit + 1, # Fetch one extra row to know whether there is a next page
+        cursor=decoded_cursor,
+        role=role,
+        is_verified=is_verified,
+        search=q,
+        with_participation_count=participation_count
+    )
+
+    next_cursor = None
+    if len(users) > limit:
+        users = users[:limit]
+        next_cursor = encode_cursor(users[-1].created_at, users[-1].id)
+    return user_schema.UserPage(items=users, next_cursor=next_cursor)
+
 @router.get("/{user_id}", response_model=user_schema.UserResponse)
 def read_user_by_id(
     user_id: str,
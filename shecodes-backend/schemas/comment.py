@@ -56,4 +56,15 @@ class CommentResponse(BaseModel):
         return len(self.comment_likes)
 
     class Config:
-        orm_mode = True
\ No newline at end of file
+        orm_mode = True
+
+class CommentLikeToggleResponse(BaseModel):
+    """The state after toggling a like; field names match `CommentResponse`."""
+    id: int
+    is_liked_by_current_user: bool
+    like_count: int
+
+class DiscussionCommentCounts(BaseModel):
+    discussion_id: str
+    comment_count: int = 0 # Top-level comments
+    reply_count: int = 0
@@ -1,4 +1,4 @@
-from pydantic import BaseModel, ConfigDict
+from pydantic import BaseModel, ConfigDict, Field, AliasChoices
 from typing import Optional, List, Any, Literal
 from enum import Enum
 from datetime import datetime
@@ -11,6 +11,9 @@ class SkillBase(BaseModel):
 class SkillCreate(SkillBase):
     pass
 
+class SkillUpdate(SkillBase):
+    id: Optional[int] = None # None creates a new skill
+
 class SkillResponse(SkillBase):
     id: int
     model_config = ConfigDict(from_attributes=True)
@@ -22,6 +25,9 @@ class BenefitBase(BaseModel):
 class BenefitCreate(BenefitBase):
     pass
 
+class BenefitUpdate(BenefitBase):
+    id: Optional[int] = None # None creates a new benefit
+
 class BenefitResponse(BenefitBase):
     id: int
     model_config = ConfigDict(from_attributes=True)
@@ -35,6 +41,9 @@ class SessionBase(BaseModel):
 class SessionCreate(SessionBase):
     pass
 
+class SessionUpdate(SessionBase):
+    id: Optional[int] = None # None creates a new session
+
 class SessionResponse(SessionBase):
     id: int
     model_config = ConfigDict(from_attributes=True)
@@ -83,6 +92,8 @@ class EventCreate(EventBase):
 class EventResponse(EventBase):
     id: int
     created_at: datetime
+    # Derived from start/end dates at read time (Event.current_status) rather than the stored column
+    status: EventStatusEnum = Field(validation_alias=AliasChoices("current_status", "status"))
     mentors: List[MentorResponse] = []
     skills: List[SkillResponse] = []
     benefits: List[BenefitResponse] = []
@@ -91,4 +102,15 @@ class EventResponse(EventBase):
     model_config = ConfigDict(from_attributes=True)
 
 class EventUpdate(EventBase):
-    pass
\ No newline at end of file
+    # Relationship fields are only synchronized when present in the payload.
+    # Items with an id update that row, items without one are created, and
+    # existing rows missing from the list are deleted.
+    mentors: Optional[List[int]] = None
+    skills: Optional[List[SkillUpdate]] = None
+    benefits: Optional[List[BenefitUpdate]] = None
+    sessions: Optional[List[SessionUpdate]] = None
+
+class EventPage(BaseModel):
+    """A page of events from the search API; pass `next_cursor` back to get the next page."""
+    items: List[EventResponse]
+    next_cursor: Optional[str] = None
@@ -0,0 +1,36 @@
+# /shecodes-backend/schemas/job.py
+
+from pydantic import BaseModel, ConfigDict
+from typing import Any, Dict, List, Optional
+from datetime import datetime
+
+class JobTypeStats(BaseModel):
+    type: str
+    queued: int = 0
+    running: int = 0
+    succeeded: int = 0
+    failed: int = 0
+
+class JobQueueStats(BaseModel):
+    """Queue depth for the admin dashboard; succeeded jobs are only kept for JOB_RETENTION_DAYS."""
+    queued: int = 0
+    # Queued jobs whose run_at has passed, i.e. waiting for a free worker
+    due: int = 0
+    running: int = 0
+    failed: int = 0
+    # How long the oldest due job has been waiting
+    oldest_due_seconds: Optional[float] = None
+    by_type: List[JobTypeStats] = []
+
+class JobResponse(BaseModel):
+    id: int
+    type: str
+    payload: Dict[str, Any]
+    status: str
+    attempts: int
+    max_attempts: int
+    run_at: datetime
+    last_error: Optional[str] = None
+    created_at: datetime
+    finished_at: Optional[datetime] = None
+    model_config = ConfigDict(from_attributes=True)
@@ -1,5 +1,6 @@
 from pydantic import BaseModel, ConfigDict
 from typing import Optional, Literal
+from datetime import datetime
 
 class MentorBase(BaseModel):
     name: str
@@ -19,4 +20,12 @@ class MentorUpdate(MentorBase):
 
 class MentorResponse(MentorBase):
     id: int
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class MentorDirectoryEntry(MentorResponse):
+    """A mentor with aggregated statistics over the events they mentor."""
+    events_mentored: int = 0
+    upcoming_events: int = 0
+    next_event_id: Optional[int] = None
+    next_event_title: Optional[str] = None
+    next_event_start: Optional[datetime] = None
@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Optional
+from typing import TYPE_CHECKING, Optional, List, Literal
 from datetime import datetime
 from pydantic import BaseModel, Field, ConfigDict
 from .event import EventResponse
@@ -23,4 +23,28 @@ class ParticipantResponse(ParticipantBase):
     registration_date: datetime
     event: EventResponse
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
+
+class ParticipantKey(BaseModel):
+    event_id: int
+    member_id: str
+
+class ParticipantBatchResponse(BaseModel):
+    """Summary of a bulk registration: what was inserted and what was skipped."""
+    created: int
+    duplicates: List[ParticipantKey] = []
+    missing_event_ids: List[int] = []
+    missing_member_ids: List[str] = []
+
+class CertificateUploadResult(BaseModel):
+    filename: str
+    participant_id: Optional[int] = None
+    status: Literal["uploaded", "skipped", "failed"]
+    detail: Optional[str] = None
+
+class CertificateBatchResponse(BaseModel):
+    """Per-file report for a bulk certificate upload."""
+    uploaded: int
+    skipped: int
+    failed: int
+    results: List[CertificateUploadResult] = []
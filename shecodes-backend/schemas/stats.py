@@ -0,0 +1,33 @@
+# /shecodes-backend/schemas/stats.py
+
+from pydantic import BaseModel
+from typing import Dict, List, Optional
+from datetime import datetime
+
+class EventRegistrationStats(BaseModel):
+    event_id: int
+    title: str
+    start_date: datetime
+    registered: int = 0
+    attended: int = 0
+    cancelled: int = 0
+    # attended / (registered + attended); only set once the event has ended
+    attendance_rate: Optional[float] = None
+
+class DashboardStats(BaseModel):
+    """Totals for the admin dashboard, as stored in the snapshot table."""
+    users_total: int = 0
+    users_by_role: Dict[str, int] = {}
+    verified_users: int = 0
+    verified_ratio: float = 0.0
+    registrations_total: int = 0
+    registrations_by_status: Dict[str, int] = {}
+    # Over all ended events, cancelled registrations excluded
+    attendance_rate: Optional[float] = None
+    recent_events: List[EventRegistrationStats] = []
+    blogs_total: int = 0
+    blogs_by_category: Dict[str, int] = {}
+
+class DashboardStatsResponse(DashboardStats):
+    refreshed_at: datetime
+    age_seconds: float
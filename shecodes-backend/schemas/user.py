@@ -74,6 +74,27 @@ class UserResponse(UserBase):
     participations: List[ParticipantResponse] = [] 
     model_config = ConfigDict(from_attributes=True)
     
+class UserListItem(BaseModel):
+    """
+    A user in the admin list. Unlike `UserResponse` it has no participation history,
+    only an optional `participation_count`.
+    """
+    id: str
+    email: str
+    name: str
+    role: RoleEnum
+    is_verified: bool
+    occupation: Optional[str] = None
+    profile_picture: Optional[str] = None
+    created_at: datetime
+    participation_count: Optional[int] = None
+    model_config = ConfigDict(from_attributes=True)
+
+class UserPage(BaseModel):
+    """A page of the admin user list; pass `next_cursor` back to get the next page."""
+    items: List[UserListItem]
+    next_cursor: Optional[str] = None
+
 class PasswordChange(BaseModel):
     current_password: str
     new_password: str = Field(..., min_length=8)
\ No newline at end of file